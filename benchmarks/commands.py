@@ -0,0 +1,205 @@
+"""Command round trips against the LD2450 emulator.
+
+Runs the library's command path (config sessions, the command queue, ack
+correlation, write retries and reconnects) against the in-process
+emulator, over a clean link and over degraded ones, and reports per
+scenario:
+
+- ms: wall time of the scenario, including any waits for a reconnect,
+- writes: commands the emulator received,
+- connects: connections the emulator accepted,
+- ok: whether the sensor and the library ended with the expected config.
+
+A scenario that raises or ends with the wrong config makes the script exit
+non-zero. Needs bleak and bleak-retry-connector installed, but no adapter
+or sensor:
+
+    python benchmarks/commands.py [scenario ...]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib.util
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+LIBRARY = Path(__file__).resolve().parent.parent / "custom_components/ld2450_ble/ld2450_ble"
+# Longest wait for the library to reconnect after the link dropped
+RECONNECT_TIMEOUT = 5.0
+
+
+def _load_library() -> Any:
+    """Import the embedded library without the Home Assistant integration.
+
+    The integration directory cannot go on sys.path: its select.py would
+    shadow the stdlib module.
+    """
+    spec = importlib.util.spec_from_file_location(
+        "ld2450_ble", LIBRARY / "__init__.py", submodule_search_locations=[str(LIBRARY)]
+    )
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["ld2450_ble"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+ld2450_ble = _load_library()
+
+from bleak.backends.device import BLEDevice  # noqa: E402
+
+from ld2450_ble import Area, Rect  # noqa: E402
+from ld2450_ble.testing import LD2450Emulator  # noqa: E402
+
+AREA = Area(1, (Rect(-1000, 500, 1000, 3000), Rect(), Rect()))
+
+
+def _ble_device() -> BLEDevice:
+    try:
+        return BLEDevice("00:00:00:00:00:00", "LD2450 bench", None)
+    except TypeError:
+        # Older bleak releases still take the rssi
+        return BLEDevice("00:00:00:00:00:00", "LD2450 bench", None, -60)
+
+
+async def _reconnected(device: Any, emulator: LD2450Emulator, connects: int) -> None:
+    """Wait until the library connected again and read the config back."""
+    async with asyncio.timeout(RECONNECT_TIMEOUT):
+        while emulator.connects <= connects or emulator.config_mode:
+            await asyncio.sleep(0.01)
+    await device.initialise()
+
+
+async def scenario_clean(device: Any, emulator: LD2450Emulator) -> None:
+    """Set the area and the target mode over a perfect link."""
+    await device.set_area(AREA)
+    await device._set_target_mode(1)
+
+
+async def scenario_latency(device: Any, emulator: LD2450Emulator) -> None:
+    """The same with every ack arriving 50 ms late."""
+    emulator.latency = 0.05
+    await scenario_clean(device, emulator)
+
+
+async def scenario_fragmented(device: Any, emulator: LD2450Emulator) -> None:
+    """The same with notifications split in chunks of up to 4 bytes."""
+    emulator.fragment = 4
+    await scenario_clean(device, emulator)
+
+
+async def scenario_session(device: Any, emulator: LD2450Emulator) -> None:
+    """Queries and sets batched in one config session."""
+    async with device.config_session():
+        await device.set_area(AREA)
+        await device._set_target_mode(1)
+        await device._get_fw_ver()
+        await device._get_mac()
+
+
+async def scenario_write_error(device: Any, emulator: LD2450Emulator) -> None:
+    """A failed write, retried over a new connection."""
+    emulator.fail_writes(1)
+    await scenario_clean(device, emulator)
+
+
+async def scenario_dropped(device: Any, emulator: LD2450Emulator) -> None:
+    """The link drops and the library reconnects on its own."""
+    connects = emulator.connects
+    emulator.drop_connection()
+    await _reconnected(device, emulator, connects)
+    await scenario_clean(device, emulator)
+
+
+async def scenario_out_of_range(device: Any, emulator: LD2450Emulator) -> None:
+    """The link drops and the next two connection attempts fail."""
+    connects = emulator.connects
+    emulator.fail_connects(2)
+    emulator.drop_connection()
+    await _reconnected(device, emulator, connects)
+    await scenario_clean(device, emulator)
+
+
+async def scenario_reboot(device: Any, emulator: LD2450Emulator) -> None:
+    """Reboot the sensor and set it up again once it is back."""
+    connects = emulator.connects
+    await device._reboot()
+    await _reconnected(device, emulator, connects)
+    await scenario_clean(device, emulator)
+
+
+SCENARIOS: dict[str, Callable[[Any, LD2450Emulator], Awaitable[None]]] = {
+    "clean": scenario_clean,
+    "latency": scenario_latency,
+    "fragmented": scenario_fragmented,
+    "session": scenario_session,
+    "write_error": scenario_write_error,
+    "dropped": scenario_dropped,
+    "out_of_range": scenario_out_of_range,
+    "reboot": scenario_reboot,
+}
+
+
+async def run(name: str) -> dict[str, Any]:
+    emulator = LD2450Emulator(rate=0)
+    device = ld2450_ble.LD2450BLE(_ble_device(), client_factory=emulator.connect)
+    await device.initialise()
+    emulator.commands.clear()
+    connects = emulator.connects
+    start = time.perf_counter()
+    try:
+        await SCENARIOS[name](device, emulator)
+        error = None
+    except Exception as ex:  # pylint: disable=broad-except
+        error = f"{type(ex).__name__}: {ex}"
+    elapsed = time.perf_counter() - start
+    ok = (
+        error is None
+        and emulator.area == AREA
+        and emulator.target_mode == 1
+        and not emulator.config_mode
+        and device.area == AREA
+        and device.target_mode == 1
+    )
+    await device.stop()
+    return {
+        "ms": elapsed * 1000,
+        "writes": len(emulator.commands),
+        "connects": emulator.connects - connects,
+        "ok": ok,
+        "error": error,
+    }
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenarios", nargs="*", help=", ".join(SCENARIOS))
+    args = parser.parse_args()
+    for name in args.scenarios:
+        if name not in SCENARIOS:
+            parser.error(f"unknown scenario {name}")
+
+    failed = 0
+    columns = ("ms", "writes", "connects", "ok")
+    print(f"{'scenario':<14}" + "".join(f"{column:>10}" for column in columns))
+    for name in args.scenarios or SCENARIOS:
+        result = await run(name)
+        print(
+            f"{name:<14}"
+            f"{result['ms']:>10,.1f}"
+            f"{result['writes']:>10}"
+            f"{result['connects']:>10}"
+            f"{'yes' if result['ok'] else 'NO':>10}"
+        )
+        if result["error"] is not None:
+            print(f"{'':<14}{result['error']}")
+        failed += not result["ok"]
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,235 @@
+"""Microbenchmarks for the LD2450 notification decode path.
+
+Drives LD2450BLE._notification_handler through the emulator with synthetic
+notification streams and reports, per scenario:
+
+- frames/s and ns/frame, best of --repeat timed runs,
+- peak KiB: tracemalloc high-water mark above the baseline during one run,
+  the most memory decoding held at once,
+- retained/frame: memory blocks still allocated after the run divided by
+  the frames, which should stay ~0 (anything else is a leak),
+- peak buffer: the largest decoder buffer seen, in bytes.
+
+Needs bleak and bleak-retry-connector installed, but no adapter or sensor:
+
+    python benchmarks/decode.py [--frames N] [--repeat N] [scenario ...]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import importlib.util
+import random
+import struct
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+LIBRARY = Path(__file__).resolve().parent.parent / "custom_components/ld2450_ble/ld2450_ble"
+
+
+def _load_library() -> Any:
+    """Import the embedded library without the Home Assistant integration.
+
+    The integration directory cannot go on sys.path: its select.py would
+    shadow the stdlib module.
+    """
+    spec = importlib.util.spec_from_file_location(
+        "ld2450_ble", LIBRARY / "__init__.py", submodule_search_locations=[str(LIBRARY)]
+    )
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["ld2450_ble"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+ld2450_ble = _load_library()
+
+from bleak.backends.device import BLEDevice  # noqa: E402
+
+from ld2450_ble.protocol import FRAME_TYPE_ACK, FrameDecoder, build_ack  # noqa: E402
+from ld2450_ble.testing import EmulatedClient, LD2450Emulator  # noqa: E402
+
+TARGET_HEADER = b"\xaa\xff\x03\x00"
+TARGET_FOOTER = b"\x55\xcc"
+BURST_SIZE = 20
+
+
+def _ble_device() -> BLEDevice:
+    try:
+        return BLEDevice("00:00:00:00:00:00", "LD2450 bench", None)
+    except TypeError:
+        # Older bleak releases still take the rssi
+        return BLEDevice("00:00:00:00:00:00", "LD2450 bench", None, -60)
+
+
+def _word(value: int) -> int:
+    """Encode a value the way the sensor does: bit 15 set means positive."""
+    return value | 0x8000 if value >= 0 else -value
+
+
+def target_frame(rng: random.Random) -> bytes:
+    values = []
+    for _ in range(3):
+        values += (
+            _word(rng.randint(-3000, 3000)),
+            _word(rng.randint(1, 6000)),
+            _word(rng.randint(-100, 100)),
+            360,
+        )
+    return TARGET_HEADER + struct.pack("<12H", *values) + TARGET_FOOTER
+
+
+def scenario_idle(frames: int, rng: random.Random) -> list[bytes]:
+    """The same empty-room frame over and over, one per notification."""
+    frame = TARGET_HEADER + struct.pack("<12H", *(0,) * 12) + TARGET_FOOTER
+    return [frame] * frames
+
+
+def scenario_single(frames: int, rng: random.Random) -> list[bytes]:
+    """One moving frame per notification."""
+    return [target_frame(rng) for _ in range(frames)]
+
+
+def scenario_split(frames: int, rng: random.Random) -> list[bytes]:
+    """Every frame split in two notifications, cycling through all offsets."""
+    chunks = []
+    for index in range(frames):
+        frame = target_frame(rng)
+        offset = 1 + index % (len(frame) - 1)
+        chunks += (frame[:offset], frame[offset:])
+    return chunks
+
+
+def scenario_burst(frames: int, rng: random.Random) -> list[bytes]:
+    """Bursts of frames merged into one notification."""
+    return [
+        b"".join(target_frame(rng) for _ in range(min(BURST_SIZE, frames - start)))
+        for start in range(0, frames, BURST_SIZE)
+    ]
+
+
+def scenario_acks(frames: int, rng: random.Random) -> list[bytes]:
+    """Unsolicited acks between the frames of a notification."""
+    ack = build_ack(0x91, b"\x02\x00")
+    return [target_frame(rng) + ack + target_frame(rng) for _ in range(frames // 2)]
+
+
+def scenario_garbage(frames: int, rng: random.Random) -> list[bytes]:
+    """Random bytes, including false headers, around every frame."""
+    chunks = []
+    for _ in range(frames):
+        noise = rng.randbytes(rng.randint(0, 40))
+        if rng.random() < 0.2:
+            noise += TARGET_HEADER
+        chunks.append(noise + target_frame(rng))
+    return chunks
+
+
+SCENARIOS: dict[str, Callable[[int, random.Random], list[bytes]]] = {
+    "idle": scenario_idle,
+    "single": scenario_single,
+    "split": scenario_split,
+    "burst": scenario_burst,
+    "acks": scenario_acks,
+    "garbage": scenario_garbage,
+}
+
+
+async def _device() -> tuple[Any, EmulatedClient]:
+    # No frames of its own, the scenarios feed the handler
+    emulator = LD2450Emulator(rate=0)
+    device = ld2450_ble.LD2450BLE(_ble_device(), client_factory=emulator.connect)
+    await device.initialise()
+    # One no-op subscriber, like the coordinator
+    device.subscribe(lambda event: None)
+    assert emulator.client is not None
+    return device, emulator.client
+
+
+def _count_frames(chunks: list[bytes]) -> int:
+    decoder = FrameDecoder()
+    return sum(
+        frame_type != FRAME_TYPE_ACK
+        for chunk in chunks
+        for frame_type, _ in decoder.feed(chunk)
+    )
+
+
+async def run(name: str, frames: int, repeat: int, seed: int) -> dict[str, float]:
+    chunks = SCENARIOS[name](frames, random.Random(seed))
+    decoded = _count_frames(chunks)
+    best = float("inf")
+    for _ in range(repeat):
+        device, client = await _device()
+        handler = client.callback
+        assert handler is not None
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter_ns()
+        for chunk in chunks:
+            handler(0, chunk)
+        elapsed = time.perf_counter_ns() - start
+        gc.enable()
+        best = min(best, elapsed)
+        await device.stop()
+
+    device, client = await _device()
+    handler = client.callback
+    assert handler is not None
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    blocks = sys.getallocatedblocks()
+    for chunk in chunks:
+        handler(0, chunk)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    gc.collect()
+    retained = sys.getallocatedblocks() - blocks
+    peak_buffer = device._decoder.peak_buffer_size
+    await device.stop()
+
+    return {
+        "frames": decoded,
+        "frames/s": decoded / best * 1e9,
+        "ns/frame": best / decoded,
+        "peak KiB": (peak - baseline) / 1024,
+        "retained/frame": retained / decoded,
+        "peak buffer": peak_buffer,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenarios", nargs="*", help=", ".join(SCENARIOS))
+    parser.add_argument("--frames", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=2450)
+    args = parser.parse_args()
+    for name in args.scenarios:
+        if name not in SCENARIOS:
+            parser.error(f"unknown scenario {name}")
+
+    columns = ("frames", "frames/s", "ns/frame", "peak KiB", "retained/frame", "peak buffer")
+    print(f"{'scenario':<10}" + "".join(f"{column:>16}" for column in columns))
+    for name in args.scenarios or SCENARIOS:
+        result = await run(name, args.frames, args.repeat, args.seed)
+        print(
+            f"{name:<10}"
+            f"{result['frames']:>16}"
+            f"{result['frames/s']:>16,.0f}"
+            f"{result['ns/frame']:>16,.0f}"
+            f"{result['peak KiB']:>16.1f}"
+            f"{result['retained/frame']:>16.3f}"
+            f"{result['peak buffer']:>16}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
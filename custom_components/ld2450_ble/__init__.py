@@ -1,13 +1,15 @@
 """The LD2405 BLE integration."""
 
+import contextlib
 import logging
+import os
 
 from bleak_retry_connector import (
     BleakError,
     close_stale_connections_by_address,
     get_device,
 )
-from .ld2450_ble import LD2450BLE
+from .ld2450_ble import LD2450BLE, CommandFailedError, CommandTimeoutError, Tracker
 
 from homeassistant.components import bluetooth
 from homeassistant.components.bluetooth.match import ADDRESS, BluetoothCallbackMatcher
@@ -15,15 +17,33 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS, EVENT_HOMEASSISTANT_STOP, Platform
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .const import CONF_HEATMAP, CONF_TRACKING, DOMAIN
 from .coordinator import LD2450BLECoordinator
+from .heatmap import LD2450BLEHeatmap
 from .models import LD2450BLEData
+from .services import async_setup_services
+from .websocket_api import async_setup as async_setup_websocket_api
+from .window import LD2450BLEWindowAggregator
+from .zones import CONF_ZONES, LD2450BLEZoneTracker, zones_from_options
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.SWITCH, Platform.BINARY_SENSOR, Platform.SELECT, Platform.BUTTON, Platform.NUMBER]
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the LD2450 BLE integration."""
+    async_setup_websocket_api(hass)
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up LD2450 BLE from a config entry."""
     address: str = entry.data[CONF_ADDRESS]
@@ -39,12 +59,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
 
     ld2450_ble = LD2450BLE(ble_device)
+    if entry.options.get(CONF_TRACKING, False):
+        ld2450_ble.set_tracker(Tracker())
 
     coordinator = LD2450BLECoordinator(hass, ld2450_ble)
 
     try:
         await ld2450_ble.initialise()
-    except BleakError as exc:
+    except (BleakError, CommandFailedError, CommandTimeoutError) as exc:
+        # A command can fail on a live link; don't leave it connected
+        await ld2450_ble.stop()
         raise ConfigEntryNotReady(
             f"Could not initialise LD2450 device with address {address}"
         ) from exc
@@ -68,8 +92,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
     )
 
+    heatmap = None
+    if entry.options.get(CONF_HEATMAP, False):
+        heatmap = LD2450BLEHeatmap(hass, ld2450_ble, _heatmap_path(hass, address))
+        await heatmap.async_start()
+
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = LD2450BLEData(
-        entry.title, ld2450_ble, coordinator
+        entry.title,
+        ld2450_ble,
+        coordinator,
+        LD2450BLEWindowAggregator(hass, ld2450_ble),
+        LD2450BLEZoneTracker(
+            ld2450_ble, zones_from_options(entry.options.get(CONF_ZONES, []))
+        ),
+        heatmap,
     )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -85,10 +121,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+def _heatmap_path(hass: HomeAssistant, address: str) -> str:
+    """Return where the heatmap of a device is kept."""
+    return hass.config.path(
+        STORAGE_DIR, f"{DOMAIN}_heatmap_{address.replace(':', '').lower()}.npy"
+    )
+
+
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
     data: LD2450BLEData = hass.data[DOMAIN][entry.entry_id]
-    if entry.title != data.title:
+    zones = zones_from_options(entry.options.get(CONF_ZONES, []))
+    tracking = entry.options.get(CONF_TRACKING, False)
+    if (
+        entry.title != data.title
+        or zones != data.zones.zones
+        or tracking != (data.device.tracker is not None)
+        or entry.options.get(CONF_HEATMAP, False) != (data.heatmap is not None)
+    ):
         await hass.config_entries.async_reload(entry.entry_id)
 
 
@@ -96,6 +146,23 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         data: LD2450BLEData = hass.data[DOMAIN].pop(entry.entry_id)
+        data.window.async_stop()
+        data.zones.async_stop()
+        if data.heatmap is not None:
+            await data.heatmap.async_stop()
+        await data.coordinator.async_shutdown()
         await data.device.stop()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the heatmap of a removed device."""
+    path = _heatmap_path(hass, entry.data[CONF_ADDRESS])
+    await hass.async_add_executor_job(_remove_file, path)
+
+
+def _remove_file(path: str) -> None:
+    """Remove a file that may not exist."""
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(path)
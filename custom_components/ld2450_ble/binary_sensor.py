@@ -1,5 +1,7 @@
 """LD2450 BLE integration sensor platform."""
 
+from collections.abc import Callable
+from dataclasses import dataclass
 import logging
 
 from homeassistant.components.binary_sensor import (
@@ -17,62 +19,68 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import EntityCategory
 
 from . import LD2450BLE, LD2450BLECoordinator
+from .ld2450_ble import FrameAnalytics
 from .const import DOMAIN
 from .models import LD2450BLEData
+from .zones import LD2450BLEZoneTracker, Zone
 
 _LOGGER = logging.getLogger(__name__)
 
 
-ANY_PRESENCE = BinarySensorEntityDescription(
+TARGET_NAMES = ("one", "two", "three")
+
+
+@dataclass(frozen=True, kw_only=True)
+class LD2450BLEBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """Describes a binary sensor computed from the targets of a frame."""
+
+    value_fn: Callable[[FrameAnalytics], bool]
+
+
+ANY_PRESENCE = LD2450BLEBinarySensorEntityDescription(
     key="any_presence",
     translation_key="any_presence",
     device_class=BinarySensorDeviceClass.OCCUPANCY,
     entity_registry_enabled_default=True,
     entity_registry_visible_default=True,
+    value_fn=lambda analytics: analytics.mask & 0b001 == 0b001,
 )
-ONE_TARGET = BinarySensorEntityDescription(
+ONE_TARGET = LD2450BLEBinarySensorEntityDescription(
     key="one_target",
     translation_key="one_target",
     device_class=BinarySensorDeviceClass.OCCUPANCY,
     entity_registry_enabled_default=True,
     entity_registry_visible_default=True,
+    value_fn=lambda analytics: analytics.mask & 0b011 == 0b001,
 )
-TWO_TARGET = BinarySensorEntityDescription(
+TWO_TARGET = LD2450BLEBinarySensorEntityDescription(
     key="two_target",
     translation_key="two_target",
     device_class=BinarySensorDeviceClass.OCCUPANCY,
     entity_registry_enabled_default=True,
     entity_registry_visible_default=True,
+    value_fn=lambda analytics: analytics.mask & 0b110 == 0b010,
 )
-THREE_TARGET = BinarySensorEntityDescription(
+THREE_TARGET = LD2450BLEBinarySensorEntityDescription(
     key="three_target",
     translation_key="three_target",
     device_class=BinarySensorDeviceClass.OCCUPANCY,
     entity_registry_enabled_default=True,
     entity_registry_visible_default=True,
+    value_fn=lambda analytics: analytics.mask & 0b100 == 0b100,
 )
 
-ONE_MOVING = BinarySensorEntityDescription(
-    key="one_moving",
-    translation_key="one_moving",
-    device_class=BinarySensorDeviceClass.MOVING,
-    entity_registry_enabled_default=True,
-    entity_registry_visible_default=True,
-)
-TWO_MOVING = BinarySensorEntityDescription(
-    key="two_moving",
-    translation_key="two_moving",
-    device_class=BinarySensorDeviceClass.MOVING,
-    entity_registry_enabled_default=True,
-    entity_registry_visible_default=True,
-)
-THREE_MOVING = BinarySensorEntityDescription(
-    key="three_moving",
-    translation_key="three_moving",
-    device_class=BinarySensorDeviceClass.MOVING,
-    entity_registry_enabled_default=True,
-    entity_registry_visible_default=True,
-)
+MOVING_DESCRIPTIONS = [
+    LD2450BLEBinarySensorEntityDescription(
+        key=f"{name}_moving",
+        translation_key=f"{name}_moving",
+        device_class=BinarySensorDeviceClass.MOVING,
+        entity_registry_enabled_default=True,
+        entity_registry_visible_default=True,
+        value_fn=lambda analytics, index=index: analytics.moving[index],
+    )
+    for index, name in enumerate(TARGET_NAMES)
+]
 
 SENSOR_DESCRIPTIONS = (
     [
@@ -81,9 +89,7 @@ SENSOR_DESCRIPTIONS = (
         TWO_TARGET,
         THREE_TARGET,
         
-        ONE_MOVING,
-        TWO_MOVING,
-        THREE_MOVING,
+        *MOVING_DESCRIPTIONS,
     ]
 )
 async def async_setup_entry(
@@ -102,22 +108,29 @@ async def async_setup_entry(
         )
         for description in SENSOR_DESCRIPTIONS
     )
+    async_add_entities(
+        LD2450BLEZoneBinary(data.coordinator, data.device, entry.title, data.zones, index)
+        for index in range(len(data.zones.zones))
+    )
 
 
 class LD2450BLEBinary(CoordinatorEntity[LD2450BLECoordinator], BinarySensorEntity):
     """Generic sensor for LD2450BLE."""
 
     _attr_has_entity_name = True
+    entity_description: LD2450BLEBinarySensorEntityDescription
 
     def __init__(
         self,
         coordinator: LD2450BLECoordinator,
         device: LD2450BLE,
         name: str,
-        description: BinarySensorEntityDescription,
+        description: LD2450BLEBinarySensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        # Presence edges come from their own listener, the context only
+        # asks for the updates that change the availability
+        super().__init__(coordinator, frozenset())
         self._coordinator = coordinator
         self._device = device
         self._key = description.key
@@ -147,48 +160,21 @@ class LD2450BLEBinary(CoordinatorEntity[LD2450BLECoordinator], BinarySensorEntit
     #    """Return the entity category of the switch."""
     #    return EntityCategory.SENSOR
         
+    async def async_added_to_hass(self) -> None:
+        """Also listen for presence edges, which skip the update rate."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._coordinator.async_add_presence_listener(
+                self._handle_coordinator_update
+            )
+        )
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        match self._key:
-            case "any_presence":
-                if ( getattr(self._device, "target_one_y") > 0 ):
-                    self._attr_native_value = True
-                else:
-                    self._attr_native_value = False
-            case "one_target":
-                if ( getattr(self._device, "target_one_y") > 0 and getattr(self._device, "target_two_y") == 0):
-                    self._attr_native_value = True
-                else:
-                    self._attr_native_value = False
-            case "two_target":
-                if ( getattr(self._device, "target_two_y") > 0 and getattr(self._device, "target_three_y") == 0):
-                    self._attr_native_value = True
-                else:
-                    self._attr_native_value = False
-            case "three_target":
-                if ( getattr(self._device, "target_three_y") > 0 ):
-                    self._attr_native_value = True
-                else:
-                    self._attr_native_value = False
-            case "one_moving":
-                if ( getattr(self._device, "target_one_speed") > 0 ):
-                    self._attr_native_value = True
-                else:
-                    self._attr_native_value = False
-            case "two_moving":
-                if ( getattr(self._device, "target_two_speed") > 0 ):
-                    self._attr_native_value = True
-                else:
-                    self._attr_native_value = False
-            case "three_moving":
-                if ( getattr(self._device, "target_three_speed") > 0 ):
-                    self._attr_native_value = True
-                else:
-                    self._attr_native_value = False
-            case _:
-                _LOGGER.error("Wronk KEY for binary sensor: %s", self._key)
-
+        self._attr_native_value = self.entity_description.value_fn(
+            self._coordinator.presence
+        )
         self.async_write_ha_state()
 
     @property
@@ -199,4 +185,58 @@ class LD2450BLEBinary(CoordinatorEntity[LD2450BLECoordinator], BinarySensorEntit
     @property
     def is_on(self):
         """Return if multitarget mode is on."""
-        return self._attr_native_value
\ No newline at end of file
+        return self._attr_native_value
+
+
+class LD2450BLEZoneBinary(CoordinatorEntity[LD2450BLECoordinator], BinarySensorEntity):
+    """Occupancy of a user defined zone, with the number of targets in it."""
+
+    _attr_has_entity_name = True
+    _attr_device_class = BinarySensorDeviceClass.OCCUPANCY
+
+    def __init__(
+        self,
+        coordinator: LD2450BLECoordinator,
+        device: LD2450BLE,
+        name: str,
+        zones: LD2450BLEZoneTracker,
+        index: int,
+    ) -> None:
+        """Initialize the sensor."""
+        # Zone changes come from the zone tracker, the context only asks
+        # for the updates that change the availability
+        super().__init__(coordinator, frozenset())
+        zone: Zone = zones.zones[index]
+        self._coordinator = coordinator
+        self._zones = zones
+        self._index = index
+        self._attr_name = zone.name
+        self._attr_unique_id = f"{device.name}_zone_{zone.zone_id}"
+        self._attr_device_info = DeviceInfo(
+            name=name,
+            connections={(dr.CONNECTION_BLUETOOTH, device.address)},
+            manufacturer="HiLink",
+            model="LD2450",
+            sw_version=getattr(device, "fw_ver"),
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Also listen for targets entering or leaving the zone."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._zones.async_add_listener(self._index, self._handle_coordinator_update)
+        )
+        self._handle_coordinator_update()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        count = self._zones.counts[self._index]
+        self._attr_is_on = count > 0
+        self._attr_extra_state_attributes = {"targets": count}
+        self.async_write_ha_state()
+
+    @property
+    def available(self) -> bool:
+        """Unavailable if coordinator isn't connected."""
+        return self._coordinator.connected and super().available
@@ -6,6 +6,7 @@ from homeassistant.components.button import ButtonEntity, ButtonDeviceClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfLength
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -13,6 +14,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import EntityCategory
 
 from . import LD2450BLE, LD2450BLECoordinator
+from .ld2450_ble import BLEAK_EXCEPTIONS, CommandFailedError, CommandTimeoutError
 from .const import DOMAIN
 from .models import LD2450BLEData
 
@@ -45,7 +47,8 @@ class LD2450BLEButton(CoordinatorEntity[LD2450BLECoordinator], ButtonEntity):
         name: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        # Nothing to show but the availability
+        super().__init__(coordinator, frozenset())
         self._coordinator = coordinator
         self._device = device
         self._attr_unique_id = f"{device.name}_reboot"
@@ -88,5 +91,8 @@ class LD2450BLEButton(CoordinatorEntity[LD2450BLECoordinator], ButtonEntity):
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        await self._device._reboot()        
+        try:
+            await self._device._reboot()
+        except (*BLEAK_EXCEPTIONS, CommandFailedError, CommandTimeoutError) as err:
+            raise HomeAssistantError(f"Failed to reboot: {err}") from err
        
\ No newline at end of file
@@ -6,7 +6,12 @@ import logging
 from typing import Any
 
 from bluetooth_data_tools import human_readable_name
-from .ld2450_ble import BLEAK_EXCEPTIONS, LD2450BLE
+from .ld2450_ble import (
+    BLEAK_EXCEPTIONS,
+    LD2450BLE,
+    CommandFailedError,
+    CommandTimeoutError,
+)
 import voluptuous as vol
 
 from homeassistant.components.bluetooth import (
@@ -15,8 +20,11 @@ from homeassistant.components.bluetooth import (
 )
 from homeassistant import config_entries
 from homeassistant.const import CONF_ADDRESS
+from homeassistant.core import callback
+from homeassistant.helpers.selector import BooleanSelector, ObjectSelector
 
-from .const import DOMAIN, LOCAL_NAMES
+from .const import CONF_HEATMAP, CONF_TRACKING, DOMAIN, LOCAL_NAMES
+from .zones import CONF_ZONES, validate_zones
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,6 +39,14 @@ class Ld2450BleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._discovery_info: BluetoothServiceInfoBleak | None = None
         self._discovered_devices: dict[str, BluetoothServiceInfoBleak] = {}
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> LD2450BleOptionsFlow:
+        """Return the options flow."""
+        return LD2450BleOptionsFlow()
+
     async def async_step_bluetooth(
         self, discovery_info: BluetoothServiceInfoBleak
     ) -> config_entries.ConfigFlowResult:
@@ -62,10 +78,12 @@ class Ld2450BleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             ld2450_ble = LD2450BLE(discovery_info.device)
             try:
                 await ld2450_ble.initialise()
-            except BLEAK_EXCEPTIONS:
+            except (*BLEAK_EXCEPTIONS, CommandFailedError, CommandTimeoutError):
+                await ld2450_ble.stop()
                 errors["base"] = "cannot_connect"
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected error")
+                await ld2450_ble.stop()
                 errors["base"] = "unknown"
             else:
                 await ld2450_ble.stop()
@@ -110,3 +128,49 @@ class Ld2450BleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             data_schema=data_schema,
             errors=errors,
         )
+
+
+class LD2450BleOptionsFlow(config_entries.OptionsFlow):
+    """Handle the zones, tracking and heatmap of an LD2450 BLE."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.ConfigFlowResult:
+        """Edit the zones, whether targets are tracked and the heatmap."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            try:
+                zones = validate_zones(user_input.get(CONF_ZONES, []))
+            except vol.Invalid:
+                errors[CONF_ZONES] = "invalid_zones"
+            else:
+                return self.async_create_entry(
+                    data={
+                        **self.config_entry.options,
+                        CONF_TRACKING: user_input[CONF_TRACKING],
+                        CONF_HEATMAP: user_input[CONF_HEATMAP],
+                        CONF_ZONES: zones,
+                    }
+                )
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_TRACKING,
+                        default=self.config_entry.options.get(CONF_TRACKING, False),
+                    ): BooleanSelector(),
+                    vol.Required(
+                        CONF_HEATMAP,
+                        default=self.config_entry.options.get(CONF_HEATMAP, False),
+                    ): BooleanSelector(),
+                    vol.Optional(
+                        CONF_ZONES,
+                        default=self.config_entry.options.get(CONF_ZONES, []),
+                    ): ObjectSelector(),
+                }
+            ),
+            errors=errors,
+        )
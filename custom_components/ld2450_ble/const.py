@@ -3,3 +3,9 @@
 DOMAIN = "ld2450_ble"
 
 LOCAL_NAMES = {"HLK-LD2450"}
+
+# Option: give each person a stable target slot and smooth positions
+CONF_TRACKING = "tracking"
+
+# Option: keep an occupancy heatmap on disk
+CONF_HEATMAP = "heatmap"
@@ -1,10 +1,24 @@
 """Data coordinator for receiving LD2450B updates."""
 
+from collections import Counter
+from dataclasses import dataclass, replace
 from datetime import datetime
 import logging
-import time
 
-from .ld2450_ble import LD2450BLE, LD2450BLEState, LD2450BLEConfig
+from .ld2450_ble import (
+    AGGREGATE_MEDIAN,
+    BLEAK_EXCEPTIONS,
+    LD2450BLE,
+    Area,
+    CommandFailedError,
+    CommandTimeoutError,
+    ConfigChanged,
+    FrameAnalytics,
+    LD2450BLEConfig,
+    RateLimit,
+    StateChanged,
+    Target,
+)
 
 from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
@@ -14,11 +28,59 @@ from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
-NEVER_TIME = -86400.0
-DEBOUNCE_SECONDS = 1.0
+# Entities get at most one target update per second: the median of the
+# frames received since the previous one
+UPDATE_RATE = RateLimit(max_hz=1.0, aggregate=AGGREGATE_MEDIAN)
+# Presence and movement changes skip the rate and are pushed on the frame
+# they happen in; these are the target fields they derive from
+PRESENCE_FIELDS = ("y", "speed")
+# Area edits from the sliders are written once they paused this long
+AREA_WRITE_DELAY = 1.0
 
 
-class LD2450BLECoordinator(DataUpdateCoordinator[None]):
+# Change keys: entities pass the ones they show as their coordinator context
+# and are only updated when one of them changed
+TARGET_KEYS = ("target_0", "target_1", "target_2")
+TARGET_MODE_KEY = "target_mode"
+AREA_MODE_KEY = "area_mode"
+AREA_RECT_KEYS = ("area_rect_0", "area_rect_1", "area_rect_2")
+
+
+@dataclass(frozen=True, slots=True)
+class LD2450BLESnapshot:
+    """What the entities show: rate limited targets and the config."""
+
+    analytics: FrameAnalytics
+    config: LD2450BLEConfig
+
+    @property
+    def targets(self) -> tuple[Target, Target, Target]:
+        return self.analytics.targets
+
+
+def _config_keys(
+    old: LD2450BLEConfig, new: LD2450BLEConfig, fields: frozenset[str]
+) -> set[str]:
+    """Return the change keys of a config update."""
+    keys = set(fields)
+    if "area" in fields:
+        keys.discard("area")
+        if old.area.mode != new.area.mode:
+            keys.add(AREA_MODE_KEY)
+        keys.update(
+            key
+            for key, before, after in zip(AREA_RECT_KEYS, old.area.rects, new.area.rects)
+            if before != after
+        )
+    return keys
+
+
+def _presence_of(analytics: FrameAnalytics) -> tuple[int, tuple[bool, bool, bool]]:
+    """Return what the binary sensors are computed from: occupied and moving slots."""
+    return analytics.mask, analytics.moving
+
+
+class LD2450BLECoordinator(DataUpdateCoordinator[LD2450BLESnapshot]):
     """Data coordinator for receiving LD2450 updates."""
 
     def __init__(self, hass: HomeAssistant, ld2450_ble: LD2450BLE) -> None:
@@ -29,46 +91,157 @@ class LD2450BLECoordinator(DataUpdateCoordinator[None]):
             name=DOMAIN,
         )
         self._ld2450_ble = ld2450_ble
-        ld2450_ble.register_callback(self._async_handle_update)
+        ld2450_ble.subscribe(self._async_handle_update, rate=UPDATE_RATE)
+        ld2450_ble.register_connected_callback(self._async_handle_connect)
         ld2450_ble.register_disconnected_callback(self._async_handle_disconnect)
         self.connected = False
-        self._last_update_time = NEVER_TIME
-        self._debounce_cancel: CALLBACK_TYPE | None = None
-        self._debounced_update_job = HassJob(
-            self._async_handle_debounced_update,
-            f"LD2450 {ld2450_ble.address} BLE debounced update",
+        self.data = LD2450BLESnapshot(
+            FrameAnalytics(ld2450_ble.targets), ld2450_ble.config
         )
+        # Keys changed by the latest update, None when everything may have
+        self.changed: frozenset[str] | None = None
+        # Entity state writes skipped by deadbands and minimum intervals, by key
+        self.skipped_writes: Counter[str] = Counter()
+        # The frame of the latest presence or movement edge
+        self.presence = FrameAnalytics(ld2450_ble.targets)
+        self._presence = _presence_of(self.presence)
+        self._presence_listeners: list[CALLBACK_TYPE] = []
+        ld2450_ble.subscribe(self._async_handle_presence, fields=PRESENCE_FIELDS)
+        # Area edited but not written yet
+        self.pending_area: Area | None = None
+        # Area being written, until the sensor acked it
+        self._writing_area: Area | None = None
+        self._area_write_cancel: CALLBACK_TYPE | None = None
+        self._area_write_job = HassJob(
+            self._async_write_pending_area, "LD2450 pending area write"
+        )
+
+    @property
+    def area(self) -> Area:
+        """Return the area including edits that are not written or acked yet."""
+        return self.pending_area or self._writing_area or self.data.config.area
 
     @callback
-    def _async_handle_debounced_update(self, _now: datetime) -> None:
-        """Handle debounced update."""
-        self._debounce_cancel = None
-        self._last_update_time = time.monotonic()
-        self.async_set_updated_data(None)
+    def async_request_area(self, area: Area) -> None:
+        """Write an area once the edits paused, merged with further edits.
+
+        Every edit restarts the delay, so dragging a slider ends in a single
+        write of the final area.
+        """
+        self.pending_area = area
+        self._cancel_area_write()
+        self._area_write_cancel = async_call_later(
+            self.hass, AREA_WRITE_DELAY, self._area_write_job
+        )
+
+    async def async_set_area(self, area: Area) -> None:
+        """Write an area now, replacing any edit that is not written yet."""
+        self._cancel_area_write()
+        self.pending_area = None
+        await self._async_write_area(area)
 
     @callback
-    def _async_handle_update(self, state: [LD2450BLEState, LD2450BLEConfig]) -> None:
-        """Just trigger the callbacks."""
+    def _cancel_area_write(self) -> None:
+        if self._area_write_cancel is not None:
+            self._area_write_cancel()
+            self._area_write_cancel = None
+
+    async def _async_write_pending_area(self, _now: datetime) -> None:
+        """Write the edited area; the entities follow from the ack."""
+        self._area_write_cancel = None
+        area, self.pending_area = self.pending_area, None
+        if area is None:
+            return
+        try:
+            await self._async_write_area(area)
+        except (*BLEAK_EXCEPTIONS, CommandFailedError, CommandTimeoutError) as err:
+            _LOGGER.error("Failed to set the area: %s", err)
+            # Put the area entities back to what the sensor has
+            self.changed = frozenset((AREA_MODE_KEY, *AREA_RECT_KEYS))
+            self.async_update_listeners()
+
+    async def _async_write_area(self, area: Area) -> None:
+        """Write an area, keeping it as the current one until it is acked.
+
+        Edits made meanwhile start from the area being written, not from
+        the config the sensor reported before it.
+        """
+        self._writing_area = area
+        try:
+            await self._ld2450_ble.set_area(area)
+        finally:
+            # A later write may have started meanwhile
+            if self._writing_area is area:
+                self._writing_area = None
+
+    async def async_shutdown(self) -> None:
+        """Drop unwritten area edits and stop."""
+        self._cancel_area_write()
+        self.pending_area = None
+        await super().async_shutdown()
+
+    @callback
+    def _async_handle_update(self, event: StateChanged | ConfigChanged) -> None:
+        """Publish a new snapshot to the entities showing what changed."""
+        snapshot = self.data
+        if isinstance(event, StateChanged):
+            keys = {TARGET_KEYS[index] for index, _ in event.changed}
+            snapshot = replace(snapshot, analytics=FrameAnalytics(event.targets))
+        else:
+            keys = _config_keys(snapshot.config, event.config, event.changed)
+            snapshot = replace(snapshot, config=event.config)
+        # Coming back from a disconnect changes the availability of every entity
+        self.changed = frozenset(keys) if self.connected else None
         self.connected = True
-        previous_last_updated_time = self._last_update_time
-        self._last_update_time = time.monotonic()
-        if self._last_update_time - previous_last_updated_time >= DEBOUNCE_SECONDS:
-            self.async_set_updated_data(None)
+        self.async_set_updated_data(snapshot)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners whose context holds a changed key.
+
+        Entities without a context get every update.
+        """
+        changed = self.changed
+        for update_callback, context in list(self._listeners.values()):
+            if changed is None or context is None or not changed.isdisjoint(context):
+                update_callback()
+
+    @callback
+    def async_add_presence_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for presence and movement edges, returning a remove callback."""
+        self._presence_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._presence_listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_handle_presence(self, event: StateChanged | ConfigChanged) -> None:
+        """Push presence and movement edges to their listeners at once."""
+        if not isinstance(event, StateChanged):
+            return
+        analytics = FrameAnalytics(event.targets)
+        presence = _presence_of(analytics)
+        if presence == self._presence:
             return
-        if self._debounce_cancel is None:
-            self._debounce_cancel = async_call_later(
-                self.hass, DEBOUNCE_SECONDS, self._debounced_update_job
-            )
+        self._presence = presence
+        self.presence = analytics
+        self.connected = True
+        for update_callback in list(self._presence_listeners):
+            update_callback()
+
+    @callback
+    def _async_handle_connect(self) -> None:
+        """Make the entities available again, even if nothing changed."""
+        self.connected = True
+        self.changed = None
+        self.async_update_listeners()
 
     @callback
     def _async_handle_disconnect(self) -> None:
         """Trigger the callbacks for disconnected."""
         self.connected = False
+        self.changed = None
         self.async_update_listeners()
-
-    async def async_shutdown(self) -> None:
-        """Shutdown the coordinator."""
-        if self._debounce_cancel is not None:
-            self._debounce_cancel()
-            self._debounce_cancel = None
-        await super().async_shutdown()
@@ -0,0 +1,32 @@
+"""Diagnostics support for LD2450 BLE."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .models import LD2450BLEData
+
+TO_REDACT = {"mac_addr"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data: LD2450BLEData = hass.data[DOMAIN][entry.entry_id]
+    device = data.device
+    coordinator = data.coordinator
+    return {
+        "config": async_redact_data(asdict(device.config), TO_REDACT),
+        "connected": coordinator.connected,
+        "dropped_bytes": device.dropped_bytes,
+        "command_latency": device.command_latency,
+        "skipped_writes": dict(coordinator.skipped_writes),
+        "tracking": device.tracker is not None,
+    }
@@ -0,0 +1,186 @@
+"""Occupancy heatmap of every decoded LD2450 frame, persisted across restarts."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import logging
+import math
+import os
+import time
+
+import numpy as np
+
+from .ld2450_ble import LD2450BLE, POLICY_DROP_OLDEST, FrameStream
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .zones import CELL_SIZE, COLUMNS, FIELD_MIN_X, ROWS
+
+_LOGGER = logging.getLogger(__name__)
+
+CELLS = ROWS * COLUMNS
+
+# Dwell seconds are kept with exponential decay over these time constants,
+# and without decay for the total
+WINDOW_HOUR = "hour"
+WINDOW_DAY = "day"
+WINDOW_WEEK = "week"
+WINDOW_TOTAL = "total"
+WINDOWS: dict[str, float | None] = {
+    WINDOW_HOUR: 3600.0,
+    WINDOW_DAY: 86400.0,
+    WINDOW_WEEK: 604800.0,
+    WINDOW_TOTAL: None,
+}
+
+# Batched frames are added to the grid this often
+FLUSH_INTERVAL = timedelta(seconds=60)
+# A gap between frames longer than this does not count as dwell time
+MAX_DWELL = 1.0
+# Stored values are scaled by a growing gain instead of decaying every
+# cell on every update; past this exponent they are rescaled
+MAX_GAIN_EXPONENT = 30.0
+FRAME_QUEUE_SIZE = 128
+
+
+class LD2450BLEHeatmap:
+    """Dwell time per 50 mm cell of the field of view, for several windows.
+
+    The grid is a memory mapped file with one row per window: the scaled
+    dwell seconds of every cell followed by the time the scale refers to.
+    A stored value ``s`` stands for ``s * exp(-(now - ref) / tau)``, so
+    adding a batch touches only the cells it hits and nothing has to be
+    rewritten on restart.
+    """
+
+    def __init__(self, hass: HomeAssistant, device: LD2450BLE, path: str) -> None:
+        """Initialise the heatmap."""
+        self.hass = hass
+        self._device = device
+        self._path = path
+        self._grid: np.memmap | None = None
+        self._lock = asyncio.Lock()
+        self._cells: list[int] = []
+        self._weights: list[float] = []
+        self._stream: FrameStream | None = None
+        self._cancel_interval: CALLBACK_TYPE | None = None
+
+    async def async_start(self) -> None:
+        """Open the grid and start accumulating frames."""
+        self._grid = await self.hass.async_add_executor_job(self._open)
+        self._stream = self._device.frames(FRAME_QUEUE_SIZE, POLICY_DROP_OLDEST)
+        self.hass.async_create_background_task(
+            self._consume(self._stream), f"LD2450 {self._device.address} heatmap"
+        )
+        self._cancel_interval = async_track_time_interval(
+            self.hass, self._async_flush, FLUSH_INTERVAL
+        )
+
+    async def async_stop(self) -> None:
+        """Stop accumulating and write what is still batched."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        if self._cancel_interval is not None:
+            self._cancel_interval()
+            self._cancel_interval = None
+        await self.async_flush()
+        self._grid = None
+
+    def _open(self) -> np.memmap:
+        """Map the grid file, creating it when missing or of another layout."""
+        shape = (len(WINDOWS), CELLS + 1)
+        if os.path.exists(self._path):
+            try:
+                grid = np.lib.format.open_memmap(self._path, mode="r+")
+            except (OSError, ValueError) as err:
+                _LOGGER.warning("Discarding unreadable heatmap %s: %s", self._path, err)
+            else:
+                if grid.shape == shape and grid.dtype == np.float64:
+                    return grid
+                _LOGGER.warning("Discarding heatmap %s of another layout", self._path)
+                del grid
+        grid = np.lib.format.open_memmap(
+            self._path, mode="w+", dtype=np.float64, shape=shape
+        )
+        grid[:, CELLS] = time.time()
+        grid.flush()
+        return grid
+
+    async def _consume(self, stream: FrameStream) -> None:
+        """Batch the cell and dwell time of every target of every frame."""
+        previous: float | None = None
+        async for frame in stream:
+            dwell = 0.0 if previous is None else min(frame.timestamp - previous, MAX_DWELL)
+            previous = frame.timestamp
+            for target in frame.targets:
+                if not target.valid:
+                    continue
+                column = (target.x - FIELD_MIN_X) // CELL_SIZE
+                row = target.y // CELL_SIZE
+                if 0 <= column < COLUMNS and row < ROWS:
+                    self._cells.append(row * COLUMNS + column)
+                    self._weights.append(dwell)
+        if stream.dropped:
+            _LOGGER.debug("Heatmap missed %s frames", stream.dropped)
+
+    @callback
+    def _async_flush(self, _now: datetime) -> None:
+        """Add the batched frames on the flush interval."""
+        self.hass.async_create_background_task(
+            self.async_flush(), f"LD2450 {self._device.address} heatmap flush"
+        )
+
+    async def async_flush(self) -> None:
+        """Add the batched frames to the grid and write it out."""
+        async with self._lock:
+            cells, self._cells = self._cells, []
+            weights, self._weights = self._weights, []
+            if self._grid is not None and cells:
+                await self.hass.async_add_executor_job(
+                    self._add, cells, weights, time.time()
+                )
+
+    def _add(self, cells: list[int], weights: list[float], now: float) -> None:
+        """Add dwell seconds to cells, one vectorised pass per window."""
+        grid = self._grid
+        assert grid is not None  # nosec
+        dwell = np.bincount(cells, weights=weights, minlength=CELLS)
+        hit = np.flatnonzero(dwell)
+        for layer, tau in enumerate(WINDOWS.values()):
+            if tau is None:
+                grid[layer, hit] += dwell[hit]
+                continue
+            exponent = (now - grid[layer, CELLS]) / tau
+            if exponent > MAX_GAIN_EXPONENT:
+                grid[layer, :CELLS] *= math.exp(-exponent)
+                grid[layer, CELLS] = now
+                exponent = 0.0
+            grid[layer, hit] += dwell[hit] * math.exp(exponent)
+        grid.flush()
+
+    async def async_export(self, window: str, resolution: int) -> np.ndarray:
+        """Return the dwell seconds of a window, rows of ``resolution`` mm cells.
+
+        Row 0 is nearest to the sensor and column 0 leftmost.
+        """
+        await self.async_flush()
+        async with self._lock:
+            return await self.hass.async_add_executor_job(
+                self._export, window, resolution, time.time()
+            )
+
+    def _export(self, window: str, resolution: int, now: float) -> np.ndarray:
+        grid = self._grid
+        if grid is None:
+            raise RuntimeError("Heatmap is not running")
+        layer = list(WINDOWS).index(window)
+        values = np.array(grid[layer, :CELLS]).reshape(ROWS, COLUMNS)
+        if (tau := WINDOWS[window]) is not None:
+            values *= math.exp(-(now - grid[layer, CELLS]) / tau)
+        factor = resolution // CELL_SIZE
+        return values.reshape(ROWS // factor, factor, COLUMNS // factor, factor).sum(
+            axis=(1, 3)
+        )
@@ -5,14 +5,74 @@ __version__ = "0.0.1"
 
 from bleak_retry_connector import get_device
 
-from .exceptions import CharacteristicMissingError
+from .analytics import FrameAnalytics
+from .capture import CaptureHeader, CaptureReader, CaptureRecord, CaptureWriter
+from .exceptions import (
+    CaptureFormatError,
+    CharacteristicMissingError,
+    CommandFailedError,
+    CommandTimeoutError,
+    FrameStreamOverflowError,
+)
 from .ld2450_ble import BLEAK_EXCEPTIONS, LD2450BLE, LD2450BLEState, LD2450BLEConfig
+from .models import (
+    AREA_COUNT,
+    TARGET_COUNT,
+    TARGET_FIELDS,
+    Area,
+    ConfigChanged,
+    Frame,
+    Rect,
+    StateChanged,
+    Target,
+)
+from .rate import (
+    AGGREGATE_LAST,
+    AGGREGATE_MEAN,
+    AGGREGATE_MEDIAN,
+    RateLimit,
+)
+from .stream import (
+    POLICY_BLOCK,
+    POLICY_DROP_OLDEST,
+    POLICY_LATEST_ONLY,
+    FrameStream,
+)
+from .tracker import Tracker, TrackerConfig
 
 __all__ = [
     "BLEAK_EXCEPTIONS",
+    "CaptureFormatError",
+    "CaptureHeader",
+    "CaptureReader",
+    "CaptureRecord",
+    "CaptureWriter",
     "CharacteristicMissingError",
+    "CommandFailedError",
+    "CommandTimeoutError",
+    "FrameStreamOverflowError",
     "LD2450BLE",
     "LD2450BLEState",
     "LD2450BLEConfig",
+    "AREA_COUNT",
+    "Area",
+    "Rect",
+    "RateLimit",
+    "AGGREGATE_LAST",
+    "AGGREGATE_MEAN",
+    "AGGREGATE_MEDIAN",
+    "TARGET_COUNT",
+    "Tracker",
+    "TrackerConfig",
+    "TARGET_FIELDS",
+    "ConfigChanged",
+    "Frame",
+    "FrameAnalytics",
+    "FrameStream",
+    "POLICY_BLOCK",
+    "POLICY_DROP_OLDEST",
+    "POLICY_LATEST_ONLY",
+    "StateChanged",
+    "Target",
     "get_device",
 ]
\ No newline at end of file
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import math
+from functools import cached_property
+
+from .models import Target
+
+
+class FrameAnalytics:
+    """Values derived from a frame, shared by everything showing that frame.
+
+    Each value is computed for all three targets on first access and then
+    cached, so values nobody reads are never computed.
+    """
+
+    def __init__(self, targets: tuple[Target, Target, Target]) -> None:
+        """Init the analytics of a frame."""
+        self.targets = targets
+
+    @cached_property
+    def distance(self) -> tuple[int, int, int]:
+        """Return the distance of each target from the sensor in mm."""
+        one, two, three = self.targets
+        return (
+            int(math.hypot(one.x, one.y)),
+            int(math.hypot(two.x, two.y)),
+            int(math.hypot(three.x, three.y)),
+        )
+
+    @cached_property
+    def angle(self) -> tuple[int, int, int]:
+        """Return the angle of each target from the sensor axis in degrees."""
+        one, two, three = self.targets
+        return (
+            int(math.degrees(math.atan2(one.x, one.y))),
+            int(math.degrees(math.atan2(two.x, two.y))),
+            int(math.degrees(math.atan2(three.x, three.y))),
+        )
+
+    @cached_property
+    def valid(self) -> tuple[bool, bool, bool]:
+        """Return which slots hold a target."""
+        one, two, three = self.targets
+        return (one.valid, two.valid, three.valid)
+
+    @cached_property
+    def mask(self) -> int:
+        """Return the occupied slots as bits, slot one is bit 0."""
+        one, two, three = self.targets
+        return one.valid | two.valid << 1 | three.valid << 2
+
+    @cached_property
+    def count(self) -> int:
+        """Return the number of targets."""
+        return sum(self.valid)
+
+    @cached_property
+    def moving(self) -> tuple[bool, bool, bool]:
+        """Return which targets are moving."""
+        one, two, three = self.targets
+        return (one.speed > 0, two.speed > 0, three.speed > 0)
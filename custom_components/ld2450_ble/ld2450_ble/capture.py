@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import asyncio
+import mmap
+import os
+import struct
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import BinaryIO
+
+from .exceptions import CaptureFormatError
+
+CAPTURE_MAGIC = b"LD2450CP"
+CAPTURE_VERSION = 1
+
+# magic, format version, target mode, firmware version (NUL padded ascii)
+_HEADER = struct.Struct("<8sHB32s")
+# sequence number, ns since the capture started, payload length
+_RECORD = struct.Struct("<IQH")
+# Records are kept in memory until this many bytes are waiting, then
+# written from the executor
+FLUSH_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class CaptureHeader:
+    """What the sensor was configured as when the capture started."""
+
+    fw_ver: str = ""
+    target_mode: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class CaptureRecord:
+    """One notification as received from the sensor.
+
+    ``payload`` is a view into the mapped file and is only valid until the
+    reader is closed; copy it with ``bytes()`` to keep it longer.
+    """
+
+    seq: int
+    timestamp_ns: int
+    payload: memoryview
+
+
+class CaptureWriter:
+    """Append raw notification payloads to a capture file.
+
+    ``write`` only appends to an in-memory buffer, so it is cheap enough to
+    call from the notification handler. Once ``FLUSH_SIZE`` bytes are
+    waiting they are written from the executor of the running loop, so a
+    slow disk never stalls decoding; without a running loop they are
+    written right away. ``close`` writes whatever is left.
+    """
+
+    def __init__(self, path: str, fw_ver: str = "", target_mode: int = 0) -> None:
+        """Create the file and write the header."""
+        self._file: BinaryIO = open(path, "wb")  # noqa: SIM115
+        self._file.write(
+            _HEADER.pack(
+                CAPTURE_MAGIC, CAPTURE_VERSION, target_mode, fw_ver.encode("ascii")
+            )
+        )
+        self._start = time.monotonic_ns()
+        self._pending = bytearray()
+        # Taken from the executor while writing, and by close
+        self._lock = threading.Lock()
+        self._flushing: bytearray | None = None
+        self._error: BaseException | None = None
+        self.records = 0
+
+    def write(self, payload: bytes | bytearray | memoryview) -> None:
+        """Append one notification payload."""
+        pending = self._pending
+        pending += _RECORD.pack(
+            self.records, time.monotonic_ns() - self._start, len(payload)
+        )
+        pending += payload
+        self.records += 1
+        if len(pending) >= FLUSH_SIZE and self._flushing is None:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Hand the buffered records to the executor."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._file.write(self._pending)
+            self._pending.clear()
+            return
+        self._flushing, self._pending = self._pending, bytearray()
+        loop.run_in_executor(None, self._write_flushing).add_done_callback(
+            self._flushed
+        )
+
+    def _write_flushing(self) -> None:
+        """Write the records handed to the executor, unless close did."""
+        with self._lock:
+            if self._flushing is not None and not self._file.closed:
+                self._file.write(self._flushing)
+            self._flushing = None
+
+    def _flushed(self, future: asyncio.Future[None]) -> None:
+        if (error := future.exception()) is not None:
+            self._error = error
+            return
+        if len(self._pending) >= FLUSH_SIZE and self._flushing is None:
+            self._flush()
+
+    def close(self) -> None:
+        """Write the buffered records and close the file.
+
+        Raises the error of a failed background write, if any.
+        """
+        with self._lock:
+            if not self._file.closed:
+                if self._flushing is not None:
+                    self._file.write(self._flushing)
+                    self._flushing = None
+                self._file.write(self._pending)
+                self._pending.clear()
+                self._file.close()
+        if (error := self._error) is not None:
+            self._error = None
+            raise error
+
+    def __enter__(self) -> CaptureWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class CaptureReader:
+    """Read a capture file through a read-only memory map without copying."""
+
+    def __init__(self, path: str) -> None:
+        """Map the file and parse the header."""
+        with open(path, "rb") as file:
+            # Checked before mapping, an empty file can't be mapped at all
+            if os.fstat(file.fileno()).st_size < _HEADER.size:
+                raise CaptureFormatError(f"{path}: Too short for a capture header")
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        magic, version, target_mode, fw_ver = _HEADER.unpack_from(self._map)
+        if magic != CAPTURE_MAGIC or version != CAPTURE_VERSION:
+            self.close()
+            raise CaptureFormatError(f"{path}: Not a version {CAPTURE_VERSION} capture")
+        self.header = CaptureHeader(
+            fw_ver.rstrip(b"\0").decode("ascii"), target_mode
+        )
+
+    def __iter__(self) -> Iterator[CaptureRecord]:
+        view = self._view
+        end = len(view)
+        offset = _HEADER.size
+        unpack_from = _RECORD.unpack_from
+        record_size = _RECORD.size
+        while offset + record_size <= end:
+            seq, timestamp_ns, length = unpack_from(view, offset)
+            offset += record_size
+            if offset + length > end:
+                # Truncated by a crash while recording
+                break
+            yield CaptureRecord(seq, timestamp_ns, view[offset : offset + length])
+            offset += length
+
+    def close(self) -> None:
+        """Release the map; fails if record payloads are still referenced."""
+        self._view.release()
+        self._map.close()
+
+    def __enter__(self) -> CaptureReader:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -2,67 +2,59 @@ CHARACTERISTIC_NOTIFY = "0000fff1-0000-1000-8000-00805f9b34fb"
 CHARACTERISTIC_WRITE = "0000fff2-0000-1000-8000-00805f9b34fb"
 
 CMD_ENABLE_CONFIG = b"\xfd\xfc\xfb\xfa\x04\x00\xff\x00\x01\x00\x04\x03\x02\x01"
-ACK_ENABLE_CONFIG_REGEX = b"\xFD\xFC\xFB\xFA\x08\x00\xFF\x01" + b"(?P<ACK_ENABLE_CONFIG_RESULT>..)" + b"\x01\x00\x40\x00\x04\x03\x02\x01"
 
 CMD_DISABLE_CONFIG = b"\xfd\xfc\xfb\xfa\x02\x00\xfe\x00\x04\x03\x02\x01"
-ACK_DISABLE_CONFIG_REGEX = b"\xFD\xFC\xFB\xFA\x04\x00\xFE\x01" + b"(?P<ACK_DISABLE_CONFIG_RESULT>..)" + b"\x04\x03\x02\x01"
 
 CMD_ENABLE_SINGLE_TARGET = b"\xfd\xfc\xfb\xfa\x02\x00\x80\x00\x04\x03\x02\x01"
-ACK_SINGLE_TARGET_REGEX = b"\xFD\xFC\xFB\xFA\x04\x00\x80\x01" + b"(?P<ACK_SINGLE_TARGET_RESULT>..)" + b"\x04\x03\x02\x01"
 
 CMD_ENABLE_MULTI_TARGET = b"\xfd\xfc\xfb\xfa\x02\x00\x90\x00\x04\x03\x02\x01"
-ACK_MULTI_TARGET_REGEX = b"\xFD\xFC\xFB\xFA\x04\x00\x90\x01" + b"(?P<ACK_MULTI_TARGET_RESULT>..)" + b"\x04\x03\x02\x01"
 
 CMD_REBOOT = b"\xFD\xFC\xFB\xFA\x02\x00\xA3\x00\x04\x03\x02\x01"
-ACK_REBOOT_REGEX = b"\xFD\xFC\xFB\xFA\x04\x00\xA3\x01" + b"(?P<ACK_REBOOT_RESULT>..)" + b"\x04\x03\x02\x01"
 
 CMD_QUERY_TARGET_MODE = b"\xFD\xFC\xFB\xFA\x02\x00\x91\x00\x04\x03\x02\x01"
-ACK_TARGET_MODE_REGEX = b"\xFD\xFC\xFB\xFA\x06\x00\x91\x01" + b"(?P<ACK_TARGET_MODE_RESULT>..)" + b"(?P<ACK_TARGET_MODE_VAL>..)" + b"\x04\x03\x02\x01"
 
 CMD_GET_FW_VER = b"\xFD\xFC\xFB\xFA\x02\x00\xA0\x00\x04\x03\x02\x01"
-ACK_FW_VER_REGEX = b"\xFD\xFC\xFB\xFA\x0C\x00\xA0\x01" + b"(?P<ACK_FW_VER_RESULT>..)" + b"(?P<ACK_FW_TYPE>..)" + b"(?P<ACK_FW_VER_VAL>......)" + b"\x04\x03\x02\x01"
 
 CMD_GET_MAC = b"\xFD\xFC\xFB\xFA\x04\x00\xA5\x00\x01\x00\x04\x03\x02\x01"
-ACK_MAC_REGEX = b"\xFD\xFC\xFB\xFA\x0A\x00\xA5\x01" + b"(?P<ACK_MAC_RESULT>..)" + b"(?P<ACK_MAC_VAL>......)" + b"\x04\x03\x02\x01"
 
 CMD_AREA = b"\xFD\xFC\xFB\xFA\x02\x00\xC1\x00\x04\x03\x02\x01"
-ACK_AREA_REGEX = b"\xFD\xFC\xFB\xFA\x1E\x00\xC1\x01" + b"(?P<ACK_AREA_RESULT>..)" + b"(?P<ACK_AREA_MODE>..)" + b"(?P<ACK_AREA_ONE>........)" + b"(?P<ACK_AREA_TWO>........)" + b"(?P<ACK_AREA_THREE>........)" + b"\x04\x03\x02\x01"
 
 CMD_SET_AREA_PRE = b"\xFD\xFC\xFB\xFA\x1C\x00\xC2\x00" #+2byte mode +3*8byte area config
 CMD_SET_AREA_POST = b"\x04\x03\x02\x01"
-ACK_SET_AREA_REGEX = b"\xFD\xFC\xFB\xFA\x04\x00\xC2\x01" + b"(?P<ACK_SET_AREA_RESULT>..)" + b"\x04\x03\x02\x01"
-
-frame_start = b"\xaa\xff\x03\x00"
-frame_target_one_x = b"(?P<target_one_x>..)"
-frame_target_one_y = b"(?P<target_one_y>..)"
-frame_target_one_s = b"(?P<target_one_s>..)"
-frame_target_one_r = b"(?P<target_one_r>..)"
-
-frame_target_two_x = b"(?P<target_two_x>..)"
-frame_target_two_y = b"(?P<target_two_y>..)"
-frame_target_two_s = b"(?P<target_two_s>..)"
-frame_target_two_r = b"(?P<target_two_r>..)"
-
-frame_target_three_x = b"(?P<target_three_x>..)"
-frame_target_three_y = b"(?P<target_three_y>..)"
-frame_target_three_s = b"(?P<target_three_s>..)"
-frame_target_three_r = b"(?P<target_three_r>..)"
-
-frame_end = b"\x55\xcc"
-
-frame_regex = (
-    frame_start
-    + frame_target_one_x 
-    + frame_target_one_y
-    + frame_target_one_s
-    + frame_target_one_r
-    + frame_target_two_x 
-    + frame_target_two_y
-    + frame_target_two_s
-    + frame_target_two_r
-    + frame_target_three_x 
-    + frame_target_three_y
-    + frame_target_three_s
-    + frame_target_three_r
-    + frame_end
-)
\ No newline at end of file
+
+CMD_WORD_ENABLE_CONFIG = 0xFF
+CMD_WORD_DISABLE_CONFIG = 0xFE
+CMD_WORD_SINGLE_TARGET = 0x80
+CMD_WORD_MULTI_TARGET = 0x90
+CMD_WORD_QUERY_TARGET_MODE = 0x91
+CMD_WORD_GET_FW_VER = 0xA0
+CMD_WORD_REBOOT = 0xA3
+CMD_WORD_GET_MAC = 0xA5
+CMD_WORD_AREA = 0xC1
+CMD_WORD_SET_AREA = 0xC2
+
+ACK_FLAG = 0x01  # second byte of the command word in every ack
+
+# Ack layout per command word: (description, value of the length field)
+ACK_SPECS = {
+    CMD_WORD_ENABLE_CONFIG: ("Enable config", 0x08),
+    CMD_WORD_DISABLE_CONFIG: ("Disable config", 0x04),
+    CMD_WORD_SINGLE_TARGET: ("SET_SINGLE_TARGET", 0x04),
+    CMD_WORD_MULTI_TARGET: ("SET_MULTI_TARGET", 0x04),
+    CMD_WORD_QUERY_TARGET_MODE: ("Target mode query", 0x06),
+    CMD_WORD_GET_FW_VER: ("FW ver query", 0x0C),
+    CMD_WORD_REBOOT: ("Reboot", 0x04),
+    CMD_WORD_GET_MAC: ("MAC query", 0x0A),
+    CMD_WORD_AREA: ("Area query", 0x1E),
+    CMD_WORD_SET_AREA: ("SET_AREA", 0x04),
+}
+
+TARGET_FRAME_HEADER = b"\xaa\xff\x03\x00"
+TARGET_FRAME_FOOTER = b"\x55\xcc"
+TARGET_FRAME_LENGTH = 30  # header + 3 targets * 4 fields * 2 bytes + footer
+
+ACK_FRAME_HEADER = b"\xfd\xfc\xfb\xfa"
+ACK_FRAME_FOOTER = b"\x04\x03\x02\x01"
+ACK_MAX_DATA_LENGTH = 64  # longest known ack (area query) carries 30 bytes
+
+MAX_BUFFER_SIZE = 1024
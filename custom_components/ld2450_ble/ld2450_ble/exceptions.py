@@ -1,2 +1,18 @@
 class CharacteristicMissingError(Exception):
     """Raised when a characteristic is missing."""
+
+
+class CommandFailedError(Exception):
+    """Raised when the sensor acks a command with a failure result."""
+
+
+class CommandTimeoutError(Exception):
+    """Raised when the sensor does not ack a command in time."""
+
+
+class FrameStreamOverflowError(Exception):
+    """Raised when a lossless frame stream fell too far behind."""
+
+
+class CaptureFormatError(Exception):
+    """Raised when a file is not a valid LD2450 capture."""
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
-import re
 import sys
-from collections.abc import Callable
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable, Iterable
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from functools import partial
 from typing import Any, TypeVar
 
 from bleak.backends.device import BLEDevice
@@ -21,40 +26,69 @@ from bleak_retry_connector import (
 
 #CONSTANTS FROM CONST FILE
 from .const import (
+    ACK_FLAG,
+    ACK_SPECS,
     CHARACTERISTIC_NOTIFY,
     CHARACTERISTIC_WRITE,
     CMD_ENABLE_CONFIG,
-    ACK_ENABLE_CONFIG_REGEX,
     CMD_DISABLE_CONFIG,
-    ACK_DISABLE_CONFIG_REGEX,
     CMD_QUERY_TARGET_MODE,
-    ACK_TARGET_MODE_REGEX,
     CMD_ENABLE_SINGLE_TARGET,
-    ACK_SINGLE_TARGET_REGEX,
     CMD_ENABLE_MULTI_TARGET,
-    ACK_MULTI_TARGET_REGEX,
     CMD_GET_FW_VER,
-    ACK_FW_VER_REGEX,
     CMD_GET_MAC,
-    ACK_MAC_REGEX,
     CMD_AREA,
-    ACK_AREA_REGEX,
     CMD_SET_AREA_PRE,
     CMD_SET_AREA_POST,
-    ACK_SET_AREA_REGEX,
     CMD_REBOOT,
-    ACK_REBOOT_REGEX,
-    frame_regex
+    CMD_WORD_AREA,
+    CMD_WORD_GET_FW_VER,
+    CMD_WORD_GET_MAC,
+    CMD_WORD_QUERY_TARGET_MODE,
+    CMD_WORD_SET_AREA,
     )
-from .exceptions import CharacteristicMissingError
-from .models import LD2450BLEState, LD2450BLEConfig
+from .capture import CaptureWriter
+from .exceptions import (
+    CharacteristicMissingError,
+    CommandFailedError,
+    CommandTimeoutError,
+)
+from .models import (
+    EMPTY_FRAME,
+    TARGET_COUNT,
+    TARGET_FIELDS,
+    EMPTY_TARGET,
+    Area,
+    ConfigChanged,
+    Frame,
+    LD2450BLEConfig,
+    LD2450BLEState,
+    Rect,
+    StateChanged,
+    Target,
+    diff_targets,
+)
+from .protocol import FRAME_TYPE_TARGETS, FrameDecoder, decode_area, encode_area
+from .rate import RateLimit, RateLimiter
+from .stream import DEFAULT_MAXSIZE, POLICY_DROP_OLDEST, FrameStream
+from .tracker import Tracker
 
 BLEAK_BACKOFF_TIME = 0.25
+COMMAND_TIMEOUT = 5.0
+
+# Queued jobs run lowest value first: user set commands before background queries
+PRIORITY_SET = 0
+PRIORITY_QUERY = 1
 
 __version__ = "0.0.0"
 
 
 WrapFuncType = TypeVar("WrapFuncType", bound=Callable[..., Any])
+_T = TypeVar("_T")
+ClientFactory = Callable[
+    [Callable[[BleakClientWithServiceCache], None]],
+    Awaitable[BleakClientWithServiceCache],
+]
 
 RETRY_BACKOFF_EXCEPTIONS = (BleakDBusError,)
 
@@ -63,25 +97,102 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_ATTEMPTS = sys.maxsize
 
 
+class _Subscription:
+    """A subscriber and the slots and fields it cares about."""
+
+    __slots__ = ("callback", "state_filter", "config_filter", "limiter", "last_targets")
+
+    def __init__(
+        self,
+        callback: Callable[[StateChanged | ConfigChanged], None],
+        targets: Iterable[int] | None,
+        fields: Iterable[str] | None,
+        rate: RateLimit | None = None,
+    ) -> None:
+        self.callback = callback
+        self.limiter = None if rate is None else RateLimiter(rate)
+        # The targets last delivered, rate limited subscribers diff against them
+        self.last_targets: tuple[Target, Target, Target] = EMPTY_FRAME
+        field_set = None if fields is None else frozenset(fields)
+        self.config_filter = field_set
+        if targets is None and field_set is None:
+            self.state_filter: frozenset[tuple[int, str]] | None = None
+        else:
+            self.state_filter = frozenset(
+                (index, name)
+                for index in (range(TARGET_COUNT) if targets is None else targets)
+                for name in (TARGET_FIELDS if field_set is None else field_set)
+            )
+
+    def wants(self, event: StateChanged | ConfigChanged) -> bool:
+        """Return whether the event touches anything subscribed to."""
+        wanted = (
+            self.state_filter if isinstance(event, StateChanged) else self.config_filter
+        )
+        return wanted is None or not wanted.isdisjoint(event.changed)
+
+
+def _targets_from_values(values: tuple[int, ...]) -> tuple[Target, Target, Target]:
+    """Build the target slots of a frame from its decoded values."""
+    x1, y1, s1, r1, x2, y2, s2, r2, x3, y3, s3, r3 = values
+    # Empty slots share one instance, so an idle room allocates nothing per slot
+    return (
+        Target(x1, y1, s1, r1) if x1 or y1 or s1 or r1 else EMPTY_TARGET,
+        Target(x2, y2, s2, r2) if x2 or y2 or s2 or r2 else EMPTY_TARGET,
+        Target(x3, y3, s3, r3) if x3 or y3 or s3 or r3 else EMPTY_TARGET,
+    )
+
+
 class LD2450BLE:
     def __init__(
         self,
         ble_device: BLEDevice,
         advertisement_data: AdvertisementData | None = None,
+        client_factory: ClientFactory | None = None,
     ) -> None:
-        """Init the LD2450BLE."""
+        """Init the LD2450BLE.
+
+        ``client_factory`` replaces the BLE connection with another transport,
+        e.g. a capture replay; it is called with the disconnected callback.
+        """
         self._ble_device = ble_device
         self._advertisement_data = advertisement_data
+        self._client_factory = client_factory
+        self._capture: CaptureWriter | None = None
+        self._tracker: Tracker | None = None
         self._operation_lock = asyncio.Lock()
-        self._state = LD2450BLEState()
+        self._config_lock = asyncio.Lock()
+        self._config_session_task: asyncio.Task[Any] | None = None
+        self._command_queue: asyncio.PriorityQueue[
+            tuple[int, int, Callable[[], Awaitable[Any]], asyncio.Future[Any], Hashable | None]
+        ] = asyncio.PriorityQueue()
+        self._queued_jobs: dict[Hashable, asyncio.Future[Any]] = {}
+        self._job_sequence = itertools.count()
+        self._command_worker_task: asyncio.Task[None] | None = None
+        self._targets: tuple[Target, Target, Target] = EMPTY_FRAME
+        self._state: LD2450BLEState | None = None
         self._config = LD2450BLEConfig()
+        # The latest area asked for and not yet picked up by a write
+        self._pending_area: Area | None = None
         self._connect_lock: asyncio.Lock = asyncio.Lock()
         self._client: BleakClientWithServiceCache | None = None
         self._expected_disconnect = False
         self.loop = asyncio.get_running_loop()
-        self._callbacks: list[Callable[[LD2450BLEState, LD2450BLEConfig], None]] = []
+        self._subscriptions: tuple[_Subscription, ...] = ()
+        self._rated_subscriptions: tuple[_Subscription, ...] = ()
+        self._last_values: tuple[int, ...] | None = None
+        self._frame_streams: tuple[FrameStream, ...] = ()
         self._disconnected_callbacks: list[Callable[[], None]] = []
-        self._buf = b""
+        self._connected_callbacks: list[Callable[[], None]] = []
+        self._decoder = FrameDecoder()
+        self._ack_handlers: dict[int, Callable[[bytes], None]] = {
+            CMD_WORD_QUERY_TARGET_MODE: self._handle_target_mode_ack,
+            CMD_WORD_GET_FW_VER: self._handle_fw_ver_ack,
+            CMD_WORD_GET_MAC: self._handle_mac_ack,
+            CMD_WORD_AREA: self._handle_area_ack,
+        }
+        self._ack_waiters: dict[int, deque[tuple[asyncio.Future[bytes], float]]] = {}
+        self._command_latency: dict[int, float] = {}
 
     def set_ble_device_and_advertisement_data(
         self, ble_device: BLEDevice, advertisement_data: AdvertisementData
@@ -107,53 +218,79 @@ class LD2450BLE:
             return self._advertisement_data.rssi
         return None
 
+    @property
+    def targets(self) -> tuple[Target, Target, Target]:
+        """Return the targets of the last frame."""
+        return self._targets
+
+    def target(self, index: int) -> Target:
+        """Return a target of the last frame by slot index."""
+        return self._targets[index]
+
     @property
     def state(self) -> LD2450BLEState:
         """Return the state."""
+        if self._state is None:
+            self._state = LD2450BLEState.from_targets(self._targets)
         return self._state
+
     @property
     def config(self) -> LD2450BLEConfig:
         """Return the config."""
         return self._config
 
+    @property
+    def dropped_bytes(self) -> int:
+        """Return the number of bytes skipped by the frame decoder."""
+        return self._decoder.dropped_bytes
+
+    @property
+    def command_latency(self) -> dict[int, float]:
+        """Return the last command to ack round trip in seconds per command word."""
+        return self._command_latency
+
     @property
     def target_one_x(self) -> int:
-        return self._state.target_one_x
+        return self._targets[0].x
     @property
     def target_one_y(self) -> int:
-        return self._state.target_one_y
+        return self._targets[0].y
     @property
     def target_one_speed(self) -> int:
-        return self._state.target_one_speed
+        return self._targets[0].speed
     @property
     def target_one_resolution(self) -> int:
-        return self._state.target_one_resolution
+        return self._targets[0].resolution
 
     @property
     def target_two_x(self) -> int:
-        return self._state.target_two_x
+        return self._targets[1].x
     @property
     def target_two_y(self) -> int:
-        return self._state.target_two_y
+        return self._targets[1].y
     @property
     def target_two_speed(self) -> int:
-        return self._state.target_two_speed
+        return self._targets[1].speed
     @property
     def target_two_resolution(self) -> int:
-        return self._state.target_two_resolution
+        return self._targets[1].resolution
 
     @property
     def target_three_x(self) -> int:
-        return self._state.target_three_x
+        return self._targets[2].x
     @property
     def target_three_y(self) -> int:
-        return self._state.target_three_y
+        return self._targets[2].y
     @property
     def target_three_speed(self) -> int:
-        return self._state.target_three_speed
+        return self._targets[2].speed
     @property
     def target_three_resolution(self) -> int:
-        return self._state.target_three_resolution
+        return self._targets[2].resolution
+
+    @property
+    def area(self) -> Area:
+        return self._config.area
 
     @property
     def target_mode(self) -> int:
@@ -210,30 +347,143 @@ class LD2450BLE:
     async def stop(self) -> None:
         """Stop the LD2410BLE."""
         _LOGGER.debug("%s: Stop", self.name)
+        self._cancel_queued_jobs(BleakError(f"{self.name}: Stopped"))
+        if self._command_worker_task is not None:
+            self._command_worker_task.cancel()
+            self._command_worker_task = None
+        for stream in self._frame_streams:
+            stream.close()
+        self.stop_capture()
         await self._execute_disconnect()
 
-    def _fire_callbacks(self) -> None:
-        """Fire the callbacks."""
-        for callback in self._callbacks:
-            callback(self._state)
-            callback(self._config)
+    @property
+    def tracker(self) -> Tracker | None:
+        """Return the tracker applied to the targets, if any."""
+        return self._tracker
+
+    def set_tracker(self, tracker: Tracker | None) -> None:
+        """Track targets from now on, or stop with None.
+
+        With a tracker every consumer sees tracked targets: each person
+        keeps a slot while present and positions are smoothed. Captures
+        still record what the sensor sent.
+        """
+        self._tracker = tracker
+
+    def start_capture(self, writer: CaptureWriter) -> None:
+        """Record every notification received from now on to a capture."""
+        if self._capture is not None:
+            self._capture.close()
+        self._capture = writer
+
+    def stop_capture(self) -> CaptureWriter | None:
+        """Stop recording and close the capture, returning it if any."""
+        writer, self._capture = self._capture, None
+        if writer is not None:
+            writer.close()
+        return writer
+
+    def _fire_event(self, event: StateChanged | ConfigChanged) -> None:
+        """Fire an event at the subscribers interested in it."""
+        subscriptions = self._subscriptions
+        if isinstance(event, ConfigChanged):
+            subscriptions += self._rated_subscriptions
+        for subscription in subscriptions:
+            if subscription.wants(event):
+                subscription.callback(event)
+
+    def subscribe(
+        self,
+        callback: Callable[[StateChanged | ConfigChanged], None],
+        *,
+        targets: Iterable[int] | None = None,
+        fields: Iterable[str] | None = None,
+        rate: RateLimit | None = None,
+    ) -> Callable[[], None]:
+        """Subscribe to state and config changes.
+
+        Events are only fired when something changed. ``targets`` limits
+        state events to some slot indexes; ``fields`` limits them to some
+        target fields (x, y, speed, resolution) and config events to some
+        config fields (target_mode, fw_ver, mac_addr, area). ``rate``
+        decimates or aggregates the target updates, config events are
+        always delivered right away.
+        """
+        subscription = _Subscription(callback, targets, fields, rate)
+
+        def unsubscribe() -> None:
+            self._subscriptions = tuple(
+                sub for sub in self._subscriptions if sub is not subscription
+            )
+            self._rated_subscriptions = tuple(
+                sub for sub in self._rated_subscriptions if sub is not subscription
+            )
+
+        if rate is None:
+            self._subscriptions = (*self._subscriptions, subscription)
+        else:
+            self._rated_subscriptions = (*self._rated_subscriptions, subscription)
+        return unsubscribe
+
+    def frames(
+        self, maxsize: int = DEFAULT_MAXSIZE, policy: str = POLICY_DROP_OLDEST
+    ) -> FrameStream:
+        """Return a stream of every decoded frame, for use with ``async for``.
+
+        Each stream has its own queue of at most ``maxsize`` frames, so a slow
+        consumer only loses its own frames (counted in ``dropped``) and never
+        delays decoding. Close the stream, or use it as an async context
+        manager, to stop receiving frames.
+        """
+        stream = FrameStream(maxsize, policy, self._remove_frame_stream)
+        self._frame_streams = (*self._frame_streams, stream)
+        return stream
+
+    def _remove_frame_stream(self, stream: FrameStream) -> None:
+        self._frame_streams = tuple(
+            other for other in self._frame_streams if other is not stream
+        )
+
+    def _push_frame(self, timestamp: float) -> None:
+        """Queue the current frame on every open frame stream."""
+        frame = Frame(timestamp, self._targets)
+        for stream in self._frame_streams:
+            stream.push(frame)
 
     def register_callback(
-        self, callback: Callable[[LD2450BLEState, LD2450BLEConfig], None]
+        self,
+        callback: Callable[[tuple[Target, Target, Target] | LD2450BLEConfig], None],
     ) -> Callable[[], None]:
         """Register a callback to be called when the state changes."""
 
-        def unregister_callback() -> None:
-            self._callbacks.remove(callback)
+        def _forward(event: StateChanged | ConfigChanged) -> None:
+            if isinstance(event, StateChanged):
+                callback(event.targets)
+            else:
+                callback(event.config)
 
-        self._callbacks.append(callback)
-        return unregister_callback
+        return self.subscribe(_forward)
 
     def _fire_disconnected_callbacks(self) -> None:
         """Fire the callbacks."""
         for callback in self._disconnected_callbacks:
             callback()
 
+    def register_connected_callback(
+        self, callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Register a callback to be called on every (re)connect.
+
+        Unchanged targets and config fire no events, so this is how a
+        consumer learns the link is back when nothing else changed.
+        """
+
+        def unregister_callback() -> None:
+            self._connected_callbacks.remove(callback)
+
+        self._connected_callbacks.append(callback)
+        return unregister_callback
+
     def register_disconnected_callback(
         self, callback: Callable[[], None]
     ) -> Callable[[], None]:
@@ -248,22 +498,10 @@ class LD2450BLE:
     async def initialise(self) -> None:
         await self._ensure_connected()
 
-        _LOGGER.debug("%s: Subscribe to notifications; RSSI: %s", self.name, self.rssi)
-        if self._client is not None:
-            _LOGGER.debug(self._client)
-        
-            await self._client.start_notify(
-                CHARACTERISTIC_NOTIFY, self._notification_handler
-            )
-            
-            #get startup values from sensor
-            await self._get_target_mode()
-            await self._get_fw_ver()
-            await self._get_mac()
-            await self._get_area()
-           
-        else:
-            _LOGGER.debug("Client is unexpectedly None")
+        #get startup values from sensor
+        await self._query(
+            CMD_QUERY_TARGET_MODE, CMD_GET_FW_VER, CMD_GET_MAC, CMD_AREA
+        )
 
     async def _ensure_connected(self) -> None:
         """Ensure connection to device is established."""
@@ -280,17 +518,34 @@ class LD2450BLE:
             if self._client and self._client.is_connected:
                 return
             _LOGGER.debug("%s: Connecting; RSSI: %s", self.name, self.rssi)
-            client = await establish_connection(
-                BleakClientWithServiceCache,
-                self._ble_device,
-                self.name,
-                self._disconnected,
-                use_services_cache=True,
-                ble_device_callback=lambda: self._ble_device,
-            )
+            if self._client_factory is not None:
+                client = await self._client_factory(self._disconnected)
+            else:
+                client = await establish_connection(
+                    BleakClientWithServiceCache,
+                    self._ble_device,
+                    self.name,
+                    self._disconnected,
+                    use_services_cache=True,
+                    ble_device_callback=lambda: self._ble_device,
+                )
             _LOGGER.debug("%s: Connected; RSSI: %s", self.name, self.rssi)
 
             self._client = client
+            self._expected_disconnect = False
+
+            # Subscribe on every connect, acks would be lost otherwise
+            _LOGGER.debug("%s: Subscribe to notifications; RSSI: %s", self.name, self.rssi)
+            self._decoder.reset()
+            if self._tracker is not None:
+                self._tracker.reset()
+            await client.start_notify(
+                CHARACTERISTIC_NOTIFY, self._notification_handler
+            )
+            # The first frame after a connect is never skipped as unchanged
+            self._last_values = None
+            for callback in self._connected_callbacks:
+                callback()
 
     async def _reconnect(self) -> None:
         """Attempt a reconnect"""
@@ -305,290 +560,177 @@ class LD2450BLE:
             _LOGGER.debug("reconnecting again")
             asyncio.create_task(self._reconnect())
 
-    def intify(self, state: bytes) -> int:
-        return int.from_bytes(state, byteorder="little")
-
-    async def _notification_handler(self, _sender: int, data: bytearray) -> None:
+    def _notification_handler(self, _sender: int, data: bytearray) -> None:
         """Handle notification responses."""
-        _LOGGER.debug("%s: Notification received: %s", self.name, data.hex())
-        self._buf += data
-
-        msg = re.search(ACK_ENABLE_CONFIG_REGEX, self._buf)
-        if msg:
-            #ACK to enable config. Check if command is good
-            if ( int.from_bytes(msg.group("ACK_ENABLE_CONFIG_RESULT"),"little") > 0 ):
-                _LOGGER.error("Enable config failed")
-            else:
-                _LOGGER.debug("Enable config success")
-            msg = None
-
-        msg = re.search(ACK_DISABLE_CONFIG_REGEX, self._buf)
-        if msg:
-            #ACK to disable config. Check if command is good
-            if ( int.from_bytes(msg.group("ACK_DISABLE_CONFIG_RESULT"),"little") > 0 ):
-                _LOGGER.error("Disable config failed")
-            else:
-                _LOGGER.debug("Disable config success")
-            msg = None
-        
-        msg = re.search(ACK_REBOOT_REGEX, self._buf)
-        if msg:
-            #ACK to reboot. Check if command is good
-            if ( int.from_bytes(msg.group("ACK_REBOOT_RESULT"),"little") > 0 ):
-                _LOGGER.error("Reboot failed")
-            else:
-                _LOGGER.debug("Reboot success")
-            msg = None
-        
-        msg = re.search(ACK_TARGET_MODE_REGEX, self._buf)
-        if msg:
-            #ACK to target mode. Check if command is good
-            if ( int.from_bytes(msg.group("ACK_TARGET_MODE_RESULT"),"little") > 0 ):
-                _LOGGER.error("Target mode query failed")
-            else:
-                _LOGGER.debug("Target mode query success")
-                target_mode = msg.group("ACK_TARGET_MODE_VAL")[0]
-                self._config = LD2450BLEConfig(
-                    target_mode = target_mode,
-                    fw_ver = self._config.fw_ver,
-                    mac_addr = self._config.mac_addr,
-                    area_mode = self._config.area_mode,
-                    area_one_first_vertex_x = self._config.area_one_first_vertex_x,
-                    area_one_first_vertex_y = self._config.area_one_first_vertex_y,
-                    area_one_second_vertex_x = self._config.area_one_second_vertex_x,
-                    area_one_second_vertex_y = self._config.area_one_second_vertex_y,
-                    area_two_first_vertex_x = self._config.area_two_first_vertex_x,
-                    area_two_first_vertex_y = self._config.area_two_first_vertex_y,
-                    area_two_second_vertex_x = self._config.area_two_second_vertex_x,
-                    area_two_second_vertex_y = self._config.area_two_second_vertex_y,
-                    area_three_first_vertex_x = self._config.area_three_first_vertex_x,
-                    area_three_first_vertex_y = self._config.area_three_first_vertex_y,
-                    area_three_second_vertex_x = self._config.area_three_second_vertex_x,
-                    area_three_second_vertex_y = self._config.area_three_second_vertex_y,
-                )
-            msg = None
-        
-        msg = re.search(ACK_FW_VER_REGEX, self._buf)
-        if msg:
-            #ACK to fw ver. Check if command is good
-            if ( int.from_bytes(msg.group("ACK_FW_VER_RESULT"),"little") > 0 ):
-                _LOGGER.error("FW ver query failed")
-            else:
-                _LOGGER.debug("FW ver query success")
-                fw_ver = format(msg.group("ACK_FW_VER_VAL")[1], '1X') + "." + format(msg.group("ACK_FW_VER_VAL")[0], '02X') + "." + format(msg.group("ACK_FW_VER_VAL")[5], '02X') + format(msg.group("ACK_FW_VER_VAL")[4], '02X') + format(msg.group("ACK_FW_VER_VAL")[3], '02X') + format(msg.group("ACK_FW_VER_VAL")[2], '02X')
-                self._config = LD2450BLEConfig(
-                    target_mode = self._config.target_mode,
-                    fw_ver = fw_ver,
-                    mac_addr = self._config.mac_addr,
-                    area_mode = self._config.area_mode,
-                    area_one_first_vertex_x = self._config.area_one_first_vertex_x,
-                    area_one_first_vertex_y = self._config.area_one_first_vertex_y,
-                    area_one_second_vertex_x = self._config.area_one_second_vertex_x,
-                    area_one_second_vertex_y = self._config.area_one_second_vertex_y,
-                    area_two_first_vertex_x = self._config.area_two_first_vertex_x,
-                    area_two_first_vertex_y = self._config.area_two_first_vertex_y,
-                    area_two_second_vertex_x = self._config.area_two_second_vertex_x,
-                    area_two_second_vertex_y = self._config.area_two_second_vertex_y,
-                    area_three_first_vertex_x = self._config.area_three_first_vertex_x,
-                    area_three_first_vertex_y = self._config.area_three_first_vertex_y,
-                    area_three_second_vertex_x = self._config.area_three_second_vertex_x,
-                    area_three_second_vertex_y = self._config.area_three_second_vertex_y,
-                )
-            msg = None
- 
-        msg = re.search(ACK_MAC_REGEX, self._buf)
-        if msg:
-            #ACK to mac. Check if command is good
-            if ( int.from_bytes(msg.group("ACK_MAC_RESULT"),"little") > 0 ):
-                _LOGGER.error("MAC query failed")
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s: Notification received; RSSI: %s: %s",
+                self.name,
+                self.rssi,
+                data.hex(),
+            )
+        if self._capture is not None:
+            self._capture.write(data)
+        dropped_bytes = self._decoder.dropped_bytes
+        for frame_type, frame in self._decoder.feed(data):
+            if frame_type == FRAME_TYPE_TARGETS:
+                self._handle_targets(frame)
             else:
-                _LOGGER.debug("MAC query success")
-                mac_addr = format(msg.group("ACK_MAC_VAL")[0], '02X') + ":" + format(msg.group("ACK_MAC_VAL")[1], '02X') + ":" + format(msg.group("ACK_MAC_VAL")[2], '02X') + ":" + format(msg.group("ACK_MAC_VAL")[3], '02X') + ":" + format(msg.group("ACK_MAC_VAL")[4], '02X') + ":" + format(msg.group("ACK_MAC_VAL")[5], '02X')
-                self._config = LD2450BLEConfig(
-                    target_mode = self._config.target_mode,
-                    fw_ver = self._config.fw_ver,
-                    mac_addr = mac_addr,
-                    area_mode = self._config.area_mode,
-                    area_one_first_vertex_x = self._config.area_one_first_vertex_x,
-                    area_one_first_vertex_y = self._config.area_one_first_vertex_y,
-                    area_one_second_vertex_x = self._config.area_one_second_vertex_x,
-                    area_one_second_vertex_y = self._config.area_one_second_vertex_y,
-                    area_two_first_vertex_x = self._config.area_two_first_vertex_x,
-                    area_two_first_vertex_y = self._config.area_two_first_vertex_y,
-                    area_two_second_vertex_x = self._config.area_two_second_vertex_x,
-                    area_two_second_vertex_y = self._config.area_two_second_vertex_y,
-                    area_three_first_vertex_x = self._config.area_three_first_vertex_x,
-                    area_three_first_vertex_y = self._config.area_three_first_vertex_y,
-                    area_three_second_vertex_x = self._config.area_three_second_vertex_x,
-                    area_three_second_vertex_y = self._config.area_three_second_vertex_y,
-                )
-            msg = None
+                self._handle_ack(frame)
+        if self._decoder.dropped_bytes != dropped_bytes:
+            _LOGGER.debug(
+                "%s: Dropped %s bytes while resyncing",
+                self.name,
+                self._decoder.dropped_bytes - dropped_bytes,
+            )
 
-        msg = re.search(ACK_MULTI_TARGET_REGEX, self._buf)
-        if msg:
-            #SET_MULTI_TARGET. Check if command is good
-            if ( int.from_bytes(msg.group("ACK_MULTI_TARGET_RESULT"),"little") > 0 ):
-                _LOGGER.error("SET_MULTI_TARGET query failed")
-            else:
-                _LOGGER.debug("SET_MULTI_TARGET query success")
-                #calling update
-                await self._get_target_mode()
-            msg = None
-           
-        msg = re.search(ACK_SINGLE_TARGET_REGEX, self._buf)
-        if msg:
-            #SET_SINGLE_TARGET. Check if command is good
-            if ( int.from_bytes(msg.group("ACK_SINGLE_TARGET_RESULT"),"little") > 0 ):
-                _LOGGER.error("SET_SINGLE_TARGET query failed")
-            else:
-                _LOGGER.debug("SET_SINGLE_TARGET query success")
-                #calling update
-                await self._get_target_mode()
-            msg = None
-            
-        msg = re.search(ACK_SET_AREA_REGEX, self._buf)
-        if msg:
-            #SET_AREA. Check if command is good
-            if ( int.from_bytes(msg.group("ACK_SET_AREA_RESULT"),"little") > 0 ):
-                _LOGGER.error("SET_AREA query failed")
-            else:
-                _LOGGER.debug("SET_AREA query success")
-                #calling update
-                await self._get_area()
-            msg = None
-            
-        msg = re.search(ACK_AREA_REGEX, self._buf)
-        if msg:
-            #ACK to area query. Check if command is good
-            if ( int.from_bytes(msg.group("ACK_AREA_RESULT"),"little") > 0 ):
-                _LOGGER.error("Area query failed")
-            else:
-                _LOGGER.debug("Area query success")
-                area_mode = int.from_bytes(msg.group("ACK_AREA_MODE"),"little")
-
-                #first area
-                area_one_first_vertex_x = int.from_bytes(msg.group("ACK_AREA_ONE")[0:2],"little",signed=True)
-                area_one_first_vertex_y = int.from_bytes(msg.group("ACK_AREA_ONE")[2:4],"little",signed=True)
-                area_one_second_vertex_x = int.from_bytes(msg.group("ACK_AREA_ONE")[4:6],"little",signed=True)
-                area_one_second_vertex_y = int.from_bytes(msg.group("ACK_AREA_ONE")[6:8],"little",signed=True)
-
-                #second area
-                area_two_first_vertex_x = int.from_bytes(msg.group("ACK_AREA_TWO")[0:2],"little",signed=True)
-                area_two_first_vertex_y = int.from_bytes(msg.group("ACK_AREA_TWO")[2:4],"little",signed=True)
-                area_two_second_vertex_x = int.from_bytes(msg.group("ACK_AREA_TWO")[4:6],"little",signed=True)
-                area_two_second_vertex_y = int.from_bytes(msg.group("ACK_AREA_TWO")[6:8],"little",signed=True)
-
-                #third area
-                area_three_first_vertex_x = int.from_bytes(msg.group("ACK_AREA_THREE")[0:2],"little",signed=True)
-                area_three_first_vertex_y = int.from_bytes(msg.group("ACK_AREA_THREE")[2:4],"little",signed=True)
-                area_three_second_vertex_x = int.from_bytes(msg.group("ACK_AREA_THREE")[4:6],"little",signed=True)
-                area_three_second_vertex_y = int.from_bytes(msg.group("ACK_AREA_THREE")[6:8],"little",signed=True)
-
-                self._config = LD2450BLEConfig(
-                    target_mode = self._config.target_mode,
-                    fw_ver = self._config.fw_ver,
-                    mac_addr = self._config.mac_addr,
-                    area_mode = area_mode,
-                    area_one_first_vertex_x = area_one_first_vertex_x,
-                    area_one_first_vertex_y = area_one_first_vertex_y,
-                    area_one_second_vertex_x = area_one_second_vertex_x,
-                    area_one_second_vertex_y = area_one_second_vertex_y,
-                    area_two_first_vertex_x = area_two_first_vertex_x,
-                    area_two_first_vertex_y = area_two_first_vertex_y,
-                    area_two_second_vertex_x = area_two_second_vertex_x,
-                    area_two_second_vertex_y = area_two_second_vertex_y,
-                    area_three_first_vertex_x = area_three_first_vertex_x,
-                    area_three_first_vertex_y = area_three_first_vertex_y,
-                    area_three_second_vertex_x = area_three_second_vertex_x,
-                    area_three_second_vertex_y = area_three_second_vertex_y,
+    def _handle_ack(self, frame: bytes) -> None:
+        """Handle a complete ack frame."""
+        length = frame[4] | frame[5] << 8
+        command_word = frame[6]
+        spec = ACK_SPECS.get(command_word)
+        if spec is None or frame[7] != ACK_FLAG or length != spec[1]:
+            _LOGGER.debug("%s: Unexpected ack: %s", self.name, frame.hex())
+            return
+        description = spec[0]
+        waiter = self._pop_ack_waiter(command_word)
+        result = frame[8] | frame[9] << 8
+        if result:
+            _LOGGER.error("%s: %s failed", self.name, description)
+            if waiter is not None:
+                waiter.set_exception(
+                    CommandFailedError(
+                        f"{self.name}: {description} failed with result {result}"
+                    )
                 )
-            msg = None            
-
-        msg = re.search(frame_regex, self._buf)
-        if msg:
-            #sensor data received
-            self._buf = self._buf[msg.end() :]  # noqa: E203
-
-            target_one_x = int.from_bytes(msg.group("target_one_x"),"little")
-            if target_one_x > 2**15:
-                target_one_x = target_one_x - 2**15
-            else:
-                target_one_x = - target_one_x
-            target_one_y = int.from_bytes(msg.group("target_one_y"),"little")
-            if target_one_y > 2**15:
-                target_one_y = target_one_y - 2**15
-            else:
-                target_one_y = - target_one_y
-            target_one_speed = int.from_bytes(msg.group("target_one_s"),"little")
-            if target_one_speed > 2**15:
-                target_one_speed = target_one_speed - 2**15
-            else:
-                target_one_speed = - target_one_speed
-            target_one_resolution = int.from_bytes(msg.group("target_one_r"),"little")
-
-            target_two_x = int.from_bytes(msg.group("target_two_x"),"little")
-            if target_two_x > 2**15:
-                target_two_x = target_two_x - 2**15
-            else:
-                target_two_x = - target_two_x
-            target_two_y = int.from_bytes(msg.group("target_two_y"),"little")
-            if target_two_y > 2**15:
-                target_two_y = target_two_y - 2**15
-            else:
-                target_two_y = - target_two_y
-            target_two_speed = int.from_bytes(msg.group("target_two_s"),"little")
-            if target_two_speed > 2**15:
-                target_two_speed = target_two_speed - 2**15
-            else:
-                target_two_speed = - target_two_speed
-            target_two_resolution = int.from_bytes(msg.group("target_two_r"),"little")
-
-            target_three_x = int.from_bytes(msg.group("target_three_x"),"little")
-            if target_three_x > 2**15:
-                target_three_x = target_three_x - 2**15
-            else:
-                target_three_x = - target_three_x
-            target_three_y = int.from_bytes(msg.group("target_three_y"),"little")
-            if target_three_y > 2**15:
-                target_three_y = target_three_y - 2**15
-            else:
-                target_three_y = - target_three_y
-            target_three_speed = int.from_bytes(msg.group("target_three_s"),"little")
-            if target_three_speed > 2**15:
-                target_three_speed = target_three_speed - 2**15
-            else:
-                target_three_speed = - target_three_speed
-            target_three_resolution = int.from_bytes(msg.group("target_three_r"),"little")
-
-            self._state = LD2450BLEState(
-                target_one_x = target_one_x,
-                target_one_y = target_one_y,
-                target_one_speed = target_one_speed,
-                target_one_resolution = target_one_resolution,
-
-                target_two_x = target_two_x,
-                target_two_y = target_two_y,
-                target_two_speed = target_two_speed,
-                target_two_resolution = target_two_resolution,
-
-                target_three_x = target_three_x,
-                target_three_y = target_three_y,
-                target_three_speed = target_three_speed,
-                target_three_resolution = target_three_resolution,
+            return
+        _LOGGER.debug("%s: %s success", self.name, description)
+        payload = frame[10 : 6 + length]  # noqa: E203
+        handler = self._ack_handlers.get(command_word)
+        if handler is not None:
+            handler(payload)
+        if waiter is not None:
+            waiter.set_result(payload)
+
+    def _expect_ack(self, command_word: int) -> asyncio.Future[bytes]:
+        """Register a future resolved by the next ack for a command word."""
+        waiter: asyncio.Future[bytes] = self.loop.create_future()
+        self._ack_waiters.setdefault(command_word, deque()).append(
+            (waiter, time.monotonic())
+        )
+        return waiter
+
+    def _pop_ack_waiter(self, command_word: int) -> asyncio.Future[bytes] | None:
+        """Return the oldest pending future for a command word."""
+        waiters = self._ack_waiters.get(command_word)
+        while waiters:
+            waiter, sent_at = waiters.popleft()
+            if waiter.done():
+                continue
+            latency = time.monotonic() - sent_at
+            self._command_latency[command_word] = latency
+            _LOGGER.debug(
+                "%s: Command 0x%02X acked in %.1f ms",
+                self.name,
+                command_word,
+                latency * 1000,
             )
-            msg = None            
-            self._fire_callbacks()
+            return waiter
+        return None
 
-        _LOGGER.debug(
-            "%s: Notification received; RSSI: %s: %s %s",
-            self.name,
-            self.rssi,
-            data.hex(),
-            self._state,
+    def _discard_ack_waiter(
+        self, command_word: int, waiter: asyncio.Future[bytes]
+    ) -> None:
+        """Forget a future whose command was abandoned."""
+        waiter.cancel()
+        waiters = self._ack_waiters.get(command_word)
+        if waiters:
+            for entry in waiters:
+                if entry[0] is waiter:
+                    waiters.remove(entry)
+                    break
+
+    def _fail_ack_waiters(self, exc: Exception) -> None:
+        """Fail every pending command, e.g. on disconnect."""
+        for waiters in self._ack_waiters.values():
+            for waiter, _sent_at in waiters:
+                if not waiter.done():
+                    waiter.set_exception(exc)
+            waiters.clear()
+
+    def _update_config(self, **changes: Any) -> None:
+        """Apply changed config fields and bump the config version."""
+        config = self._config
+        changed = frozenset(
+            name for name, value in changes.items() if getattr(config, name) != value
         )
+        if not changed:
+            return
+        self._config = replace(config, version=config.version + 1, **changes)
+        self._fire_event(ConfigChanged(self._config, changed))
+
+    def _handle_target_mode_ack(self, payload: bytes) -> None:
+        """Store the target mode from a query ack."""
+        self._update_config(target_mode=payload[0])
+
+    def _handle_fw_ver_ack(self, payload: bytes) -> None:
+        """Store the firmware version from a query ack."""
+        # payload: 2 bytes firmware type, then minor, major and a 4 byte build
+        fw_ver = format(payload[3], '1X') + "." + format(payload[2], '02X') + "." + format(payload[7], '02X') + format(payload[6], '02X') + format(payload[5], '02X') + format(payload[4], '02X')
+        self._update_config(fw_ver=fw_ver)
+
+    def _handle_mac_ack(self, payload: bytes) -> None:
+        """Store the MAC address from a query ack."""
+        mac_addr = ":".join(format(octet, '02X') for octet in payload[0:6])
+        self._update_config(mac_addr=mac_addr)
+
+    def _handle_area_ack(self, payload: bytes) -> None:
+        """Store the area configuration from a query ack."""
+        self._update_config(area=decode_area(payload))
+
+    def _handle_targets(self, values: tuple[int, ...]) -> None:
+        """Handle a decoded target frame."""
+        tracker = self._tracker
+        timestamp = (
+            time.monotonic()
+            if tracker is not None or self._rated_subscriptions or self._frame_streams
+            else 0.0
+        )
+        if tracker is not None:
+            values = tracker.update(timestamp, values)
+        if self._rated_subscriptions:
+            # Rate limited subscribers count every frame, unchanged ones too
+            self._offer_rated(timestamp, values)
+        if values == self._last_values:
+            # Nothing moved, the usual case for an idle room
+            if self._frame_streams:
+                self._push_frame(timestamp)
+            return
+        self._last_values = values
+        previous = self._targets
+        self._targets = _targets_from_values(values)
+        self._state = None
+        self._fire_event(StateChanged(self._targets, diff_targets(previous, self._targets)))
+        if self._frame_streams:
+            self._push_frame(timestamp)
+
+    def _offer_rated(self, timestamp: float, values: tuple[int, ...]) -> None:
+        """Deliver a frame to the rate limited subscribers it is due for."""
+        for subscription in self._rated_subscriptions:
+            assert subscription.limiter is not None  # nosec
+            delivered = subscription.limiter.offer(timestamp, values)
+            if delivered is None:
+                continue
+            targets = _targets_from_values(delivered)
+            event = StateChanged(targets, diff_targets(subscription.last_targets, targets))
+            subscription.last_targets = targets
+            if event.changed and subscription.wants(event):
+                subscription.callback(event)
 
     def _disconnected(self, client: BleakClientWithServiceCache) -> None:
         """Disconnected callback."""
+        self._cancel_queued_jobs(BleakError(f"{self.name}: Disconnected"))
+        self._fail_ack_waiters(BleakError(f"{self.name}: Disconnected"))
         self._fire_disconnected_callbacks()
         if self._expected_disconnect:
             _LOGGER.debug(
@@ -625,8 +767,19 @@ class LD2450BLE:
                 await client.disconnect()
 
     @retry_bluetooth_connection_error(DEFAULT_ATTEMPTS)
-    async def _send_command_locked(self, commands: list[bytes]) -> None:
+    async def _send_command_locked(
+        self, commands: list[bytes], waiters: list[asyncio.Future[bytes]]
+    ) -> None:
         """Send command to device and read response."""
+        # A failed attempt disconnects, the retry needs a new connection
+        await self._ensure_connected()
+        # Expect the acks before every attempt: the disconnect of a failed
+        # one fails its waiters, and an ack can come in before we resume
+        for index, command in enumerate(commands):
+            if index == len(waiters):
+                waiters.append(self._expect_ack(command[6]))
+            elif waiters[index].done() and waiters[index].exception() is not None:
+                waiters[index] = self._expect_ack(command[6])
         try:
             await self._execute_command_locked(commands)
         except BleakDBusError as ex:
@@ -651,15 +804,34 @@ class LD2450BLE:
 
     async def _send_command(
         self, commands: list[bytes] | bytes, retry: int | None = None
-    ) -> None:
-        """Send command to device and read response."""
+    ) -> list[bytes]:
+        """Send commands to device and return the payload of each ack."""
         await self._ensure_connected()
         if not isinstance(commands, list):
             commands = [commands]
-        await self._send_command_while_connected(commands, retry)
+        waiters: list[asyncio.Future[bytes]] = []
+        try:
+            await self._send_command_while_connected(commands, waiters, retry)
+            try:
+                async with asyncio.timeout(COMMAND_TIMEOUT):
+                    return [await waiter for waiter in waiters]
+            except TimeoutError as ex:
+                raise CommandTimeoutError(
+                    f"{self.name}: No ack for {[command.hex() for command in commands]}"
+                ) from ex
+        finally:
+            for command, waiter in zip(commands, waiters):
+                if waiter.cancelled() or not waiter.done():
+                    self._discard_ack_waiter(command[6], waiter)
+                else:
+                    # Failed by a disconnect; the send error is the one raised
+                    waiter.exception()
 
     async def _send_command_while_connected(
-        self, commands: list[bytes], retry: int | None = None
+        self,
+        commands: list[bytes],
+        waiters: list[asyncio.Future[bytes]],
+        retry: int | None = None,
     ) -> None:
         """Send command to device and read response."""
         _LOGGER.debug(
@@ -675,7 +847,7 @@ class LD2450BLE:
             )
         async with self._operation_lock:
             try:
-                await self._send_command_locked(commands)
+                await self._send_command_locked(commands, waiters)
                 return
             except BleakNotFoundError:
                 _LOGGER.error(
@@ -703,57 +875,199 @@ class LD2450BLE:
     async def _execute_command_locked(self, commands: list[bytes]) -> None:
         """Execute command and read response."""
         assert self._client is not None  # nosec
+        # Pack as many commands per write as the negotiated MTU allows
+        max_size = self._client.mtu_size - 3
+        packet = b""
         for command in commands:
-            await self._client.write_gatt_char(CHARACTERISTIC_WRITE, command, False)          
+            if packet and len(packet) + len(command) > max_size:
+                await self._client.write_gatt_char(CHARACTERISTIC_WRITE, packet, False)
+                packet = b""
+            packet += command
+        if packet:
+            await self._client.write_gatt_char(CHARACTERISTIC_WRITE, packet, False)
+
+    @asynccontextmanager
+    async def config_session(self) -> AsyncIterator[None]:
+        """Keep the sensor in config mode while the block runs.
+
+        Enter config mode once, run any number of queries and sets, then
+        leave it again. Nested sessions in the same task reuse the outer one.
+        When the block fails, leaving config mode is only attempted on a
+        live link and can't replace the original error.
+        """
+        if self._config_session_task is asyncio.current_task():
+            yield
+            return
+        async with self._config_lock:
+            await self._send_command(CMD_ENABLE_CONFIG)
+            self._config_session_task = asyncio.current_task()
+            try:
+                yield
+            except BaseException:
+                self._config_session_task = None
+                if self._client and self._client.is_connected:
+                    try:
+                        await self._send_command(CMD_DISABLE_CONFIG)
+                    except Exception as ex:  # pylint: disable=broad-except
+                        _LOGGER.debug(
+                            "%s: Failed to leave config mode: %s", self.name, ex
+                        )
+                raise
+            if self._config_session_task is None:
+                # Ended by a reboot inside the block
+                return
+            self._config_session_task = None
+            await self._send_command(CMD_DISABLE_CONFIG)
+
+    async def _enqueue(
+        self,
+        priority: int,
+        job: Callable[[], Awaitable[_T]],
+        key: Hashable | None = None,
+    ) -> _T:
+        """Run a job on the command worker and return its result.
+
+        Jobs run one at a time, lowest priority value first. A job whose key
+        matches one still waiting in the queue is not queued again; the
+        caller shares the pending result instead.
+        """
+        current_task = asyncio.current_task()
+        if current_task in (self._command_worker_task, self._config_session_task):
+            # Already serialised; queueing would wait on ourselves
+            return await job()
+        if key is not None and (future := self._queued_jobs.get(key)) is not None:
+            return await asyncio.shield(future)
+        future = self.loop.create_future()
+        if key is not None:
+            self._queued_jobs[key] = future
+        self._command_queue.put_nowait(
+            (priority, next(self._job_sequence), job, future, key)
+        )
+        if self._command_worker_task is None or self._command_worker_task.done():
+            self._command_worker_task = self.loop.create_task(self._command_worker())
+        return await asyncio.shield(future)
+
+    async def _command_worker(self) -> None:
+        """Run queued jobs one at a time."""
+        while True:
+            _priority, _sequence, job, future, key = await self._command_queue.get()
+            if key is not None and self._queued_jobs.get(key) is future:
+                del self._queued_jobs[key]
+            if future.done():
+                continue
+            try:
+                result = await job()
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as ex:  # pylint: disable=broad-except
+                if not future.done():
+                    future.set_exception(ex)
+            else:
+                if not future.done():
+                    future.set_result(result)
+
+    def _cancel_queued_jobs(self, exc: Exception) -> None:
+        """Fail every job still waiting in the command queue."""
+        while not self._command_queue.empty():
+            _priority, _sequence, _job, future, _key = self._command_queue.get_nowait()
+            if not future.done():
+                future.set_exception(exc)
+        self._queued_jobs.clear()
+
+    async def _send_config_commands(self, commands: list[bytes]) -> list[bytes]:
+        """Send commands inside a config session."""
+        async with self.config_session():
+            return await self._send_command(commands)
+
+    async def _query(self, *commands: bytes) -> list[bytes]:
+        """Queue config queries, sharing identical ones that are still queued."""
+        return await self._enqueue(
+            PRIORITY_QUERY,
+            partial(self._send_config_commands, list(commands)),
+            key=commands,
+        )
+
+    async def _reboot_locked(self) -> None:
+        """Enter config mode and reboot.
+
+        Inside a config session the sensor already is in config mode and
+        the session task holds the config lock, so only the reboot is sent
+        and the session ends with it.
+        """
+        if self._config_session_task is asyncio.current_task():
+            await self._send_command(CMD_REBOOT)
+            # Rebooting ended config mode, the session has nothing to leave
+            self._config_session_task = None
+            return
+        async with self._config_lock:
+            await self._send_command(CMD_ENABLE_CONFIG)
+            # The sensor leaves config mode by itself when it restarts
+            await self._send_command(CMD_REBOOT)
 
     #sensor commands
     async def _get_target_mode(self) -> None:
         """Execute command."""
         assert self._client is not None  # nosec
-        await self._send_command(CMD_ENABLE_CONFIG)
-        await self._send_command(CMD_QUERY_TARGET_MODE)
-        await self._send_command(CMD_DISABLE_CONFIG)
-            
+        await self._query(CMD_QUERY_TARGET_MODE)
+
     async def _get_fw_ver(self) -> None:
         """Execute command."""
         assert self._client is not None  # nosec
-        await self._send_command(CMD_ENABLE_CONFIG)
-        await self._send_command(CMD_GET_FW_VER)
-        await self._send_command(CMD_DISABLE_CONFIG)
+        await self._query(CMD_GET_FW_VER)
 
     async def _get_mac(self) -> None:
         """Execute command."""
         assert self._client is not None  # nosec
-        await self._send_command(CMD_ENABLE_CONFIG)
-        await self._send_command(CMD_GET_MAC)
-        await self._send_command(CMD_DISABLE_CONFIG)
+        await self._query(CMD_GET_MAC)
 
     async def _get_area(self) -> None:
         """Execute command."""
         assert self._client is not None  # nosec
-        await self._send_command(CMD_ENABLE_CONFIG)
-        await self._send_command(CMD_AREA)
-        await self._send_command(CMD_DISABLE_CONFIG)
+        await self._query(CMD_AREA)
 
     async def _reboot(self) -> None:
         """Execute command."""
         assert self._client is not None  # nosec
-        await self._send_command(CMD_ENABLE_CONFIG)
-        await self._send_command(CMD_REBOOT)
-        await self._send_command(CMD_DISABLE_CONFIG)
+        await self._enqueue(PRIORITY_SET, self._reboot_locked)
 
     async def _set_target_mode(self, mode: int) -> None:
         """Execute command."""
         if mode in [1,2]:
             assert self._client is not None  # nosec
-            await self._send_command(CMD_ENABLE_CONFIG)
             if mode == 1:
                 #single target mode
-                await self._send_command(CMD_ENABLE_SINGLE_TARGET)
+                command = CMD_ENABLE_SINGLE_TARGET
             else:
                 #multi target mode
-                await self._send_command(CMD_ENABLE_MULTI_TARGET)
-            await self._send_command(CMD_DISABLE_CONFIG)
+                command = CMD_ENABLE_MULTI_TARGET
+            await self._enqueue(
+                PRIORITY_SET,
+                partial(self._send_config_commands, [command, CMD_QUERY_TARGET_MODE]),
+            )
+
+    async def set_area(self, area: Area) -> None:
+        """Set area mode and all three rectangles in one config session.
+
+        Calls made while an earlier write is still queued are merged into
+        it and only the latest area is written. The config takes the area
+        as soon as the sensor acks the write, without reading it back.
+        """
+        assert self._client is not None  # nosec
+        self._pending_area = area
+        await self._enqueue(
+            PRIORITY_SET, self._write_pending_area, key=CMD_WORD_SET_AREA
+        )
+
+    async def _write_pending_area(self) -> None:
+        """Write the latest requested area and apply it once acked."""
+        area = self._pending_area
+        if area is None:
+            return
+        self._pending_area = None
+        command = CMD_SET_AREA_PRE + encode_area(area) + CMD_SET_AREA_POST
+        await self._send_config_commands([command])
+        self._update_config(area=area)
 
     async def _set_area(self, area_mode: int, 
         area_one_first_vertex_x: int | 0, 
@@ -769,24 +1083,13 @@ class LD2450BLE:
         area_three_second_vertex_x: int | 0, 
         area_three_second_vertex_y: int | 0) -> None:
         """Execute command."""
-        assert self._client is not None  # nosec
-        await self._send_command(CMD_ENABLE_CONFIG)
-        await self._send_command(CMD_SET_AREA_PRE + 
-            area_mode.to_bytes(2,"little") + 
-            self._num2hex(area_one_first_vertex_x) + 
-            self._num2hex(area_one_first_vertex_y) + 
-            self._num2hex(area_one_second_vertex_x) + 
-            self._num2hex(area_one_second_vertex_y) +  
-            self._num2hex(area_two_first_vertex_x) + 
-            self._num2hex(area_two_first_vertex_y) + 
-            self._num2hex(area_two_second_vertex_x) +  
-            self._num2hex(area_two_second_vertex_y) + 
-            self._num2hex(area_three_first_vertex_x) + 
-            self._num2hex(area_three_first_vertex_y) + 
-            self._num2hex(area_three_second_vertex_x) + 
-            self._num2hex(area_three_second_vertex_y) +
-            CMD_SET_AREA_POST)
-        await self._send_command(CMD_DISABLE_CONFIG)
-            
-    def _num2hex(self, num: int) -> bytes:
-        return num.to_bytes(2, byteorder='little', signed=True)
\ No newline at end of file
+        await self.set_area(
+            Area(
+                area_mode,
+                (
+                    Rect(area_one_first_vertex_x, area_one_first_vertex_y, area_one_second_vertex_x, area_one_second_vertex_y),
+                    Rect(area_two_first_vertex_x, area_two_first_vertex_y, area_two_second_vertex_x, area_two_second_vertex_y),
+                    Rect(area_three_first_vertex_x, area_three_first_vertex_y, area_three_second_vertex_x, area_three_second_vertex_y),
+                ),
+            )
+        )
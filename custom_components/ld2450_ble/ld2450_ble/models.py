@@ -1,6 +1,66 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+
+TARGET_COUNT = 3
+TARGET_FIELDS = ("x", "y", "speed", "resolution")
+
+
+class Target:
+    """A single target slot of a frame."""
+
+    __slots__ = ("x", "y", "speed", "resolution", "valid")
+
+    def __init__(self, x: int = 0, y: int = 0, speed: int = 0, resolution: int = 0) -> None:
+        """Init the target."""
+        self.x = x
+        self.y = y
+        self.speed = speed
+        self.resolution = resolution
+        # Empty slots are all zeros, a detection is always in front of the sensor
+        self.valid = y > 0
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Target):
+            return NotImplemented
+        return (
+            self.x == other.x
+            and self.y == other.y
+            and self.speed == other.speed
+            and self.resolution == other.resolution
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y, self.speed, self.resolution))
+
+    def __repr__(self) -> str:
+        return (
+            f"Target(x={self.x}, y={self.y}, speed={self.speed}, "
+            f"resolution={self.resolution})"
+        )
+
+
+EMPTY_TARGET = Target()
+EMPTY_FRAME: tuple[Target, Target, Target] = (EMPTY_TARGET,) * TARGET_COUNT
+
+
+def diff_targets(
+    old: tuple[Target, Target, Target], new: tuple[Target, Target, Target]
+) -> frozenset[tuple[int, str]]:
+    """Return the (slot index, field) pairs that differ between two frames."""
+    changed = []
+    for index, (before, after) in enumerate(zip(old, new)):
+        if before is after:
+            continue
+        if before.x != after.x:
+            changed.append((index, "x"))
+        if before.y != after.y:
+            changed.append((index, "y"))
+        if before.speed != after.speed:
+            changed.append((index, "speed"))
+        if before.resolution != after.resolution:
+            changed.append((index, "resolution"))
+    return frozenset(changed)
 
 
 @dataclass(frozen=True)
@@ -21,25 +81,131 @@ class LD2450BLEState:
     target_three_speed: int = 0
     target_three_resolution: int = 0
 
+    @classmethod
+    def from_targets(cls, targets: tuple[Target, Target, Target]) -> LD2450BLEState:
+        """Build the flat state from a frame of targets."""
+        one, two, three = targets
+        return cls(
+            target_one_x = one.x,
+            target_one_y = one.y,
+            target_one_speed = one.speed,
+            target_one_resolution = one.resolution,
+
+            target_two_x = two.x,
+            target_two_y = two.y,
+            target_two_speed = two.speed,
+            target_two_resolution = two.resolution,
+
+            target_three_x = three.x,
+            target_three_y = three.y,
+            target_three_speed = three.speed,
+            target_three_resolution = three.resolution,
+        )
+
+AREA_COUNT = 3
+
+
+@dataclass(frozen=True)
+class Rect:
+    """An area rectangle given by two opposite vertices in mm."""
+
+    first_x: int = 0
+    first_y: int = 0
+    second_x: int = 0
+    second_y: int = 0
+
+
+EMPTY_RECT = Rect()
+
+
+@dataclass(frozen=True)
+class Area:
+    """The area filter: mode (0 disabled, 1 monitor, 2 ignore) and rectangles."""
+
+    mode: int = 0
+    rects: tuple[Rect, Rect, Rect] = (EMPTY_RECT,) * AREA_COUNT
+
+    def with_rect(self, index: int, rect: Rect) -> Area:
+        """Return a copy with one rectangle replaced."""
+        rects = list(self.rects)
+        rects[index] = rect
+        return replace(self, rects=tuple(rects))
+
+
 @dataclass(frozen=True)
 class LD2450BLEConfig:
-    
+
     target_mode: int = 0
-    
+
     fw_ver: str = ""
-    
+
     mac_addr: str = ""
-    
-    area_mode: int = 0
-    area_one_first_vertex_x: int = 0
-    area_one_first_vertex_y: int = 0
-    area_one_second_vertex_x: int = 0
-    area_one_second_vertex_y: int = 0
-    area_two_first_vertex_x: int = 0
-    area_two_first_vertex_y: int = 0
-    area_two_second_vertex_x: int = 0
-    area_two_second_vertex_y: int = 0
-    area_three_first_vertex_x: int = 0
-    area_three_first_vertex_y: int = 0
-    area_three_second_vertex_x: int = 0
-    area_three_second_vertex_y: int = 0
\ No newline at end of file
+
+    area: Area = Area()
+
+    # Bumped on every change, so consumers can skip unchanged configs cheaply
+    version: int = 0
+
+    @property
+    def area_mode(self) -> int:
+        return self.area.mode
+    @property
+    def area_one_first_vertex_x(self) -> int:
+        return self.area.rects[0].first_x
+    @property
+    def area_one_first_vertex_y(self) -> int:
+        return self.area.rects[0].first_y
+    @property
+    def area_one_second_vertex_x(self) -> int:
+        return self.area.rects[0].second_x
+    @property
+    def area_one_second_vertex_y(self) -> int:
+        return self.area.rects[0].second_y
+    @property
+    def area_two_first_vertex_x(self) -> int:
+        return self.area.rects[1].first_x
+    @property
+    def area_two_first_vertex_y(self) -> int:
+        return self.area.rects[1].first_y
+    @property
+    def area_two_second_vertex_x(self) -> int:
+        return self.area.rects[1].second_x
+    @property
+    def area_two_second_vertex_y(self) -> int:
+        return self.area.rects[1].second_y
+    @property
+    def area_three_first_vertex_x(self) -> int:
+        return self.area.rects[2].first_x
+    @property
+    def area_three_first_vertex_y(self) -> int:
+        return self.area.rects[2].first_y
+    @property
+    def area_three_second_vertex_x(self) -> int:
+        return self.area.rects[2].second_x
+    @property
+    def area_three_second_vertex_y(self) -> int:
+        return self.area.rects[2].second_y
+
+
+@dataclass(frozen=True, slots=True)
+class StateChanged:
+    """The targets differ from the previous frame."""
+
+    targets: tuple[Target, Target, Target]
+    changed: frozenset[tuple[int, str]]
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigChanged:
+    """One or more config fields were updated by an ack."""
+
+    config: LD2450BLEConfig
+    changed: frozenset[str]
+
+
+@dataclass(frozen=True, slots=True)
+class Frame:
+    """A decoded target frame and the monotonic time it was received."""
+
+    timestamp: float
+    targets: tuple[Target, Target, Target]
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import struct
+from typing import Any
+
+from .const import (
+    ACK_FLAG,
+    ACK_FRAME_FOOTER,
+    ACK_FRAME_HEADER,
+    ACK_MAX_DATA_LENGTH,
+    MAX_BUFFER_SIZE,
+    TARGET_FRAME_FOOTER,
+    TARGET_FRAME_HEADER,
+    TARGET_FRAME_LENGTH,
+)
+from .models import Area, Rect
+
+FRAME_TYPE_TARGETS = 1
+FRAME_TYPE_ACK = 2
+
+_HEADER_LENGTH = 4
+_ACK_OVERHEAD = 10  # header + length field + footer
+_TARGETS_STRUCT = struct.Struct("<12H")
+_AREA_STRUCT = struct.Struct("<H12h")
+
+
+def sign_magnitude(raw: int) -> int:
+    """Convert a sensor word (bit 15 set means positive) to an int."""
+    if raw & 0x8000:
+        return raw - 0x8000
+    return -raw
+
+
+def encode_sign_magnitude(value: int) -> int:
+    """Convert an int to a sensor word, the inverse of sign_magnitude."""
+    if value >= 0:
+        return value | 0x8000
+    return -value
+
+
+def encode_targets(values: tuple[int, ...]) -> bytes:
+    """Build a target frame from x, y, speed and resolution of three targets."""
+    return b"".join(
+        (
+            TARGET_FRAME_HEADER,
+            _TARGETS_STRUCT.pack(
+                *(
+                    value if index % 4 == 3 else encode_sign_magnitude(value)
+                    for index, value in enumerate(values)
+                )
+            ),
+            TARGET_FRAME_FOOTER,
+        )
+    )
+
+
+def decode_area(payload: bytes) -> Area:
+    """Decode the area mode and rectangles of an area query ack."""
+    (
+        mode,
+        x1, y1, x2, y2,
+        x3, y3, x4, y4,
+        x5, y5, x6, y6,
+    ) = _AREA_STRUCT.unpack_from(payload)
+    return Area(
+        mode,
+        (Rect(x1, y1, x2, y2), Rect(x3, y3, x4, y4), Rect(x5, y5, x6, y6)),
+    )
+
+
+def encode_area(area: Area) -> bytes:
+    """Encode the area mode and rectangles for a set area command."""
+    return _AREA_STRUCT.pack(
+        area.mode,
+        *(
+            value
+            for rect in area.rects
+            for value in (rect.first_x, rect.first_y, rect.second_x, rect.second_y)
+        ),
+    )
+
+
+def build_ack(command_word: int, payload: bytes = b"", result: int = 0) -> bytes:
+    """Build the ack frame the sensor sends for a command word."""
+    return b"".join(
+        (
+            ACK_FRAME_HEADER,
+            struct.pack("<HBBH", len(payload) + 4, command_word, ACK_FLAG, result),
+            payload,
+            ACK_FRAME_FOOTER,
+        )
+    )
+
+
+class FrameDecoder:
+    """Incremental decoder for the LD2450 notification stream.
+
+    Notifications can split or merge frames arbitrarily, so bytes are
+    accumulated in a buffer and every complete frame is returned as soon
+    as its last byte arrives. What is left over after decoding is bounded
+    to ``max_buffer_size`` bytes. Bytes that do not belong to a frame
+    are skipped and counted in ``dropped_bytes``.
+    """
+
+    def __init__(self, max_buffer_size: int = MAX_BUFFER_SIZE) -> None:
+        """Init the decoder."""
+        self._buf = bytearray()
+        self._max_buffer_size = max_buffer_size
+        self.dropped_bytes = 0
+        self.peak_buffer_size = 0
+
+    @property
+    def buffered(self) -> int:
+        """Return the number of bytes waiting for the rest of a frame."""
+        return len(self._buf)
+
+    def reset(self) -> None:
+        """Forget any partial frame, e.g. after a reconnect."""
+        self.dropped_bytes += len(self._buf)
+        self._buf.clear()
+
+    def feed(self, data: bytes | bytearray | memoryview) -> list[tuple[int, Any]]:
+        """Add a notification and return the frames it completed.
+
+        Target frames are returned as ``(FRAME_TYPE_TARGETS, values)`` where
+        values holds x, y, speed and resolution of the three targets; acks
+        are returned as ``(FRAME_TYPE_ACK, frame_bytes)``.
+        """
+        buf = self._buf
+        buf += data
+        size = len(buf)
+        if size > self.peak_buffer_size:
+            self.peak_buffer_size = size
+
+        frames: list[tuple[int, Any]] = []
+        pos = 0
+        target = buf.find(TARGET_FRAME_HEADER)
+        ack = buf.find(ACK_FRAME_HEADER)
+        while True:
+            # Only search again when the cached match has been consumed
+            if 0 <= target < pos:
+                target = buf.find(TARGET_FRAME_HEADER, pos)
+            if 0 <= ack < pos:
+                ack = buf.find(ACK_FRAME_HEADER, pos)
+            if target < 0 and ack < 0:
+                keep = max(pos, size - _HEADER_LENGTH + 1)
+                self.dropped_bytes += keep - pos
+                pos = keep
+                break
+
+            if ack < 0 or 0 <= target < ack:
+                start = target
+                self.dropped_bytes += start - pos
+                if size - start < TARGET_FRAME_LENGTH:
+                    pos = start
+                    break
+                if not buf.startswith(
+                    TARGET_FRAME_FOOTER, start + TARGET_FRAME_LENGTH - 2
+                ):
+                    # False header, resync on the next byte
+                    self.dropped_bytes += 1
+                    pos = start + 1
+                    continue
+                (
+                    x1, y1, s1, r1,
+                    x2, y2, s2, r2,
+                    x3, y3, s3, r3,
+                ) = _TARGETS_STRUCT.unpack_from(buf, start + _HEADER_LENGTH)
+                frames.append(
+                    (
+                        FRAME_TYPE_TARGETS,
+                        (
+                            sign_magnitude(x1), sign_magnitude(y1), sign_magnitude(s1), r1,
+                            sign_magnitude(x2), sign_magnitude(y2), sign_magnitude(s2), r2,
+                            sign_magnitude(x3), sign_magnitude(y3), sign_magnitude(s3), r3,
+                        ),
+                    )
+                )
+                pos = start + TARGET_FRAME_LENGTH
+                continue
+
+            start = ack
+            self.dropped_bytes += start - pos
+            if size - start < _HEADER_LENGTH + 2:
+                pos = start
+                break
+            length = buf[start + 4] | buf[start + 5] << 8
+            if length > ACK_MAX_DATA_LENGTH:
+                self.dropped_bytes += 1
+                pos = start + 1
+                continue
+            frame_end = start + _ACK_OVERHEAD + length
+            if size < frame_end:
+                pos = start
+                break
+            if not buf.startswith(ACK_FRAME_FOOTER, frame_end - 4):
+                self.dropped_bytes += 1
+                pos = start + 1
+                continue
+            frames.append((FRAME_TYPE_ACK, bytes(buf[start:frame_end])))
+            pos = frame_end
+
+        # Only the undecoded remainder is bounded, so a large notification
+        # never costs the complete frames at its front
+        overflow = size - pos - self._max_buffer_size
+        if overflow > 0:
+            pos += overflow
+            self.dropped_bytes += overflow
+        if pos:
+            del buf[:pos]
+        return frames
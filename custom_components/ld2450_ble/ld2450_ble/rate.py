@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from statistics import median_low
+
+from .models import TARGET_COUNT
+
+AGGREGATE_LAST = "last"
+AGGREGATE_MEAN = "mean"
+AGGREGATE_MEDIAN = "median"
+AGGREGATES = (AGGREGATE_LAST, AGGREGATE_MEAN, AGGREGATE_MEDIAN)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """How often a subscriber wants target updates.
+
+    An update is delivered once ``every_nth`` frames have arrived, at least
+    ``1 / max_hz`` seconds after the previous one, and only if a slot was
+    filled or emptied or a coordinate or speed moved by ``threshold`` or
+    more (any change when 0). ``aggregate`` picks what is delivered: the
+    last frame, or the per slot mean or median of the frames since the
+    previous due time, whether or not that one delivered. A slot counts as
+    occupied when it was in at least half of those frames.
+    """
+
+    every_nth: int = 1
+    max_hz: float | None = None
+    threshold: int = 0
+    aggregate: str = AGGREGATE_LAST
+
+    def __post_init__(self) -> None:
+        if self.every_nth < 1:
+            raise ValueError("every_nth must be at least 1")
+        if self.max_hz is not None and self.max_hz <= 0:
+            raise ValueError("max_hz must be positive")
+        if self.threshold < 0:
+            raise ValueError("threshold must not be negative")
+        if self.aggregate not in AGGREGATES:
+            raise ValueError(f"Unknown aggregate: {self.aggregate}")
+
+
+class RateLimiter:
+    """Decide, frame by frame, what a rate limited subscriber receives."""
+
+    __slots__ = ("limit", "_count", "_last_time", "_last_values", "_window", "_min_interval")
+
+    def __init__(self, limit: RateLimit) -> None:
+        """Init the limiter."""
+        self.limit = limit
+        self._count = 0
+        self._last_time = float("-inf")
+        self._last_values: tuple[int, ...] | None = None
+        # Unbounded, the window only spans one due period and is cleared
+        # at every due time
+        self._window: list[tuple[int, ...]] = []
+        self._min_interval = 0.0 if limit.max_hz is None else 1 / limit.max_hz
+
+    def offer(self, timestamp: float, values: tuple[int, ...]) -> tuple[int, ...] | None:
+        """Take a frame and return the values to deliver, if any are due."""
+        limit = self.limit
+        self._count += 1
+        if limit.aggregate != AGGREGATE_LAST:
+            self._window.append(values)
+        if self._count < limit.every_nth:
+            return None
+        if timestamp - self._last_time < self._min_interval:
+            return None
+        if limit.aggregate != AGGREGATE_LAST:
+            values = _aggregate(self._window, limit.aggregate)
+        # Every due time starts a new window, delivered or not, so an
+        # aggregate never reaches back past the previous due time
+        self._count = 0
+        self._last_time = timestamp
+        self._window.clear()
+        previous = self._last_values
+        if previous is not None and not _moved(previous, values, limit.threshold):
+            return None
+        self._last_values = values
+        return values
+
+
+def _moved(old: tuple[int, ...], new: tuple[int, ...], threshold: int) -> bool:
+    """Return whether two frames differ by at least the threshold."""
+    if threshold == 0:
+        return old != new
+    for base in range(0, TARGET_COUNT * 4, 4):
+        was = old[base + 1] > 0
+        if was != (new[base + 1] > 0):
+            return True
+        if was and (
+            abs(old[base] - new[base]) >= threshold
+            or abs(old[base + 1] - new[base + 1]) >= threshold
+            or abs(old[base + 2] - new[base + 2]) >= threshold
+        ):
+            return True
+    return False
+
+
+def _aggregate(window: list[tuple[int, ...]], how: str) -> tuple[int, ...]:
+    """Combine a window of frames slot by slot."""
+    values: list[int] = []
+    for base in range(0, TARGET_COUNT * 4, 4):
+        occupied = [frame for frame in window if frame[base + 1] > 0]
+        if len(occupied) * 2 < len(window):
+            values += (0, 0, 0, 0)
+            continue
+        for offset in range(3):
+            column = [frame[base + offset] for frame in occupied]
+            if how == AGGREGATE_MEAN:
+                values.append(round(sum(column) / len(column)))
+            else:
+                values.append(median_low(column))
+        values.append(occupied[-1][base + 3])
+    return tuple(values)
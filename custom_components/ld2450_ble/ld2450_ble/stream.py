@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from .exceptions import FrameStreamOverflowError
+from .models import Frame
+
+POLICY_DROP_OLDEST = "drop_oldest"
+POLICY_LATEST_ONLY = "latest_only"
+POLICY_BLOCK = "block"
+POLICIES = (POLICY_DROP_OLDEST, POLICY_LATEST_ONLY, POLICY_BLOCK)
+
+DEFAULT_MAXSIZE = 16
+
+
+class FrameStream:
+    """A bounded queue of frames for one consumer, iterated with ``async for``.
+
+    Frames are pushed from the notification handler, which must never wait,
+    so a full queue is resolved by the policy instead of by backpressure:
+
+    - ``drop_oldest`` discards the oldest queued frame,
+    - ``latest_only`` keeps just the newest frame,
+    - ``block`` never drops; if the consumer falls ``maxsize`` frames behind
+      the stream is closed and iteration raises ``FrameStreamOverflowError``
+      once the queued frames have been consumed.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        policy: str,
+        on_close: Callable[[FrameStream], None],
+    ) -> None:
+        """Init the stream."""
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown frame stream policy: {policy}")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.policy = policy
+        self.maxsize = 1 if policy == POLICY_LATEST_ONLY else maxsize
+        self.dropped = 0
+        self._frames: deque[Frame] = deque()
+        self._waiter: asyncio.Future[None] | None = None
+        self._on_close = on_close
+        self._closed = False
+        self._error: Exception | None = None
+
+    @property
+    def closed(self) -> bool:
+        """Return whether no more frames will be pushed."""
+        return self._closed
+
+    @property
+    def pending(self) -> int:
+        """Return the number of frames waiting to be consumed."""
+        return len(self._frames)
+
+    def push(self, frame: Frame) -> None:
+        """Queue a frame, applying the policy when the queue is full."""
+        if self._closed:
+            return
+        frames = self._frames
+        if len(frames) >= self.maxsize:
+            if self.policy == POLICY_BLOCK:
+                self.close(
+                    FrameStreamOverflowError(
+                        f"Consumer fell {self.maxsize} frames behind"
+                    )
+                )
+                return
+            frames.popleft()
+            self.dropped += 1
+        frames.append(frame)
+        self._wake()
+
+    def close(self, error: Exception | None = None) -> None:
+        """Stop the stream; queued frames can still be consumed."""
+        if self._closed:
+            return
+        self._closed = True
+        self._error = error
+        self._on_close(self)
+        self._wake()
+
+    def _wake(self) -> None:
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def __aiter__(self) -> FrameStream:
+        return self
+
+    async def __anext__(self) -> Frame:
+        while not self._frames:
+            if self._closed:
+                if self._error is not None:
+                    raise self._error
+                raise StopAsyncIteration
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        return self._frames.popleft()
+
+    async def __aenter__(self) -> FrameStream:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
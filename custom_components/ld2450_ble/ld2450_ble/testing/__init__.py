@@ -0,0 +1,22 @@
+"""Stand-ins for the sensor, for development and tests only.
+
+Not imported by the library or the integration at runtime.
+"""
+from __future__ import annotations
+
+from .emulator import EmulatedClient, LD2450Emulator
+from .replay import ReplayClient
+from .scene import PersonPath, Scene, SceneFrame, doorway, passing, sit, walk
+
+__all__ = [
+    "EmulatedClient",
+    "LD2450Emulator",
+    "ReplayClient",
+    "PersonPath",
+    "Scene",
+    "SceneFrame",
+    "doorway",
+    "passing",
+    "sit",
+    "walk",
+]
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import random
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from bleak_retry_connector import BleakError, BleakNotFoundError
+
+from ..const import (
+    CHARACTERISTIC_NOTIFY,
+    CHARACTERISTIC_WRITE,
+    CMD_WORD_AREA,
+    CMD_WORD_DISABLE_CONFIG,
+    CMD_WORD_ENABLE_CONFIG,
+    CMD_WORD_GET_FW_VER,
+    CMD_WORD_GET_MAC,
+    CMD_WORD_MULTI_TARGET,
+    CMD_WORD_QUERY_TARGET_MODE,
+    CMD_WORD_REBOOT,
+    CMD_WORD_SET_AREA,
+    CMD_WORD_SINGLE_TARGET,
+)
+from ..models import Area
+from ..protocol import (
+    FRAME_TYPE_ACK,
+    FrameDecoder,
+    build_ack,
+    decode_area,
+    encode_area,
+    encode_targets,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+EMPTY_VALUES = (0,) * 12
+
+# Enable config ack payload: protocol version and buffer size
+_CONFIG_ACK_PAYLOAD = b"\x01\x00\x40\x00"
+
+
+class LD2450Emulator:
+    """An in-process LD2450 that stands in for the BLE connection.
+
+    Pass ``emulator.connect`` as the ``client_factory`` of an ``LD2450BLE``.
+    Every command is answered with the ack the sensor would send, config
+    commands only inside config mode like the real firmware, and target
+    frames are streamed at ``rate`` Hz from ``frames`` (an iterable of x, y,
+    speed and resolution for three targets, repeated empty frames by
+    default).
+
+    The link can be made unreliable, deterministically for a given ``seed``:
+    acks are delayed by ``latency`` seconds, notifications are split into
+    chunks of at most ``fragment`` bytes and each chunk is lost with
+    probability ``drop_rate``. Connects, writes and the connection itself
+    can be failed on demand with ``fail_connects``, ``fail_writes`` and
+    ``drop_connection``.
+    """
+
+    def __init__(
+        self,
+        *,
+        frames: Iterable[tuple[int, ...]] | None = None,
+        rate: float = 10.0,
+        latency: float = 0.0,
+        fragment: int | None = None,
+        drop_rate: float = 0.0,
+        seed: int = 0,
+        fw_ver: bytes = b"\x00\x00\x02\x01\x16\x24\x06\x22",
+        mac_addr: bytes = b"\x01\x02\x03\x04\x05\x06",
+        target_mode: int = 2,
+        area: Area = Area(),
+        mtu_size: int = 247,
+    ) -> None:
+        """Init the emulator."""
+        self._frames: Iterator[tuple[int, ...]] = iter(
+            itertools.repeat(EMPTY_VALUES) if frames is None else frames
+        )
+        self.rate = rate
+        self.latency = latency
+        self.fragment = fragment
+        self.drop_rate = drop_rate
+        self._rng = random.Random(seed)
+        self.fw_ver = fw_ver
+        self.mac_addr = mac_addr
+        self.target_mode = target_mode
+        self.area = area
+        self.mtu_size = mtu_size
+        self.config_mode = False
+        self.client: EmulatedClient | None = None
+        self.commands: list[int] = []
+        self.connects = 0
+        self.sent_notifications = 0
+        self.dropped_notifications = 0
+        self._failing_connects = 0
+        self._failing_writes = 0
+        self._stream_task: asyncio.Task[None] | None = None
+
+    async def connect(
+        self, disconnected_callback: Callable[[Any], None]
+    ) -> EmulatedClient:
+        """Connect, matching the client factory signature of LD2450BLE."""
+        if self._failing_connects:
+            self._failing_connects -= 1
+            raise BleakNotFoundError("Emulated device not found")
+        self.connects += 1
+        self.client = EmulatedClient(self, disconnected_callback)
+        return self.client
+
+    def fail_connects(self, count: int = 1) -> None:
+        """Make the next connection attempts fail as if out of range."""
+        self._failing_connects = count
+
+    def fail_writes(self, count: int = 1) -> None:
+        """Make the next writes fail with a BleakError."""
+        self._failing_writes = count
+
+    def drop_connection(self) -> None:
+        """Drop the link from the device side, as an out of range sensor does."""
+        if self.client is not None:
+            self.client.lost()
+
+    def _start_stream(self) -> None:
+        if self._stream_task is None and self.rate > 0:
+            self._stream_task = asyncio.create_task(self._stream())
+
+    def _stop_stream(self) -> None:
+        if self._stream_task is not None:
+            self._stream_task.cancel()
+            self._stream_task = None
+
+    async def _stream(self) -> None:
+        """Send a target frame every 1/rate seconds, outside config mode."""
+        loop = asyncio.get_running_loop()
+        interval = 1 / self.rate
+        deadline = loop.time()
+        while True:
+            deadline += interval
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
+            if self.config_mode:
+                # The real sensor stops reporting while it is configured
+                continue
+            values = next(self._frames, None)
+            if values is None:
+                self._stream_task = None
+                return
+            self._notify(encode_targets(values))
+
+    def _notify(self, payload: bytes) -> None:
+        """Deliver a payload, fragmented and lossy as configured."""
+        client = self.client
+        if client is None or client.callback is None:
+            return
+        size = len(payload)
+        offset = 0
+        while offset < size:
+            chunk = size - offset
+            if self.fragment is not None:
+                chunk = min(chunk, self._rng.randint(1, self.fragment))
+            if self.drop_rate and self._rng.random() < self.drop_rate:
+                self.dropped_notifications += 1
+            else:
+                self.sent_notifications += 1
+                client.callback(0, bytearray(payload[offset : offset + chunk]))
+            offset += chunk
+
+    def _handle_write(self, data: bytes) -> None:
+        """Answer every command in a write."""
+        for frame_type, frame in FrameDecoder().feed(data):
+            if frame_type != FRAME_TYPE_ACK:
+                continue
+            command_word = frame[6]
+            self.commands.append(command_word)
+            ack = self._answer(command_word, frame[8:-4])
+            if ack is None:
+                continue
+            if self.latency:
+                asyncio.get_running_loop().call_later(self.latency, self._notify, ack)
+            else:
+                asyncio.get_running_loop().call_soon(self._notify, ack)
+
+    def _answer(self, command_word: int, value: bytes) -> bytes | None:
+        """Apply a command and build its ack, None if the sensor ignores it."""
+        if command_word == CMD_WORD_ENABLE_CONFIG:
+            self.config_mode = True
+            return build_ack(command_word, _CONFIG_ACK_PAYLOAD)
+        if not self.config_mode:
+            _LOGGER.debug("Emulator ignoring command %02X outside config mode", command_word)
+            return None
+        if command_word == CMD_WORD_DISABLE_CONFIG:
+            self.config_mode = False
+        elif command_word == CMD_WORD_SINGLE_TARGET:
+            self.target_mode = 1
+        elif command_word == CMD_WORD_MULTI_TARGET:
+            self.target_mode = 2
+        elif command_word == CMD_WORD_QUERY_TARGET_MODE:
+            return build_ack(command_word, self.target_mode.to_bytes(2, "little"))
+        elif command_word == CMD_WORD_GET_FW_VER:
+            return build_ack(command_word, self.fw_ver)
+        elif command_word == CMD_WORD_GET_MAC:
+            return build_ack(command_word, self.mac_addr)
+        elif command_word == CMD_WORD_AREA:
+            return build_ack(command_word, encode_area(self.area))
+        elif command_word == CMD_WORD_SET_AREA:
+            self.area = decode_area(value)
+        elif command_word == CMD_WORD_REBOOT:
+            self.config_mode = False
+            asyncio.get_running_loop().call_later(0.1, self.drop_connection)
+        else:
+            return build_ack(command_word, result=1)
+        return build_ack(command_word)
+
+
+class EmulatedClient:
+    """The connection to an ``LD2450Emulator``, shaped like a Bleak client."""
+
+    def __init__(
+        self,
+        emulator: LD2450Emulator,
+        disconnected_callback: Callable[[Any], None],
+    ) -> None:
+        """Init the client."""
+        self._emulator = emulator
+        self._disconnected_callback = disconnected_callback
+        self.callback: Callable[[int, Any], None] | None = None
+        self.is_connected = True
+        self.mtu_size = emulator.mtu_size
+
+    async def start_notify(self, char: str, callback: Callable[[int, Any], None]) -> None:
+        """Start receiving notifications and target frames."""
+        self._check(char, CHARACTERISTIC_NOTIFY)
+        self.callback = callback
+        self._emulator._start_stream()
+
+    async def stop_notify(self, char: str) -> None:
+        """Stop receiving notifications."""
+        self._check(char, CHARACTERISTIC_NOTIFY)
+        self.callback = None
+        self._emulator._stop_stream()
+
+    async def write_gatt_char(self, char: str, data: bytes, _response: bool) -> None:
+        """Send commands to the emulated sensor."""
+        self._check(char, CHARACTERISTIC_WRITE)
+        emulator = self._emulator
+        if emulator._failing_writes:
+            emulator._failing_writes -= 1
+            raise BleakError("Emulated write failure")
+        if len(data) > self.mtu_size - 3:
+            raise BleakError(f"Write of {len(data)} bytes exceeds the MTU")
+        emulator._handle_write(bytes(data))
+
+    async def disconnect(self) -> None:
+        """Disconnect on request of the host."""
+        self.lost()
+
+    def lost(self) -> None:
+        """Tear the link down and report it."""
+        if not self.is_connected:
+            return
+        self.is_connected = False
+        self.callback = None
+        emulator = self._emulator
+        emulator._stop_stream()
+        emulator.config_mode = False
+        if emulator.client is self:
+            emulator.client = None
+        self._disconnected_callback(self)
+
+    def _check(self, char: str, expected: str) -> None:
+        if not self.is_connected:
+            raise BleakError("Not connected")
+        if char != expected:
+            raise BleakError(f"Characteristic {char} not found")
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from ..capture import CaptureHeader, CaptureReader
+from ..const import (
+    ACK_FRAME_FOOTER,
+    ACK_SPECS,
+    CMD_WORD_GET_FW_VER,
+    CMD_WORD_QUERY_TARGET_MODE,
+    TARGET_FRAME_FOOTER,
+)
+from ..protocol import FRAME_TYPE_ACK, FrameDecoder, build_ack
+
+_LOGGER = logging.getLogger(__name__)
+
+# Yield to the loop every so many records when replaying at max speed
+MAX_SPEED_BATCH = 64
+
+
+def _encode_fw_ver(fw_ver: str) -> bytes:
+    """Build a firmware version ack payload from its "M.mm.bbbbbbbb" form."""
+    try:
+        major, minor, build = fw_ver.split(".")
+        return bytes((0, 0, int(minor, 16), int(major, 16))) + int(
+            build, 16
+        ).to_bytes(4, "little")
+    except ValueError:
+        return bytes(8)
+
+
+class ReplayClient:
+    """Play a capture back as if it came from a connected sensor.
+
+    Pass ``ReplayClient(reader).connect`` as the ``client_factory`` of an
+    ``LD2450BLE``. Once notifications are started the recorded payloads are
+    delivered in order, spaced as recorded scaled by ``speed``, or as fast
+    as possible when ``speed`` is None. Commands are answered with the acks
+    found in the capture, or with acks synthesized from the capture header.
+    """
+
+    def __init__(self, reader: CaptureReader, speed: float | None = 1.0) -> None:
+        """Init the replay."""
+        self._reader = reader
+        self._speed = speed
+        self._callback: Callable[[int, Any], None] | None = None
+        self._disconnected_callback: Callable[[Any], None] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._finished: asyncio.Future[None] | None = None
+        self._acks = self._index_acks(reader)
+        # Acks are only injected between frames, never into a split one
+        self._pending_acks: list[bytes] = []
+        self._at_boundary = True
+        self.is_connected = False
+        self.mtu_size = 247
+        self.records = 0
+
+    @staticmethod
+    def _index_acks(reader: CaptureReader) -> dict[int, bytes]:
+        """Collect the first recorded ack for every command word."""
+        header: CaptureHeader = reader.header
+        acks = {
+            word: build_ack(word, bytes(length - 4))
+            for word, (_, length) in ACK_SPECS.items()
+        }
+        acks[CMD_WORD_QUERY_TARGET_MODE] = build_ack(
+            CMD_WORD_QUERY_TARGET_MODE, header.target_mode.to_bytes(2, "little")
+        )
+        acks[CMD_WORD_GET_FW_VER] = build_ack(
+            CMD_WORD_GET_FW_VER, _encode_fw_ver(header.fw_ver)
+        )
+        decoder = FrameDecoder()
+        recorded: dict[int, bytes] = {}
+        for record in reader:
+            for frame_type, frame in decoder.feed(record.payload):
+                if frame_type == FRAME_TYPE_ACK:
+                    recorded.setdefault(frame[6], frame)
+        acks.update(recorded)
+        return acks
+
+    async def connect(self, disconnected_callback: Callable[[Any], None]) -> ReplayClient:
+        """Connect, matching the client factory signature of LD2450BLE."""
+        self._disconnected_callback = disconnected_callback
+        self.is_connected = True
+        return self
+
+    async def wait_finished(self) -> None:
+        """Wait until every recorded notification has been delivered."""
+        if self._finished is None:
+            self._finished = asyncio.get_running_loop().create_future()
+        await asyncio.shield(self._finished)
+
+    async def start_notify(self, _char: str, callback: Callable[[int, Any], None]) -> None:
+        """Start delivering the recorded notifications."""
+        self._callback = callback
+        if self._finished is None:
+            self._finished = asyncio.get_running_loop().create_future()
+        if self._task is None:
+            self._task = asyncio.create_task(self._play())
+
+    async def stop_notify(self, _char: str) -> None:
+        """Stop delivering notifications."""
+        self._callback = None
+
+    async def write_gatt_char(self, _char: str, data: bytes, _response: bool) -> None:
+        """Answer every command in the write with its ack."""
+        callback = self._callback
+        if callback is None:
+            return
+        for frame_type, frame in FrameDecoder().feed(data):
+            if frame_type != FRAME_TYPE_ACK:
+                continue
+            ack = self._acks.get(frame[6])
+            if ack is None:
+                _LOGGER.debug("No ack to replay for command %02X", frame[6])
+                continue
+            self._pending_acks.append(ack)
+        if self._at_boundary:
+            # The real sensor never answers within the write call
+            asyncio.get_running_loop().call_soon(self._flush_acks)
+
+    def _flush_acks(self) -> None:
+        """Deliver the acks of the commands written so far."""
+        callback = self._callback
+        acks, self._pending_acks = self._pending_acks, []
+        if callback is not None:
+            for ack in acks:
+                callback(0, bytearray(ack))
+
+    async def disconnect(self) -> None:
+        """Stop the replay and report the disconnect."""
+        if not self.is_connected:
+            return
+        self.is_connected = False
+        if self._task is not None:
+            self._task.cancel()
+        if self._disconnected_callback is not None:
+            self._disconnected_callback(self)
+
+    async def _play(self) -> None:
+        """Deliver the records, paced as recorded or as fast as possible."""
+        loop = asyncio.get_running_loop()
+        speed = self._speed
+        start = loop.time()
+        first_ns: int | None = None
+        try:
+            for record in self._reader:
+                callback = self._callback
+                if callback is None:
+                    break
+                if speed is not None:
+                    if first_ns is None:
+                        first_ns = record.timestamp_ns
+                    delay = start + (record.timestamp_ns - first_ns) / 1e9 / speed - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                elif not self.records % MAX_SPEED_BATCH:
+                    await asyncio.sleep(0)
+                payload = record.payload
+                callback(0, payload)
+                self.records += 1
+                tail = payload[-4:]
+                self._at_boundary = (
+                    tail == ACK_FRAME_FOOTER or tail[-2:] == TARGET_FRAME_FOOTER
+                )
+                if self._at_boundary and self._pending_acks:
+                    self._flush_acks()
+        finally:
+            self._at_boundary = True
+            if self._pending_acks:
+                self._flush_acks()
+            if self._finished is not None and not self._finished.done():
+                self._finished.set_result(None)
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import math
+import random
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from ..const import TARGET_FRAME_LENGTH
+from ..models import TARGET_COUNT
+from ..protocol import encode_targets
+
+DEFAULT_RESOLUTION = 360
+_MAX_COORDINATE = 0x7FFF
+
+
+@dataclass(frozen=True)
+class PersonPath:
+    """A person moving through waypoints of (seconds, x mm, y mm).
+
+    The person is present from the first to the last waypoint and moves in
+    a straight line between consecutive ones; repeating a point holds still.
+    """
+
+    waypoints: tuple[tuple[float, int, int], ...]
+
+    @property
+    def start(self) -> float:
+        return self.waypoints[0][0]
+
+    @property
+    def end(self) -> float:
+        return self.waypoints[-1][0]
+
+    def position(self, t: float) -> tuple[float, float] | None:
+        """Return where the person is at ``t``, None if not in the room."""
+        points = self.waypoints
+        if t < points[0][0] or t > points[-1][0]:
+            return None
+        for (t0, x0, y0), (t1, x1, y1) in zip(points, points[1:]):
+            if t <= t1:
+                share = (t - t0) / (t1 - t0) if t1 > t0 else 1.0
+                return x0 + (x1 - x0) * share, y0 + (y1 - y0) * share
+        return float(points[-1][1]), float(points[-1][2])
+
+
+def walk(
+    start: tuple[int, int], end: tuple[int, int], at: float = 0.0, speed: float = 1000.0
+) -> PersonPath:
+    """Walk in a straight line at ``speed`` mm/s."""
+    duration = math.dist(start, end) / speed
+    return PersonPath(((at, *start), (at + duration, *end)))
+
+
+def sit(position: tuple[int, int], at: float = 0.0, duration: float = 60.0) -> PersonPath:
+    """Stay at one place, e.g. on a chair."""
+    return PersonPath(((at, *position), (at + duration, *position)))
+
+
+def doorway(
+    y: int = 2000, width: int = 3000, at: float = 0.0, speed: float = 1200.0
+) -> PersonPath:
+    """Cross the room from left to right at distance ``y``."""
+    return walk((-width // 2, y), (width // 2, y), at, speed)
+
+
+def passing(
+    y: int = 2500, width: int = 3000, at: float = 0.0, speed: float = 1000.0
+) -> tuple[PersonPath, PersonPath]:
+    """Two people crossing each other in opposite directions."""
+    return (
+        walk((-width // 2, y - 300), (width // 2, y + 300), at, speed),
+        walk((width // 2, y - 300), (-width // 2, y + 300), at, speed),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class SceneFrame:
+    """A generated frame: what the sensor reports and what really happened.
+
+    ``values`` holds x, y, speed and resolution of the three slots as the
+    sensor would report them, noise, swaps and dropouts included.
+    ``truth`` holds (path index, x, y) of every person in the room.
+    """
+
+    timestamp: float
+    values: tuple[int, ...]
+    truth: tuple[tuple[int, int, int], ...]
+
+
+class Scene:
+    """Reproducible LD2450 streams generated from scripted paths.
+
+    Frames are produced at ``rate`` Hz with gaussian position noise of
+    ``noise`` mm. With probability ``swap`` two occupied slots trade places
+    for a frame, and with probability ``dropout`` a person is missing from
+    a frame. People beyond the three slots are not reported, like on the
+    sensor. Generation is not paced, so it runs as fast as consumers can
+    take the frames.
+    """
+
+    def __init__(
+        self,
+        paths: tuple[PersonPath, ...] | list[PersonPath],
+        *,
+        rate: float = 10.0,
+        noise: float = 20.0,
+        swap: float = 0.0,
+        dropout: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        """Init the scene."""
+        self.paths = tuple(paths)
+        self.rate = rate
+        self.noise = noise
+        self.swap = swap
+        self.dropout = dropout
+        self.seed = seed
+
+    @property
+    def duration(self) -> float:
+        """Return when the last person leaves."""
+        return max((path.end for path in self.paths), default=0.0)
+
+    def frames(self, duration: float | None = None) -> Iterator[SceneFrame]:
+        """Generate the frames of the scene, by default until everyone left."""
+        rng = random.Random(self.seed)
+        interval = 1 / self.rate
+        count = int((self.duration if duration is None else duration) * self.rate)
+        previous: dict[int, tuple[float, float]] = {}
+        for index in range(count + 1):
+            t = index * interval
+            truth = []
+            slots = []
+            for path_index, path in enumerate(self.paths):
+                position = path.position(t)
+                if position is None:
+                    previous.pop(path_index, None)
+                    continue
+                x, y = position
+                truth.append((path_index, round(x), round(y)))
+                # Radial speed in cm/s, positive when moving away
+                before = previous.get(path_index, position)
+                previous[path_index] = position
+                speed = (math.hypot(x, y) - math.hypot(*before)) / interval / 10
+                if self.dropout and rng.random() < self.dropout:
+                    continue
+                if len(slots) < TARGET_COUNT:
+                    slots.append(
+                        (
+                            _clamp(round(x + rng.gauss(0, self.noise))),
+                            max(1, _clamp(round(y + rng.gauss(0, self.noise)))),
+                            _clamp(round(speed)),
+                            DEFAULT_RESOLUTION,
+                        )
+                    )
+            if self.swap and len(slots) > 1 and rng.random() < self.swap:
+                first, second = rng.sample(range(len(slots)), 2)
+                slots[first], slots[second] = slots[second], slots[first]
+            while len(slots) < TARGET_COUNT:
+                slots.append((0, 0, 0, 0))
+            yield SceneFrame(
+                t, tuple(value for slot in slots for value in slot), tuple(truth)
+            )
+
+    def notifications(
+        self,
+        duration: float | None = None,
+        *,
+        fragment: int | None = None,
+        burst: int = 1,
+    ) -> Iterator[tuple[bytes, tuple[SceneFrame, ...]]]:
+        """Generate encoded notification payloads and the frames each completes.
+
+        ``burst`` frames are merged into one notification, then split into
+        chunks of at most ``fragment`` bytes when given. A frame is listed
+        with the chunk that carries its last byte.
+        """
+        rng = random.Random(self.seed + 1)
+        frames = self.frames(duration)
+        while True:
+            batch = tuple(frame for _, frame in zip(range(burst), frames))
+            if not batch:
+                return
+            payload = b"".join(encode_targets(frame.values) for frame in batch)
+            if fragment is None:
+                yield payload, batch
+                continue
+            ends = [TARGET_FRAME_LENGTH * (index + 1) for index in range(len(batch))]
+            offset = 0
+            while offset < len(payload):
+                size = min(len(payload) - offset, rng.randint(1, fragment))
+                done = tuple(
+                    frame
+                    for frame, frame_end in zip(batch, ends)
+                    if offset < frame_end <= offset + size
+                )
+                yield payload[offset : offset + size], done
+                offset += size
+
+
+def _clamp(value: int) -> int:
+    """Keep a value within what a sensor word can carry."""
+    return max(-_MAX_COORDINATE, min(_MAX_COORDINATE, value))
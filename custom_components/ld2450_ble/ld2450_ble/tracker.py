@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from itertools import permutations
+
+from .models import TARGET_COUNT
+
+EMPTY_VALUES = (0, 0, 0, 0)
+
+
+@dataclass(frozen=True)
+class TrackerConfig:
+    """Tuning of the tracker, distances in mm and times in seconds.
+
+    A detection further than ``gate`` from where a track is expected is
+    not associated with it. A track is reported once it was seen in
+    ``confirm`` frames and kept through dropouts of up to ``coast``.
+    ``measurement_noise`` is the position noise of the sensor and
+    ``acceleration_noise`` how fast people may change speed, in mm/s².
+    """
+
+    gate: float = 800.0
+    confirm: int = 2
+    coast: float = 1.0
+    measurement_noise: float = 80.0
+    acceleration_noise: float = 1000.0
+
+    def __post_init__(self) -> None:
+        if self.gate <= 0:
+            raise ValueError("gate must be positive")
+        if self.confirm < 1:
+            raise ValueError("confirm must be at least 1")
+        if self.coast < 0:
+            raise ValueError("coast must not be negative")
+        if self.measurement_noise <= 0 or self.acceleration_noise <= 0:
+            raise ValueError("noise must be positive")
+
+
+class _Axis:
+    """Constant velocity Kalman filter of one coordinate."""
+
+    __slots__ = ("position", "velocity", "p00", "p01", "p11")
+
+    def __init__(self, position: float, variance: float) -> None:
+        self.position = position
+        self.velocity = 0.0
+        self.p00 = variance
+        self.p01 = 0.0
+        # Nothing is known about the speed of a new target, up to ~2 m/s
+        self.p11 = 2000.0**2
+
+    def predict(self, dt: float, q: float) -> None:
+        """Move the state dt seconds ahead."""
+        self.position += self.velocity * dt
+        p00, p01, p11 = self.p00, self.p01, self.p11
+        self.p00 = p00 + dt * (2 * p01 + dt * p11) + q * dt**3 / 3
+        self.p01 = p01 + dt * p11 + q * dt**2 / 2
+        self.p11 = p11 + q * dt
+
+    def update(self, measured: float, variance: float) -> None:
+        """Correct the state with a measured position."""
+        p00, p01 = self.p00, self.p01
+        innovation_variance = p00 + variance
+        gain_position = p00 / innovation_variance
+        gain_velocity = p01 / innovation_variance
+        innovation = measured - self.position
+        self.position += gain_position * innovation
+        self.velocity += gain_velocity * innovation
+        self.p00 = (1 - gain_position) * p00
+        self.p01 = (1 - gain_position) * p01
+        self.p11 -= gain_velocity * p01
+
+
+class _Track:
+    """A person followed across frames."""
+
+    __slots__ = ("x", "y", "updated", "hits", "coasting", "lost", "values")
+
+    def __init__(self, detection: tuple[int, ...], timestamp: float, variance: float) -> None:
+        self.x = _Axis(detection[0], variance)
+        self.y = _Axis(detection[1], variance)
+        self.updated = timestamp
+        self.hits = 1
+        self.coasting = False
+        self.lost = timestamp
+        self.values = detection
+
+    def distance(self, detection: tuple[int, ...]) -> float:
+        return math.hypot(detection[0] - self.x.position, detection[1] - self.y.position)
+
+
+class Tracker:
+    """Give targets stable slots and smooth their positions.
+
+    The sensor reports up to three detections per frame in no particular
+    order. Each frame the tracks are predicted forward, the detections
+    are assigned to them by trying every assignment (six at most) and
+    keeping the cheapest within the gate, and the assigned tracks are
+    corrected by a constant velocity Kalman filter. A track keeps its slot
+    for its whole life, and while no detection matches it, it holds its
+    last reported values for up to ``coast`` seconds.
+    """
+
+    def __init__(self, config: TrackerConfig | None = None) -> None:
+        """Init the tracker."""
+        self.config = config or TrackerConfig()
+        self._tracks: list[_Track | None] = [None] * TARGET_COUNT
+        self._variance = self.config.measurement_noise**2
+        self._q = self.config.acceleration_noise**2
+
+    def reset(self) -> None:
+        """Forget all tracks, e.g. after a reconnect."""
+        self._tracks = [None] * TARGET_COUNT
+
+    def update(self, timestamp: float, values: tuple[int, ...]) -> tuple[int, ...]:
+        """Take a decoded frame and return it with tracked slots."""
+        config = self.config
+        tracks = self._tracks
+        for track in tracks:
+            if track is not None:
+                dt = timestamp - track.updated
+                track.x.predict(dt, self._q)
+                track.y.predict(dt, self._q)
+                track.updated = timestamp
+        detections = [
+            values[base : base + 4]  # noqa: E203
+            for base in range(0, TARGET_COUNT * 4, 4)
+            if values[base + 1] > 0
+        ]
+        assigned = self._associate(detections)
+        for slot, track in enumerate(tracks):
+            detection = assigned[slot]
+            if detection is None:
+                if track is None:
+                    continue
+                if not track.coasting:
+                    track.coasting = True
+                    track.lost = timestamp
+                elif timestamp - track.lost > config.coast:
+                    tracks[slot] = None
+                continue
+            if track is None:
+                tracks[slot] = _Track(detection, timestamp, self._variance)
+                continue
+            track.x.update(detection[0], self._variance)
+            track.y.update(detection[1], self._variance)
+            track.hits += 1
+            track.coasting = False
+            track.values = (
+                round(track.x.position),
+                max(1, round(track.y.position)),
+                detection[2],
+                detection[3],
+            )
+        return tuple(
+            value
+            for track in tracks
+            for value in (
+                track.values
+                if track is not None and track.hits >= config.confirm
+                else EMPTY_VALUES
+            )
+        )
+
+    def _associate(
+        self, detections: list[tuple[int, ...]]
+    ) -> list[tuple[int, ...] | None]:
+        """Return the detection assigned to each slot, None for none.
+
+        A detection may go to a track within the gate, to a free slot at
+        the cost of the gate, or replace a coasting track at twice that.
+        A detection far from a track seen in the previous frame is not
+        given its slot; at three times the gate it is left out.
+        """
+        gate = self.config.gate
+        tracks = self._tracks
+        costs = [
+            [
+                gate
+                if track is None
+                else distance
+                if (distance := track.distance(detection)) <= gate
+                else 2 * gate
+                if track.coasting
+                else 3 * gate
+                for track in tracks
+            ]
+            for detection in detections
+        ]
+        best = min(
+            permutations(range(TARGET_COUNT), len(detections)),
+            key=lambda slots: sum(row[slot] for row, slot in zip(costs, slots)),
+        )
+        assigned: list[tuple[int, ...] | None] = [None] * TARGET_COUNT
+        for detection, row, slot in zip(detections, costs, best):
+            if row[slot] == 3 * gate:
+                continue
+            if row[slot] == 2 * gate:
+                # The coasting track lost its person, start over
+                tracks[slot] = None
+            assigned[slot] = detection
+        return assigned
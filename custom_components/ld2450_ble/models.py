@@ -7,6 +7,9 @@ from dataclasses import dataclass
 from .ld2450_ble import LD2450BLE
 
 from .coordinator import LD2450BLECoordinator
+from .heatmap import LD2450BLEHeatmap
+from .window import LD2450BLEWindowAggregator
+from .zones import LD2450BLEZoneTracker
 
 
 @dataclass
@@ -16,3 +19,6 @@ class LD2450BLEData:
     title: str
     device: LD2450BLE
     coordinator: LD2450BLECoordinator
+    window: LD2450BLEWindowAggregator
+    zones: LD2450BLEZoneTracker
+    heatmap: LD2450BLEHeatmap | None
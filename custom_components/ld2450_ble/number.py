@@ -1,7 +1,8 @@
 """LD2450 BLE integration sensor platform."""
 
+from dataclasses import dataclass, replace
 import logging
-import math
+
 from homeassistant.components.number import (
     NumberDeviceClass,
     NumberEntity,
@@ -16,176 +17,42 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import LD2450BLE, LD2450BLECoordinator
+from .coordinator import AREA_RECT_KEYS
 from .const import DOMAIN
 from .models import LD2450BLEData
 
 _LOGGER = logging.getLogger(__name__)
 
-AREA_ONE_FIRST_VERTEX_X_DESCRIPTION = NumberEntityDescription(
-    key="area_one_first_vertex_x",
-    translation_key="area_one_first_vertex_x",
-    device_class=NumberDeviceClass.DISTANCE,
-    mode="slider",
-    native_min_value=-5000,
-    native_max_value=5000,
-    native_step=100,
-    entity_registry_enabled_default=True,
-    entity_registry_visible_default=True,
-    native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-)
-AREA_ONE_FIRST_VERTEX_Y_DESCRIPTION = NumberEntityDescription(
-    key="area_one_first_vertex_y",
-    translation_key="area_one_first_vertex_y",
-    device_class=NumberDeviceClass.DISTANCE,
-    mode="slider",
-    native_min_value=0,
-    native_max_value=7300,
-    native_step=100,
-    entity_registry_enabled_default=True,
-    entity_registry_visible_default=True,
-    native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-)
-AREA_ONE_SECOND_VERTEX_X_DESCRIPTION = NumberEntityDescription(
-    key="area_one_second_vertex_x",
-    translation_key="area_one_second_vertex_x",
-    device_class=NumberDeviceClass.DISTANCE,
-    mode="slider",
-    native_min_value=-5000,
-    native_max_value=5000,
-    native_step=100,
-    entity_registry_enabled_default=True,
-    entity_registry_visible_default=True,
-    native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-)
-AREA_ONE_SECOND_VERTEX_Y_DESCRIPTION = NumberEntityDescription(
-    key="area_one_second_vertex_y",
-    translation_key="area_one_second_vertex_y",
-    device_class=NumberDeviceClass.DISTANCE,
-    mode="slider",
-    native_min_value=0,
-    native_max_value=7300,
-    native_step=100,
-    entity_registry_enabled_default=True,
-    entity_registry_visible_default=True,
-    native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-)
+AREA_NAMES = ("one", "two", "three")
 
-AREA_TWO_FIRST_VERTEX_X_DESCRIPTION = NumberEntityDescription(
-    key="area_two_first_vertex_x",
-    translation_key="area_two_first_vertex_x",
-    device_class=NumberDeviceClass.DISTANCE,
-    mode="slider",
-    native_min_value=-5000,
-    native_max_value=5000,
-    native_step=100,
-    entity_registry_enabled_default=True,
-    entity_registry_visible_default=True,
-    native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-)
-AREA_TWO_FIRST_VERTEX_Y_DESCRIPTION = NumberEntityDescription(
-    key="area_two_first_vertex_y",
-    translation_key="area_two_first_vertex_y",
-    device_class=NumberDeviceClass.DISTANCE,
-    mode="slider",
-    native_min_value=0,
-    native_max_value=7300,
-    native_step=100,
-    entity_registry_enabled_default=True,
-    entity_registry_visible_default=True,
-    native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-)
-AREA_TWO_SECOND_VERTEX_X_DESCRIPTION = NumberEntityDescription(
-    key="area_two_second_vertex_x",
-    translation_key="area_two_second_vertex_x",
-    device_class=NumberDeviceClass.DISTANCE,
-    mode="slider",
-    native_min_value=-5000,
-    native_max_value=5000,
-    native_step=100,
-    entity_registry_enabled_default=True,
-    entity_registry_visible_default=True,
-    native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-)
-AREA_TWO_SECOND_VERTEX_Y_DESCRIPTION = NumberEntityDescription(
-    key="area_two_second_vertex_y",
-    translation_key="area_two_second_vertex_y",
-    device_class=NumberDeviceClass.DISTANCE,
-    mode="slider",
-    native_min_value=0,
-    native_max_value=7300,
-    native_step=100,
-    entity_registry_enabled_default=True,
-    entity_registry_visible_default=True,
-    native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-)
 
-AREA_THREE_FIRST_VERTEX_X_DESCRIPTION = NumberEntityDescription(
-    key="area_three_first_vertex_x",
-    translation_key="area_three_first_vertex_x",
-    device_class=NumberDeviceClass.DISTANCE,
-    mode="slider",
-    native_min_value=-5000,
-    native_max_value=5000,
-    native_step=100,
-    entity_registry_enabled_default=True,
-    entity_registry_visible_default=True,
-    native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-)
-AREA_THREE_FIRST_VERTEX_Y_DESCRIPTION = NumberEntityDescription(
-    key="area_three_first_vertex_y",
-    translation_key="area_three_first_vertex_y",
-    device_class=NumberDeviceClass.DISTANCE,
-    mode="slider",
-    native_min_value=0,
-    native_max_value=7300,
-    native_step=100,
-    entity_registry_enabled_default=True,
-    entity_registry_visible_default=True,
-    native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-)
-AREA_THREE_SECOND_VERTEX_X_DESCRIPTION = NumberEntityDescription(
-    key="area_three_second_vertex_x",
-    translation_key="area_three_second_vertex_x",
-    device_class=NumberDeviceClass.DISTANCE,
-    mode="slider",
-    native_min_value=-5000,
-    native_max_value=5000,
-    native_step=100,
-    entity_registry_enabled_default=True,
-    entity_registry_visible_default=True,
-    native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-)
-AREA_THREE_SECOND_VERTEX_Y_DESCRIPTION = NumberEntityDescription(
-    key="area_three_second_vertex_y",
-    translation_key="area_three_second_vertex_y",
-    device_class=NumberDeviceClass.DISTANCE,
-    mode="slider",
-    native_min_value=0,
-    native_max_value=7300,
-    native_step=100,
-    entity_registry_enabled_default=True,
-    entity_registry_visible_default=True,
-    native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-)
+@dataclass(frozen=True, kw_only=True)
+class LD2450BLENumberEntityDescription(NumberEntityDescription):
+    """Describes a vertex coordinate of one area rectangle."""
 
-SENSOR_DESCRIPTIONS = (
-    [
-        AREA_ONE_FIRST_VERTEX_X_DESCRIPTION,
-        AREA_ONE_FIRST_VERTEX_Y_DESCRIPTION,
-        AREA_ONE_SECOND_VERTEX_X_DESCRIPTION,
-        AREA_ONE_SECOND_VERTEX_Y_DESCRIPTION,
-        
-        AREA_TWO_FIRST_VERTEX_X_DESCRIPTION,
-        AREA_TWO_FIRST_VERTEX_Y_DESCRIPTION,
-        AREA_TWO_SECOND_VERTEX_X_DESCRIPTION,
-        AREA_TWO_SECOND_VERTEX_Y_DESCRIPTION,
-        
-        AREA_THREE_FIRST_VERTEX_X_DESCRIPTION,
-        AREA_THREE_FIRST_VERTEX_Y_DESCRIPTION,
-        AREA_THREE_SECOND_VERTEX_X_DESCRIPTION,
-        AREA_THREE_SECOND_VERTEX_Y_DESCRIPTION,
-    ]
-)
+    rect: int
+    field: str
+
+
+SENSOR_DESCRIPTIONS = [
+    LD2450BLENumberEntityDescription(
+        key=f"area_{name}_{vertex}_vertex_{axis}",
+        translation_key=f"area_{name}_{vertex}_vertex_{axis}",
+        device_class=NumberDeviceClass.DISTANCE,
+        mode="slider",
+        native_min_value=-5000 if axis == "x" else 0,
+        native_max_value=5000 if axis == "x" else 7300,
+        native_step=100,
+        entity_registry_enabled_default=True,
+        entity_registry_visible_default=True,
+        native_unit_of_measurement=UnitOfLength.MILLIMETERS,
+        rect=index,
+        field=f"{vertex}_{axis}",
+    )
+    for index, name in enumerate(AREA_NAMES)
+    for vertex in ("first", "second")
+    for axis in ("x", "y")
+]
 
 
 async def async_setup_entry(
@@ -210,16 +77,17 @@ class LD2450BLENumber(CoordinatorEntity[LD2450BLECoordinator], NumberEntity):
     """Generic sensor for LD2450BLE."""
 
     _attr_has_entity_name = True
+    entity_description: LD2450BLENumberEntityDescription
 
     def __init__(
         self,
         coordinator: LD2450BLECoordinator,
         device: LD2450BLE,
         name: str,
-        description: NumberEntityDescription,
+        description: LD2450BLENumberEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, frozenset((AREA_RECT_KEYS[description.rect],)))
         self._coordinator = coordinator
         self._device = device
         self._key = description.key
@@ -247,7 +115,10 @@ class LD2450BLENumber(CoordinatorEntity[LD2450BLECoordinator], NumberEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._attr_native_value = getattr(self._device, self._key)
+        description = self.entity_description
+        self._attr_native_value = getattr(
+            self._coordinator.area.rects[description.rect], description.field
+        )
         self.async_write_ha_state()
 
     @property
@@ -256,18 +127,14 @@ class LD2450BLENumber(CoordinatorEntity[LD2450BLECoordinator], NumberEntity):
         return self._coordinator.connected and super().available
 
     async def async_set_native_value(self, value: float) -> None:
-        """Update the current value."""
-        await self._device._set_area(
-            getattr(self._device, "area_mode"), 
-            int(value) if self._key == "area_one_first_vertex_x" else getattr(self._device, "area_one_first_vertex_x"), 
-            int(value) if self._key == "area_one_first_vertex_y" else getattr(self._device, "area_one_first_vertex_y"), 
-            int(value) if self._key == "area_one_second_vertex_x" else getattr(self._device, "area_one_second_vertex_x"), 
-            int(value) if self._key == "area_one_second_vertex_y" else getattr(self._device, "area_one_second_vertex_y"), 
-            int(value) if self._key == "area_two_first_vertex_x" else getattr(self._device, "area_two_first_vertex_x"), 
-            int(value) if self._key == "area_two_first_vertex_y" else getattr(self._device, "area_two_first_vertex_y"), 
-            int(value) if self._key == "area_two_second_vertex_x" else getattr(self._device, "area_two_second_vertex_x"), 
-            int(value) if self._key == "area_two_second_vertex_y" else getattr(self._device, "area_two_second_vertex_y"), 
-            int(value) if self._key == "area_three_first_vertex_x" else getattr(self._device, "area_three_first_vertex_x"), 
-            int(value) if self._key == "area_three_first_vertex_y" else getattr(self._device, "area_three_first_vertex_y"), 
-            int(value) if self._key == "area_three_second_vertex_x" else getattr(self._device, "area_three_second_vertex_x"), 
-            int(value) if self._key == "area_three_second_vertex_y" else getattr(self._device, "area_three_second_vertex_y"))
\ No newline at end of file
+        """Update the current value.
+
+        Dragging a slider sends many values; they are merged with the edits
+        of the other vertices into one delayed write of the whole area.
+        """
+        description = self.entity_description
+        area = self._coordinator.area
+        rect = replace(area.rects[description.rect], **{description.field: int(value)})
+        self._coordinator.async_request_area(area.with_rect(description.rect, rect))
+        self._attr_native_value = int(value)
+        self.async_write_ha_state()
@@ -1,11 +1,13 @@
 """LD2450 BLE integration sensor platform."""
 
+from dataclasses import replace
 import logging
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfLength
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -13,11 +15,16 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import EntityCategory
 
 from . import LD2450BLE, LD2450BLECoordinator
+from .coordinator import AREA_MODE_KEY
+from .ld2450_ble import BLEAK_EXCEPTIONS, CommandFailedError, CommandTimeoutError
 from .const import DOMAIN
 from .models import LD2450BLEData
 
 _LOGGER = logging.getLogger(__name__)
 
+# Indexed by the area mode reported by the sensor
+AREA_MODES = ("Disable", "Monitor Area", "Ignore Area")
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -45,7 +52,7 @@ class LD2450BLESelect(CoordinatorEntity[LD2450BLECoordinator], SelectEntity):
         name: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, frozenset((AREA_MODE_KEY,)))
         self._coordinator = coordinator
         self._device = device
         self._attr_unique_id = f"{device.name}_area_mode"
@@ -56,7 +63,7 @@ class LD2450BLESelect(CoordinatorEntity[LD2450BLECoordinator], SelectEntity):
             model="LD2450",
             sw_version=getattr(self._device, "fw_ver"),
         )
-        self._attr_options = ["Disable", "Monitor Area", "Ignore Area"]
+        self._attr_options = list(AREA_MODES)
         self._attr_current_option = "Disable"
         self._attr_native_value = 0
 
@@ -78,15 +85,11 @@ class LD2450BLESelect(CoordinatorEntity[LD2450BLECoordinator], SelectEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        match getattr(self._device, "area_mode"):
-            case 0:
-                self._attr_current_option = "Disable"
-            case 1:
-                self._attr_current_option = "Monitor Area"
-            case 2:
-                self._attr_current_option = "Ignore Area"
-            case _:
-                _LOGGER.error("Unknown area mode: %s", getattr(self._device, "area_mode"))
+        area = self._coordinator.area
+        if area.mode < len(AREA_MODES):
+            self._attr_current_option = AREA_MODES[area.mode]
+        else:
+            _LOGGER.error("Unknown area mode: %s", area.mode)
 
         self.async_write_ha_state()
 
@@ -96,48 +99,13 @@ class LD2450BLESelect(CoordinatorEntity[LD2450BLECoordinator], SelectEntity):
         return self._coordinator.connected and super().available
 
     async def async_select_option(self, option: str) -> None:
-        match option:
-            case "Disable":
-                await self._device._set_area(0, 
-                    getattr(self._device, "area_one_first_vertex_x"), 
-                    getattr(self._device, "area_one_first_vertex_y"), 
-                    getattr(self._device, "area_one_second_vertex_x"), 
-                    getattr(self._device, "area_one_second_vertex_y"), 
-                    getattr(self._device, "area_two_first_vertex_x"), 
-                    getattr(self._device, "area_two_first_vertex_y"), 
-                    getattr(self._device, "area_two_second_vertex_x"), 
-                    getattr(self._device, "area_two_second_vertex_y"), 
-                    getattr(self._device, "area_three_first_vertex_x"), 
-                    getattr(self._device, "area_three_first_vertex_y"), 
-                    getattr(self._device, "area_three_second_vertex_x"), 
-                    getattr(self._device, "area_three_second_vertex_y"))
-            case "Monitor Area":
-                await self._device._set_area(1, 
-                    getattr(self._device, "area_one_first_vertex_x"), 
-                    getattr(self._device, "area_one_first_vertex_y"), 
-                    getattr(self._device, "area_one_second_vertex_x"), 
-                    getattr(self._device, "area_one_second_vertex_y"), 
-                    getattr(self._device, "area_two_first_vertex_x"), 
-                    getattr(self._device, "area_two_first_vertex_y"), 
-                    getattr(self._device, "area_two_second_vertex_x"), 
-                    getattr(self._device, "area_two_second_vertex_y"), 
-                    getattr(self._device, "area_three_first_vertex_x"), 
-                    getattr(self._device, "area_three_first_vertex_y"), 
-                    getattr(self._device, "area_three_second_vertex_x"), 
-                    getattr(self._device, "area_three_second_vertex_y"))
-            case "Ignore Area":
-                await self._device._set_area(2, 
-                    getattr(self._device, "area_one_first_vertex_x"), 
-                    getattr(self._device, "area_one_first_vertex_y"), 
-                    getattr(self._device, "area_one_second_vertex_x"), 
-                    getattr(self._device, "area_one_second_vertex_y"), 
-                    getattr(self._device, "area_two_first_vertex_x"), 
-                    getattr(self._device, "area_two_first_vertex_y"), 
-                    getattr(self._device, "area_two_second_vertex_x"), 
-                    getattr(self._device, "area_two_second_vertex_y"), 
-                    getattr(self._device, "area_three_first_vertex_x"), 
-                    getattr(self._device, "area_three_first_vertex_y"), 
-                    getattr(self._device, "area_three_second_vertex_x"), 
-                    getattr(self._device, "area_three_second_vertex_y"))
-            case _:
-                _LOGGER.error("Unknown option: %s", option)
+        if option not in AREA_MODES:
+            _LOGGER.error("Unknown option: %s", option)
+            return
+        area = self._coordinator.area
+        try:
+            await self._coordinator.async_set_area(
+                replace(area, mode=AREA_MODES.index(option))
+            )
+        except (*BLEAK_EXCEPTIONS, CommandFailedError, CommandTimeoutError) as err:
+            raise HomeAssistantError(f"Failed to set area mode: {err}") from err
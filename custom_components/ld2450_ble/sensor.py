@@ -1,7 +1,11 @@
 """LD2450 BLE integration sensor platform."""
 
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
 import logging
-import math
+import time
+
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
@@ -10,206 +14,123 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory, UnitOfLength
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import LD2450BLE, LD2450BLECoordinator
+from .coordinator import TARGET_KEYS
+from .window import QUANTITIES, QUANTITY_DISTANCE, LD2450BLEWindowAggregator
+from .ld2450_ble import FrameAnalytics
 from .const import DOMAIN
 from .models import LD2450BLEData
 
 _LOGGER = logging.getLogger(__name__)
 
-TARGET_ONE_X_DESCRIPTION = SensorEntityDescription(
-    key="target_one_x",
-    translation_key="target_one_x",
-    device_class=SensorDeviceClass.DISTANCE,
-    entity_registry_enabled_default=False,
-    entity_registry_visible_default=False,
-    native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-    state_class=SensorStateClass.MEASUREMENT,
-)
-TARGET_ONE_Y_DESCRIPTION = SensorEntityDescription(
-    key="target_one_y",
-    translation_key="target_one_y",
-    device_class=SensorDeviceClass.DISTANCE,
-    entity_registry_enabled_default=False,
-    entity_registry_visible_default=False,
-    native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-    state_class=SensorStateClass.MEASUREMENT,
-)
-TARGET_ONE_SPEED_DESCRIPTION = SensorEntityDescription(
-    key="target_one_speed",
-    translation_key="target_one_speed",
-    device_class=None,
-    entity_registry_enabled_default=False,
-    entity_registry_visible_default=False,
-    native_unit_of_measurement="cm/s",
-    state_class=SensorStateClass.MEASUREMENT,
-)
-TARGET_ONE_RESOLUTION_DESCRIPTION = SensorEntityDescription(
-    key="target_one_resolution",
-    translation_key="target_one_resolution",
-    entity_category=EntityCategory.DIAGNOSTIC,
-    entity_registry_enabled_default=False,
-    entity_registry_visible_default=False,
-    native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-)
+TARGET_NAMES = ("one", "two", "three")
 
-TARGET_TWO_X_DESCRIPTION = SensorEntityDescription(
-    key="target_two_x",
-    translation_key="target_two_x",
-    device_class=SensorDeviceClass.DISTANCE,
-    entity_registry_enabled_default=False,
-    entity_registry_visible_default=False,
-    native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-    state_class=SensorStateClass.MEASUREMENT,
-)
-TARGET_TWO_Y_DESCRIPTION = SensorEntityDescription(
-    key="target_two_y",
-    translation_key="target_two_y",
-    device_class=SensorDeviceClass.DISTANCE,
-    entity_registry_enabled_default=False,
-    entity_registry_visible_default=False,
-    native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-    state_class=SensorStateClass.MEASUREMENT,
-)
-TARGET_TWO_SPEED_DESCRIPTION = SensorEntityDescription(
-    key="target_two_speed",
-    translation_key="target_two_speed",
-    device_class=None,
-    entity_registry_enabled_default=False,
-    entity_registry_visible_default=False,
-    native_unit_of_measurement="cm/s",
-    state_class=SensorStateClass.MEASUREMENT,
-)
-TARGET_TWO_RESOLUTION_DESCRIPTION = SensorEntityDescription(
-    key="target_two_resolution",
-    translation_key="target_two_resolution",
-    entity_category=EntityCategory.DIAGNOSTIC,
-    entity_registry_enabled_default=False,
-    entity_registry_visible_default=False,
-    native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-)
+# Changes smaller than these are radar jitter and are not written
+DEADBAND_MM = 50
+DEADBAND_SPEED = 5
+DEADBAND_DEGREES = 2
+# The resolution hardly changes and is only of diagnostic interest
+RESOLUTION_MIN_INTERVAL = 60.0
 
-TARGET_THREE_X_DESCRIPTION = SensorEntityDescription(
-    key="target_three_x",
-    translation_key="target_three_x",
-    device_class=SensorDeviceClass.DISTANCE,
-    entity_registry_enabled_default=False,
-    entity_registry_visible_default=False,
-    native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-    state_class=SensorStateClass.MEASUREMENT,
-)
-TARGET_THREE_Y_DESCRIPTION = SensorEntityDescription(
-    key="target_three_y",
-    translation_key="target_three_y",
-    device_class=SensorDeviceClass.DISTANCE,
-    entity_registry_enabled_default=False,
-    entity_registry_visible_default=False,
-    native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-    state_class=SensorStateClass.MEASUREMENT,
-)
-TARGET_THREE_SPEED_DESCRIPTION = SensorEntityDescription(
-    key="target_three_speed",
-    translation_key="target_three_speed",
-    device_class=None,
-    entity_registry_enabled_default=False,
-    entity_registry_visible_default=False,
-    native_unit_of_measurement="cm/s",
-    state_class=SensorStateClass.MEASUREMENT,
-)
-TARGET_THREE_RESOLUTION_DESCRIPTION = SensorEntityDescription(
-    key="target_three_resolution",
-    translation_key="target_three_resolution",
-    entity_category=EntityCategory.DIAGNOSTIC,
-    entity_registry_enabled_default=False,
-    entity_registry_visible_default=False,
-    native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-)
+NEVER_TIME = -86400.0
 
-#calculated
-TARGET_ONE_DISTANCE_DESCRIPTION = SensorEntityDescription(
-    key="target_one_distance",
-    translation_key="target_one_distance",
-    device_class=SensorDeviceClass.DISTANCE,
-    entity_registry_enabled_default=True,
-    entity_registry_visible_default=True,
-    native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-    state_class=SensorStateClass.MEASUREMENT,
-)
-TARGET_TWO_DISTANCE_DESCRIPTION = SensorEntityDescription(
-    key="target_two_distance",
-    translation_key="target_two_distance",
-    device_class=SensorDeviceClass.DISTANCE,
-    entity_registry_enabled_default=True,
-    entity_registry_visible_default=True,
-    native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-    state_class=SensorStateClass.MEASUREMENT,
-)
-TARGET_THREE_DISTANCE_DESCRIPTION = SensorEntityDescription(
-    key="target_three_distance",
-    translation_key="target_three_distance",
-    device_class=SensorDeviceClass.DISTANCE,
-    entity_registry_enabled_default=True,
-    entity_registry_visible_default=True,
-    native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-    state_class=SensorStateClass.MEASUREMENT,
-)
-TARGET_ONE_ANGLE_DESCRIPTION = SensorEntityDescription(
-    key="target_one_angle",
-    translation_key="target_one_angle",
-    entity_registry_enabled_default=True,
-    entity_registry_visible_default=True,
-    native_unit_of_measurement="°",
-    state_class=SensorStateClass.MEASUREMENT,
-)
-TARGET_TWO_ANGLE_DESCRIPTION = SensorEntityDescription(
-    key="target_two_angle",
-    translation_key="target_two_angle",
-    entity_registry_enabled_default=True,
-    entity_registry_visible_default=True,
-    native_unit_of_measurement="°",
-    state_class=SensorStateClass.MEASUREMENT,
-)
-TARGET_THREE_ANGLE_DESCRIPTION = SensorEntityDescription(
-    key="target_three_angle",
-    translation_key="target_three_angle",
-    entity_registry_enabled_default=True,
-    entity_registry_visible_default=True,
-    native_unit_of_measurement="°",
-    state_class=SensorStateClass.MEASUREMENT,
-)
 
+@dataclass(frozen=True, kw_only=True)
+class LD2450BLESensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor computed from one target slot."""
+
+    target: int
+    value_fn: Callable[[FrameAnalytics, int], int]
+    # Smallest change written, unless the target appears or leaves
+    deadband: int = 0
+    # Seconds between writes; the latest value is written when it elapses
+    min_interval: float = 0.0
 
-SENSOR_DESCRIPTIONS = (
-    [
-        TARGET_ONE_X_DESCRIPTION,
-        TARGET_ONE_Y_DESCRIPTION,
-        TARGET_ONE_SPEED_DESCRIPTION,
-        TARGET_ONE_RESOLUTION_DESCRIPTION,
-        
-        TARGET_TWO_X_DESCRIPTION,
-        TARGET_TWO_Y_DESCRIPTION,
-        TARGET_TWO_SPEED_DESCRIPTION,
-        TARGET_TWO_RESOLUTION_DESCRIPTION,
-
-        TARGET_THREE_X_DESCRIPTION,
-        TARGET_THREE_Y_DESCRIPTION,
-        TARGET_THREE_SPEED_DESCRIPTION,
-        TARGET_THREE_RESOLUTION_DESCRIPTION,
-        
-        TARGET_ONE_DISTANCE_DESCRIPTION,
-        TARGET_TWO_DISTANCE_DESCRIPTION,
-        TARGET_THREE_DISTANCE_DESCRIPTION,
-
-        TARGET_ONE_ANGLE_DESCRIPTION,
-        TARGET_TWO_ANGLE_DESCRIPTION,
-        TARGET_THREE_ANGLE_DESCRIPTION        
-    ]
-)
+
+SENSOR_DESCRIPTIONS = [
+    description
+    for index, name in enumerate(TARGET_NAMES)
+    for description in (
+        LD2450BLESensorEntityDescription(
+            key=f"target_{name}_x",
+            translation_key=f"target_{name}_x",
+            device_class=SensorDeviceClass.DISTANCE,
+            entity_registry_enabled_default=False,
+            entity_registry_visible_default=False,
+            native_unit_of_measurement=UnitOfLength.MILLIMETERS,
+            state_class=SensorStateClass.MEASUREMENT,
+            target=index,
+            deadband=DEADBAND_MM,
+            value_fn=lambda analytics, index: analytics.targets[index].x,
+        ),
+        LD2450BLESensorEntityDescription(
+            key=f"target_{name}_y",
+            translation_key=f"target_{name}_y",
+            device_class=SensorDeviceClass.DISTANCE,
+            entity_registry_enabled_default=False,
+            entity_registry_visible_default=False,
+            native_unit_of_measurement=UnitOfLength.MILLIMETERS,
+            state_class=SensorStateClass.MEASUREMENT,
+            target=index,
+            deadband=DEADBAND_MM,
+            value_fn=lambda analytics, index: analytics.targets[index].y,
+        ),
+        LD2450BLESensorEntityDescription(
+            key=f"target_{name}_speed",
+            translation_key=f"target_{name}_speed",
+            device_class=None,
+            entity_registry_enabled_default=False,
+            entity_registry_visible_default=False,
+            native_unit_of_measurement="cm/s",
+            state_class=SensorStateClass.MEASUREMENT,
+            target=index,
+            deadband=DEADBAND_SPEED,
+            value_fn=lambda analytics, index: analytics.targets[index].speed,
+        ),
+        LD2450BLESensorEntityDescription(
+            key=f"target_{name}_resolution",
+            translation_key=f"target_{name}_resolution",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+            entity_registry_visible_default=False,
+            native_unit_of_measurement=UnitOfLength.MILLIMETERS,
+            target=index,
+            min_interval=RESOLUTION_MIN_INTERVAL,
+            value_fn=lambda analytics, index: analytics.targets[index].resolution,
+        ),
+        #calculated
+        LD2450BLESensorEntityDescription(
+            key=f"target_{name}_distance",
+            translation_key=f"target_{name}_distance",
+            device_class=SensorDeviceClass.DISTANCE,
+            entity_registry_enabled_default=True,
+            entity_registry_visible_default=True,
+            native_unit_of_measurement=UnitOfLength.MILLIMETERS,
+            state_class=SensorStateClass.MEASUREMENT,
+            target=index,
+            deadband=DEADBAND_MM,
+            value_fn=lambda analytics, index: analytics.distance[index],
+        ),
+        LD2450BLESensorEntityDescription(
+            key=f"target_{name}_angle",
+            translation_key=f"target_{name}_angle",
+            entity_registry_enabled_default=True,
+            entity_registry_visible_default=True,
+            native_unit_of_measurement="°",
+            state_class=SensorStateClass.MEASUREMENT,
+            target=index,
+            deadband=DEADBAND_DEGREES,
+            value_fn=lambda analytics, index: analytics.angle[index],
+        ),
+    )
+]
 
 
 async def async_setup_entry(
@@ -220,13 +141,28 @@ async def async_setup_entry(
     """Set up the platform for LD2450BLE."""
     data: LD2450BLEData = hass.data[DOMAIN][entry.entry_id]
     async_add_entities(
-        LD2450BLESensor(
-            data.coordinator,
-            data.device,
-            entry.title,
-            description,
-        )
-        for description in SENSOR_DESCRIPTIONS
+        [
+            *(
+                LD2450BLESensor(
+                    data.coordinator,
+                    data.device,
+                    entry.title,
+                    description,
+                )
+                for description in SENSOR_DESCRIPTIONS
+            ),
+            LD2450BLETargetsSensor(data.coordinator, data.device, entry.title),
+            *(
+                LD2450BLEWindowSensor(
+                    data.coordinator,
+                    data.window,
+                    data.device,
+                    entry.title,
+                    description,
+                )
+                for description in WINDOW_DESCRIPTIONS
+            ),
+        ]
     )
 
 
@@ -234,16 +170,17 @@ class LD2450BLESensor(CoordinatorEntity[LD2450BLECoordinator], SensorEntity):
     """Generic sensor for LD2450BLE."""
 
     _attr_has_entity_name = True
+    entity_description: LD2450BLESensorEntityDescription
 
     def __init__(
         self,
         coordinator: LD2450BLECoordinator,
         device: LD2450BLE,
         name: str,
-        description: SensorEntityDescription,
+        description: LD2450BLESensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, frozenset((TARGET_KEYS[description.target],)))
         self._coordinator = coordinator
         self._device = device
         self._key = description.key
@@ -257,29 +194,233 @@ class LD2450BLESensor(CoordinatorEntity[LD2450BLECoordinator], SensorEntity):
             sw_version=getattr(self._device, "fw_ver"),
         )
         self._attr_native_value = 0
+        # What was last written: value, target presence and availability
+        self._written: tuple[int, bool, bool] | None = None
+        self._written_time = NEVER_TIME
+        self._delayed_write_cancel: CALLBACK_TYPE | None = None
+        self._delayed_write_job = HassJob(
+            self._async_delayed_write, f"LD2450 {name} {self._key} delayed write"
+        )
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        match self._key:
-            case "target_one_distance":
-                self._attr_native_value = int(math.hypot(getattr(self._device, "target_one_x"), getattr(self._device, "target_one_y")))
-            case "target_two_distance":
-                self._attr_native_value = int(math.hypot(getattr(self._device, "target_two_x"), getattr(self._device, "target_two_y")))
-            case "target_three_distance":
-                self._attr_native_value = int(math.hypot(getattr(self._device, "target_three_x"), getattr(self._device, "target_three_y")))
-            case "target_one_angle":
-                self._attr_native_value = int(math.degrees(math.atan2(getattr(self._device, "target_one_x"), getattr(self._device, "target_one_y"))))
-            case "target_two_angle":
-                self._attr_native_value = int(math.degrees(math.atan2(getattr(self._device, "target_two_x"), getattr(self._device, "target_two_y"))))
-            case "target_three_angle":
-                self._attr_native_value = int(math.degrees(math.atan2(getattr(self._device, "target_three_x"), getattr(self._device, "target_three_y"))))
-            case _:
-                #if not in calculated sensors, just get the value from sensor's state
-                self._attr_native_value = getattr(self._device, self._key)
+        description = self.entity_description
+        analytics = self._coordinator.data.analytics
+        value = description.value_fn(analytics, description.target)
+        valid = analytics.valid[description.target]
+        written = self._written
+        available = self.available
+        if (
+            written is not None
+            and written[1:] == (valid, available)
+            and abs(value - written[0]) < max(description.deadband, 1)
+        ):
+            skipped = 1
+            if self._delayed_write_cancel is not None:
+                # Back inside the deadband, the held back value is stale
+                self._delayed_write_cancel()
+                self._delayed_write_cancel = None
+                self._attr_native_value = written[0]
+                skipped += 1
+            self._coordinator.skipped_writes[self._key] += skipped
+            return
+        wait = self._written_time + description.min_interval - time.monotonic()
+        # A target appearing or leaving, or a change of availability, is
+        # never held back
+        if wait > 0 and written is not None and written[1:] == (valid, available):
+            if self._delayed_write_cancel is None:
+                self._delayed_write_cancel = async_call_later(
+                    self.hass, wait, self._delayed_write_job
+                )
+            else:
+                # The held back value is replaced before it was written
+                self._coordinator.skipped_writes[self._key] += 1
+            self._attr_native_value = value
+            return
+        self._attr_native_value = value
+        self._write(valid)
+
+    @callback
+    def _async_delayed_write(self, _now: datetime) -> None:
+        """Write the value held back by the minimum interval."""
+        self._delayed_write_cancel = None
+        description = self.entity_description
+        self._write(self._coordinator.data.analytics.valid[description.target])
+
+    @callback
+    def _write(self, valid: bool) -> None:
+        if self._delayed_write_cancel is not None:
+            self._delayed_write_cancel()
+            self._delayed_write_cancel = None
+        self._written = (self._attr_native_value, valid, self.available)
+        self._written_time = time.monotonic()
+        self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending delayed write."""
+        if self._delayed_write_cancel is not None:
+            self._delayed_write_cancel()
+            self._delayed_write_cancel = None
+        await super().async_will_remove_from_hass()
+
+    @property
+    def available(self) -> bool:
+        """Unavailable if coordinator isn't connected."""
+        return self._coordinator.connected and super().available
+
+
+TARGETS_DESCRIPTION = SensorEntityDescription(
+    key="targets",
+    translation_key="targets",
+    entity_registry_enabled_default=False,
+)
+
+
+class LD2450BLETargetsSensor(CoordinatorEntity[LD2450BLECoordinator], SensorEntity):
+    """All targets in one entity: the count as state, the targets as attribute.
+
+    One state write per update instead of one per target sensor, for radar
+    cards and automations. Each slot of the ``targets`` attribute is
+    [x, y, speed, distance, angle] or None when empty.
+    """
+
+    _attr_has_entity_name = True
+    # The coordinates change on almost every write, keep them out of the recorder
+    _unrecorded_attributes = frozenset({"targets"})
+
+    def __init__(
+        self,
+        coordinator: LD2450BLECoordinator,
+        device: LD2450BLE,
+        name: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, frozenset(TARGET_KEYS))
+        self._coordinator = coordinator
+        self._device = device
+        self.entity_description = TARGETS_DESCRIPTION
+        self._attr_unique_id = f"{name}_{TARGETS_DESCRIPTION.key}"
+        self._attr_device_info = DeviceInfo(
+            name=name,
+            connections={(dr.CONNECTION_BLUETOOTH, device.address)},
+            manufacturer="HiLink",
+            model="LD2450",
+            sw_version=getattr(self._device, "fw_ver"),
+        )
+        self._attr_native_value = 0
+        self._attr_extra_state_attributes = {"targets": [None, None, None]}
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        analytics = self._coordinator.data.analytics
+        distance = analytics.distance
+        angle = analytics.angle
+        self._attr_native_value = analytics.count
+        self._attr_extra_state_attributes = {
+            "targets": [
+                [target.x, target.y, target.speed, distance[index], angle[index]]
+                if target.valid
+                else None
+                for index, target in enumerate(analytics.targets)
+            ]
+        }
+        self.async_write_ha_state()
+
+    @property
+    def available(self) -> bool:
+        """Unavailable if coordinator isn't connected."""
+        return self._coordinator.connected and super().available
+
+
+@dataclass(frozen=True, kw_only=True)
+class LD2450BLEWindowSensorEntityDescription(SensorEntityDescription):
+    """Describes a windowed statistics sensor of one target."""
+
+    target: int
+    quantity: str
+
+
+WINDOW_DESCRIPTIONS = [
+    LD2450BLEWindowSensorEntityDescription(
+        key=f"target_{name}_{quantity}_window",
+        translation_key=f"target_{name}_{quantity}_window",
+        device_class=SensorDeviceClass.DISTANCE if quantity == QUANTITY_DISTANCE else None,
+        entity_registry_enabled_default=False,
+        native_unit_of_measurement=(
+            UnitOfLength.MILLIMETERS if quantity == QUANTITY_DISTANCE else "cm/s"
+        ),
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        target=index,
+        quantity=quantity,
+    )
+    for index, name in enumerate(TARGET_NAMES)
+    for quantity in QUANTITIES
+]
+
+
+class LD2450BLEWindowSensor(CoordinatorEntity[LD2450BLECoordinator], SensorEntity):
+    """Mean of a quantity over a window, with min, max and last as attributes.
+
+    Computed from every decoded frame rather than the rate limited updates,
+    and written once per window, so the recorder and long term statistics
+    get one sound sample per window instead of every update.
+    """
+
+    _attr_has_entity_name = True
+    entity_description: LD2450BLEWindowSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: LD2450BLECoordinator,
+        window: LD2450BLEWindowAggregator,
+        device: LD2450BLE,
+        name: str,
+        description: LD2450BLEWindowSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        # Only availability comes from the coordinator, values from the window
+        super().__init__(coordinator, frozenset())
+        self._coordinator = coordinator
+        self._window = window
+        self._device = device
+        self.entity_description = description
+        self._attr_unique_id = f"{name}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            name=name,
+            connections={(dr.CONNECTION_BLUETOOTH, device.address)},
+            manufacturer="HiLink",
+            model="LD2450",
+            sw_version=getattr(self._device, "fw_ver"),
+        )
+        self._attr_native_value = None
+
+    async def async_added_to_hass(self) -> None:
+        """Start receiving windows, which starts the aggregation if needed."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._window.async_add_listener(self._handle_window_update))
+
+    @callback
+    def _handle_window_update(self) -> None:
+        """Handle a closed window."""
+        description = self.entity_description
+        stats = self._window.stats[description.target, description.quantity]
+        if stats is None:
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = {}
+        else:
+            # Whole mm and cm/s like the frames, as displayed
+            self._attr_native_value = round(stats.mean)
+            self._attr_extra_state_attributes = {
+                "min": stats.minimum,
+                "max": stats.maximum,
+                "last": stats.last,
+            }
         self.async_write_ha_state()
 
     @property
     def available(self) -> bool:
         """Unavailable if coordinator isn't connected."""
-        return self._coordinator.connected and super().available
\ No newline at end of file
+        return self._coordinator.connected and super().available
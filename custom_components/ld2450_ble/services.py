@@ -0,0 +1,154 @@
+"""Services of the LD2450 BLE integration."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+import voluptuous as vol
+
+from .ld2450_ble import BLEAK_EXCEPTIONS, CommandFailedError, CommandTimeoutError, Rect
+
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import DOMAIN
+from .heatmap import WINDOW_DAY, WINDOWS
+from .models import LD2450BLEData
+from .zones import FIELD_MIN_X
+
+SERVICE_SET_AREAS = "set_areas"
+SERVICE_EXPORT_HEATMAP = "export_heatmap"
+
+ATTR_MODE = "mode"
+ATTR_AREAS = ("area_one", "area_two", "area_three")
+ATTR_WINDOW = "window"
+ATTR_RESOLUTION = "resolution"
+ATTR_MIN_SECONDS = "min_seconds"
+
+# Cell sizes in mm that tile the heatmap grid
+RESOLUTIONS = (50, 100, 200, 250, 500, 1000)
+
+# Indexed by the area mode of the sensor
+AREA_MODES = ("disabled", "monitor", "ignore")
+
+# The range of the area sliders
+AREA_MAX_X = 5000
+AREA_MAX_Y = 7300
+_X = vol.All(vol.Coerce(int), vol.Range(min=-AREA_MAX_X, max=AREA_MAX_X))
+_Y = vol.All(vol.Coerce(int), vol.Range(min=0, max=AREA_MAX_Y))
+
+RECT_SCHEMA = vol.Schema(
+    {
+        vol.Required("first_x"): _X,
+        vol.Required("first_y"): _Y,
+        vol.Required("second_x"): _X,
+        vol.Required("second_y"): _Y,
+    }
+)
+
+SET_AREAS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_MODE): vol.In(AREA_MODES),
+        **{vol.Optional(name): RECT_SCHEMA for name in ATTR_AREAS},
+    }
+)
+
+EXPORT_HEATMAP_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_WINDOW, default=WINDOW_DAY): vol.In(list(WINDOWS)),
+        vol.Optional(ATTR_RESOLUTION, default=200): vol.All(
+            vol.Coerce(int), vol.In(RESOLUTIONS)
+        ),
+        vol.Optional(ATTR_MIN_SECONDS, default=1.0): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+    }
+)
+
+
+@callback
+def _async_get_data(hass: HomeAssistant, call: ServiceCall) -> LD2450BLEData:
+    """Return the data of the entry a call is for."""
+    entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+    data: LD2450BLEData | None = hass.data.get(DOMAIN, {}).get(entry_id)
+    if data is None:
+        raise ServiceValidationError(f"LD2450 entry {entry_id} is not loaded")
+    return data
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services."""
+
+    async def async_set_areas(call: ServiceCall) -> None:
+        """Set area mode and rectangles in one write.
+
+        Whatever is left out keeps its current value.
+        """
+        coordinator = _async_get_data(hass, call).coordinator
+        area = coordinator.area
+        if ATTR_MODE in call.data:
+            area = replace(area, mode=AREA_MODES.index(call.data[ATTR_MODE]))
+        for index, name in enumerate(ATTR_AREAS):
+            if name in call.data:
+                area = area.with_rect(index, Rect(**call.data[name]))
+        try:
+            await coordinator.async_set_area(area)
+        except (*BLEAK_EXCEPTIONS, CommandFailedError, CommandTimeoutError) as err:
+            raise HomeAssistantError(f"Failed to set the areas: {err}") from err
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_AREAS, async_set_areas, schema=SET_AREAS_SCHEMA
+    )
+
+    async def async_export_heatmap(call: ServiceCall) -> ServiceResponse:
+        """Return the dwell seconds per cell of a heatmap window.
+
+        ``bounds`` is the rectangle around the cells with at least
+        ``min_seconds`` of dwell time, ready for ``set_areas``.
+        """
+        heatmap = _async_get_data(hass, call).heatmap
+        if heatmap is None:
+            raise ServiceValidationError(
+                "The heatmap is not enabled in the options of this LD2450"
+            )
+        resolution = call.data[ATTR_RESOLUTION]
+        values = await heatmap.async_export(call.data[ATTR_WINDOW], resolution)
+        rows, columns = (values >= call.data[ATTR_MIN_SECONDS]).nonzero()
+        bounds = None
+        if rows.size:
+            bounds = {
+                "first_x": max(-AREA_MAX_X, FIELD_MIN_X + int(columns.min()) * resolution),
+                "first_y": min(AREA_MAX_Y, int(rows.min()) * resolution),
+                "second_x": min(
+                    AREA_MAX_X, FIELD_MIN_X + (int(columns.max()) + 1) * resolution
+                ),
+                "second_y": min(AREA_MAX_Y, (int(rows.max()) + 1) * resolution),
+            }
+        return {
+            "window": call.data[ATTR_WINDOW],
+            "resolution": resolution,
+            "min_x": FIELD_MIN_X,
+            "min_y": 0,
+            "total_seconds": round(float(values.sum()), 1),
+            "bounds": bounds,
+            "cells": values.round(1).tolist(),
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_HEATMAP,
+        async_export_heatmap,
+        schema=EXPORT_HEATMAP_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
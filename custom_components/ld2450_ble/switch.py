@@ -6,6 +6,7 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfLength
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -13,6 +14,8 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import EntityCategory
 
 from . import LD2450BLE, LD2450BLECoordinator
+from .coordinator import TARGET_MODE_KEY
+from .ld2450_ble import BLEAK_EXCEPTIONS, CommandFailedError, CommandTimeoutError
 from .const import DOMAIN
 from .models import LD2450BLEData
 
@@ -45,7 +48,7 @@ class LD2450BLESwitch(CoordinatorEntity[LD2450BLECoordinator], SwitchEntity):
         name: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, frozenset((TARGET_MODE_KEY,)))
         self._coordinator = coordinator
         self._device = device
         self._attr_unique_id = f"{device.name}_target_mode"
@@ -81,7 +84,8 @@ class LD2450BLESwitch(CoordinatorEntity[LD2450BLECoordinator], SwitchEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._attr_native_value = getattr(self._device, "target_mode")
+        config = self._coordinator.data.config
+        self._attr_native_value = config.target_mode
         self.async_write_ha_state()
 
     @property
@@ -99,8 +103,14 @@ class LD2450BLESwitch(CoordinatorEntity[LD2450BLECoordinator], SwitchEntity):
 
     async def async_turn_on(self):
         """Turn on multitarget mode."""
-        await self._device._set_target_mode(2)
+        try:
+            await self._device._set_target_mode(2)
+        except (*BLEAK_EXCEPTIONS, CommandFailedError, CommandTimeoutError) as err:
+            raise HomeAssistantError(f"Failed to enable multi-target mode: {err}") from err
         
     async def async_turn_off(self):
         """Turn off multitarget mode."""
-        await self._device._set_target_mode(1)
\ No newline at end of file
+        try:
+            await self._device._set_target_mode(1)
+        except (*BLEAK_EXCEPTIONS, CommandFailedError, CommandTimeoutError) as err:
+            raise HomeAssistantError(f"Failed to disable multi-target mode: {err}") from err
\ No newline at end of file
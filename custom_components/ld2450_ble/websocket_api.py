@@ -0,0 +1,133 @@
+"""Websocket API streaming live LD2450 targets."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import struct
+from typing import Any
+
+import voluptuous as vol
+
+from .ld2450_ble import POLICY_LATEST_ONLY, FrameStream, Target
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+from .models import LD2450BLEData
+
+# The sensor reports about 10 frames per second
+DEFAULT_MAX_HZ = 10.0
+MAX_MAX_HZ = 20.0
+
+# x, y and speed (int16) and resolution (uint16) of the three targets
+_PACKED_TARGETS = struct.Struct("<" + "hhhH" * 3)
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, ws_subscribe_targets)
+
+
+def _pack(targets: tuple[Target, ...]) -> str:
+    """Encode the targets of a frame as base64 of 3 little endian hhhH."""
+    return base64.b64encode(
+        _PACKED_TARGETS.pack(
+            *(
+                value
+                for target in targets
+                for value in (target.x, target.y, target.speed, target.resolution)
+            )
+        )
+    ).decode("ascii")
+
+
+async def _forward(
+    connection: websocket_api.ActiveConnection,
+    msg_id: int,
+    entry_id: str,
+    stream: FrameStream,
+    interval: float,
+) -> None:
+    """Send the latest frame of a device, at most once per interval.
+
+    Tells the client when the stream ends, e.g. on an entry reload or
+    unload, so it can subscribe again.
+    """
+    async for frame in stream:
+        connection.send_message(
+            websocket_api.event_message(
+                msg_id,
+                {
+                    "entry_id": entry_id,
+                    "ts": round(frame.timestamp, 3),
+                    "targets": _pack(frame.targets),
+                    "coalesced": stream.dropped,
+                },
+            )
+        )
+        # Frames arriving meanwhile collapse into the newest one
+        await asyncio.sleep(interval)
+    connection.send_message(
+        websocket_api.event_message(msg_id, {"entry_id": entry_id, "closed": True})
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "ld2450_ble/subscribe_targets",
+        vol.Optional("entry_ids"): [str],
+        vol.Optional("max_hz", default=DEFAULT_MAX_HZ): vol.All(
+            vol.Coerce(float), vol.Range(min=0.1, max=MAX_MAX_HZ)
+        ),
+    }
+)
+@callback
+def ws_subscribe_targets(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Stream decoded frames of the selected devices, all by default.
+
+    Each event carries the config entry id, the monotonic frame time in
+    seconds and the targets as base64 of three little endian records of
+    int16 x, y and speed and uint16 resolution, 24 bytes in all. Frames
+    are sent at most ``max_hz`` times per second per device; when the
+    client falls behind only the newest frame is kept, ``coalesced``
+    counts the skipped ones. When a device stops streaming, e.g. on an
+    entry reload or unload, a last event ``{"entry_id": ..., "closed":
+    true}`` is sent for it. Entity states are not involved.
+    """
+    entries: dict[str, LD2450BLEData] = hass.data.get(DOMAIN, {})
+    entry_ids = msg.get("entry_ids", list(entries))
+    if missing := [entry_id for entry_id in entry_ids if entry_id not in entries]:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"Unknown entries: {missing}"
+        )
+        return
+
+    interval = 1 / msg["max_hz"]
+    streams: list[FrameStream] = []
+    tasks: list[asyncio.Task[None]] = []
+    for entry_id in entry_ids:
+        stream = entries[entry_id].device.frames(policy=POLICY_LATEST_ONLY)
+        streams.append(stream)
+        tasks.append(
+            hass.async_create_background_task(
+                _forward(connection, msg["id"], entry_id, stream, interval),
+                f"LD2450 websocket targets {entry_id}",
+            )
+        )
+
+    @callback
+    def unsubscribe() -> None:
+        for stream in streams:
+            stream.close()
+        for task in tasks:
+            task.cancel()
+
+    connection.subscriptions[msg["id"]] = unsubscribe
+    connection.send_result(msg["id"])
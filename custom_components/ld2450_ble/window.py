@@ -0,0 +1,153 @@
+"""Windowed statistics over every decoded LD2450 frame."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+
+from .ld2450_ble import (
+    LD2450BLE,
+    POLICY_DROP_OLDEST,
+    TARGET_COUNT,
+    FrameAnalytics,
+    FrameStream,
+)
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+_LOGGER = logging.getLogger(__name__)
+
+WINDOW = timedelta(seconds=10)
+# A window of frames at the sensor's 10 Hz, so a busy loop loses nothing
+FRAME_QUEUE_SIZE = 128
+
+QUANTITY_DISTANCE = "distance"
+QUANTITY_SPEED = "speed"
+QUANTITIES = (QUANTITY_DISTANCE, QUANTITY_SPEED)
+
+
+@dataclass(frozen=True, slots=True)
+class WindowStats:
+    """Statistics of one quantity of one target over a window."""
+
+    minimum: int
+    mean: float
+    maximum: int
+    last: int
+
+
+class _Accumulator:
+    """Running statistics, updated frame by frame in constant time."""
+
+    __slots__ = ("count", "total", "minimum", "maximum", "last")
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.count = 0
+        self.total = 0
+        self.minimum = 0
+        self.maximum = 0
+        self.last = 0
+
+    def add(self, value: int) -> None:
+        if not self.count or value < self.minimum:
+            self.minimum = value
+        if not self.count or value > self.maximum:
+            self.maximum = value
+        self.count += 1
+        self.total += value
+        self.last = value
+
+    def result(self) -> WindowStats | None:
+        if not self.count:
+            return None
+        return WindowStats(self.minimum, self.total / self.count, self.maximum, self.last)
+
+
+class LD2450BLEWindowAggregator:
+    """Aggregate distance and speed of every frame into fixed time windows.
+
+    Frames are only consumed while somebody listens, so nothing is computed
+    unless a window sensor is enabled.
+    """
+
+    def __init__(self, hass: HomeAssistant, device: LD2450BLE) -> None:
+        """Initialise the aggregator."""
+        self.hass = hass
+        self._device = device
+        self._accumulators = {
+            (index, quantity): _Accumulator()
+            for index in range(TARGET_COUNT)
+            for quantity in QUANTITIES
+        }
+        self.stats: dict[tuple[int, str], WindowStats | None] = dict.fromkeys(
+            self._accumulators
+        )
+        self._listeners: list[CALLBACK_TYPE] = []
+        self._stream: FrameStream | None = None
+        self._cancel_interval: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for window results; the first listener starts aggregating."""
+        self._listeners.append(update_callback)
+        if len(self._listeners) == 1:
+            self._async_start()
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+            if not self._listeners:
+                self.async_stop()
+
+        return remove_listener
+
+    @callback
+    def _async_start(self) -> None:
+        self._stream = self._device.frames(FRAME_QUEUE_SIZE, POLICY_DROP_OLDEST)
+        self.hass.async_create_background_task(
+            self._consume(self._stream), f"LD2450 {self._device.address} window stats"
+        )
+        self._cancel_interval = async_track_time_interval(
+            self.hass, self._async_publish, WINDOW
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop consuming frames and forget the current window."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        if self._cancel_interval is not None:
+            self._cancel_interval()
+            self._cancel_interval = None
+        for accumulator in self._accumulators.values():
+            accumulator.reset()
+
+    async def _consume(self, stream: FrameStream) -> None:
+        """Feed every frame into the running statistics."""
+        accumulators = self._accumulators
+        async for frame in stream:
+            if stream.closed:
+                # Stopped; the queued frames belong to a forgotten window
+                break
+            analytics = FrameAnalytics(frame.targets)
+            for index, (valid, target) in enumerate(zip(analytics.valid, frame.targets)):
+                if valid:
+                    accumulators[index, QUANTITY_DISTANCE].add(analytics.distance[index])
+                    accumulators[index, QUANTITY_SPEED].add(target.speed)
+        if stream.dropped:
+            _LOGGER.debug("Window statistics missed %s frames", stream.dropped)
+
+    @callback
+    def _async_publish(self, _now: datetime) -> None:
+        """Close the window and hand the results to the listeners."""
+        for key, accumulator in self._accumulators.items():
+            self.stats[key] = accumulator.result()
+            accumulator.reset()
+        for update_callback in list(self._listeners):
+            update_callback()
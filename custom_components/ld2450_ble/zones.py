@@ -0,0 +1,207 @@
+"""Named polygon zones evaluated against the targets of every frame."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+import math
+from typing import Any
+
+import voluptuous as vol
+
+from .ld2450_ble import LD2450BLE, ConfigChanged, StateChanged, Target
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.util import slugify
+
+CONF_ZONES = "zones"
+CONF_NAME = "name"
+CONF_POINTS = "points"
+
+# The lookup grid covers the field of view of the sensor in 50 mm cells
+CELL_SIZE = 50
+FIELD_MIN_X = -6000
+FIELD_MAX_X = 6000
+FIELD_MAX_Y = 8000
+COLUMNS = (FIELD_MAX_X - FIELD_MIN_X) // CELL_SIZE
+ROWS = FIELD_MAX_Y // CELL_SIZE
+
+ZONE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NAME): vol.All(str, vol.Length(min=1)),
+        vol.Required(CONF_POINTS): vol.All(
+            [vol.ExactSequence([vol.Coerce(int), vol.Coerce(int)])],
+            vol.Length(min=3),
+        ),
+    }
+)
+
+# Targets only move zones when their position changes
+ZONE_FIELDS = ("x", "y")
+
+
+@dataclass(frozen=True, slots=True)
+class Zone:
+    """A named polygon in sensor coordinates, vertices in mm."""
+
+    zone_id: str
+    name: str
+    points: tuple[tuple[int, int], ...]
+
+
+def validate_zones(value: Any) -> list[dict[str, Any]]:
+    """Validate zones entered in the options, names must differ."""
+    zones = vol.Schema([ZONE_SCHEMA])(value)
+    zone_ids = [slugify(zone[CONF_NAME]) for zone in zones]
+    if len(set(zone_ids)) != len(zone_ids):
+        raise vol.Invalid("Zone names must be unique")
+    return [
+        {CONF_NAME: zone[CONF_NAME], CONF_POINTS: [list(point) for point in zone[CONF_POINTS]]}
+        for zone in zones
+    ]
+
+
+def zones_from_options(options: Iterable[dict[str, Any]]) -> tuple[Zone, ...]:
+    """Build the zones stored in the options of a config entry."""
+    return tuple(
+        Zone(
+            slugify(option[CONF_NAME]),
+            option[CONF_NAME],
+            tuple((int(x), int(y)) for x, y in option[CONF_POINTS]),
+        )
+        for option in options
+    )
+
+
+class ZoneGrid:
+    """Zones rasterized into a grid whose cells hold a bit per covering zone.
+
+    A cell belongs to a zone when its center is inside the polygon, so a
+    position is classified against every zone with one lookup. Positions
+    outside the grid are in no zone.
+    """
+
+    __slots__ = ("zones", "_cells")
+
+    def __init__(self, zones: Sequence[Zone]) -> None:
+        """Compile the zones."""
+        self.zones = tuple(zones)
+        self._cells = [0] * (COLUMNS * ROWS)
+        for bit, zone in enumerate(self.zones):
+            _fill(self._cells, zone.points, 1 << bit)
+
+    def lookup(self, x: int, y: int) -> int:
+        """Return the bits of the zones containing a position."""
+        column = (x - FIELD_MIN_X) // CELL_SIZE
+        row = y // CELL_SIZE
+        if 0 <= column < COLUMNS and 0 <= row < ROWS:
+            return self._cells[row * COLUMNS + column]
+        return 0
+
+    def masks(self, targets: Iterable[Target]) -> tuple[int, ...]:
+        """Return the zone bits of each target slot, 0 for empty slots."""
+        return tuple(
+            self.lookup(target.x, target.y) if target.valid else 0
+            for target in targets
+        )
+
+    def counts(self, masks: Iterable[int]) -> list[int]:
+        """Return how many targets each zone holds."""
+        counts = [0] * len(self.zones)
+        for mask in masks:
+            while mask:
+                lowest = mask & -mask
+                counts[lowest.bit_length() - 1] += 1
+                mask ^= lowest
+        return counts
+
+
+def _fill(cells: list[int], points: Sequence[tuple[int, int]], bit: int) -> None:
+    """Set a bit in the cells whose centers are inside a polygon.
+
+    Each row is scanned once: the edges crossing the row center are
+    intersected and the cells between pairs of crossings filled, so
+    overlapping and concave polygons follow the even-odd rule.
+    """
+    edges = list(zip(points, (*points[1:], points[0])))
+    low = max(0, math.floor(min(y for _, y in points) / CELL_SIZE))
+    high = min(ROWS, math.ceil(max(y for _, y in points) / CELL_SIZE))
+    for row in range(low, high):
+        center_y = (row + 0.5) * CELL_SIZE
+        crossings = sorted(
+            x1 + (center_y - y1) * (x2 - x1) / (y2 - y1)
+            for (x1, y1), (x2, y2) in edges
+            if (y1 <= center_y < y2) or (y2 <= center_y < y1)
+        )
+        base = row * COLUMNS
+        for start, end in zip(crossings[::2], crossings[1::2]):
+            first = max(0, math.ceil((start - FIELD_MIN_X) / CELL_SIZE - 0.5))
+            last = min(COLUMNS, math.ceil((end - FIELD_MIN_X) / CELL_SIZE - 0.5))
+            for index in range(base + first, base + last):
+                cells[index] |= bit
+
+
+class LD2450BLEZoneTracker:
+    """Count the targets in each zone of a device, frame by frame.
+
+    Frames are only looked at while somebody listens, and a frame whose
+    targets stay in the same cells' zones costs three lookups.
+    """
+
+    def __init__(self, device: LD2450BLE, zones: Sequence[Zone]) -> None:
+        """Initialise the tracker."""
+        self._device = device
+        self.grid = ZoneGrid(zones)
+        self.counts = [0] * len(self.grid.zones)
+        self._masks: tuple[int, ...] = ()
+        self._listeners: dict[int, list[CALLBACK_TYPE]] = {}
+        self._unsubscribe: CALLBACK_TYPE | None = None
+
+    @property
+    def zones(self) -> tuple[Zone, ...]:
+        return self.grid.zones
+
+    @callback
+    def async_add_listener(self, index: int, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for count changes of one zone, returning a remove callback."""
+        if self._unsubscribe is None:
+            self._masks = self.grid.masks(self._device.targets)
+            self.counts = self.grid.counts(self._masks)
+            self._unsubscribe = self._device.subscribe(
+                self._async_handle_update, fields=ZONE_FIELDS
+            )
+        self._listeners.setdefault(index, []).append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners[index].remove(update_callback)
+            if not any(self._listeners.values()):
+                self.async_stop()
+
+        return remove_listener
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following the frames."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    @callback
+    def _async_handle_update(self, event: StateChanged | ConfigChanged) -> None:
+        """Recount the zones when a target moved to another zone."""
+        if not isinstance(event, StateChanged):
+            return
+        masks = self.grid.masks(event.targets)
+        if masks == self._masks:
+            return
+        changed = 0
+        for old, new in zip(self._masks, masks):
+            changed |= old ^ new
+        self._masks = masks
+        self.counts = self.grid.counts(masks)
+        while changed:
+            lowest = changed & -changed
+            changed ^= lowest
+            for update_callback in self._listeners.get(lowest.bit_length() - 1, ()):
+                update_callback()